@@ -1,15 +1,33 @@
 # app/api/v1/certificates.py
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 # Import Pydantic model and service factory
 from app.data_models.employee_certificate import EmployeeCertificate
-from app.api.cert_tracker_cache import get_service
+from app.data_models.expiry_summary import ExpirySummary
+from app.data_models.enriched_certificate import EnrichedCertificate
+from app.data_processor.cert_tracker_service import ExpiryGrouping
+from app.api.cert_tracker_cache import get_response_cache, get_service
+from app.api.conditional import is_not_modified, make_etag, validator_headers
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.response_cache import CachedResponse, ResponseCache
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MAX_PAGE_SIZE = 10_000
+
+_certificate_list = TypeAdapter(List[EmployeeCertificate])
+_enriched_list = TypeAdapter(List[EnrichedCertificate])
 
 # Define the router
 router = APIRouter()
 
+def _ndjson_lines(certs: Iterable[EmployeeCertificate]) -> Iterator[str]:
+    for cert in certs:
+        yield cert.model_dump_json() + "\n"
+
 @router.get(
     "/certificates/expiring",
     response_model=List[EmployeeCertificate],
@@ -17,11 +35,151 @@ router = APIRouter()
 )
 
 def list_expiring(
+    request: Request,
+    start: date = Query(..., description="Start of date range"),
+    end: date = Query(..., description="End of date range"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables pagination"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    service = Depends(get_service),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
+    """List certificates expiring between start and end dates, sorted by expiry date.
+
+    With `limit`, results are paginated and the next page's cursor is returned in
+    the `X-Next-Cursor` header. Send `Accept: application/x-ndjson` to stream
+    rows as newline-delimited JSON instead of a single array. Responses carry an
+    `ETag` tied to the dataset version and honour `If-None-Match`.
+    """
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+    ndjson = NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+    query = ("expiring", start, end, limit, cursor, ndjson)
+    etag = make_etag(service.version, query)
+    headers = validator_headers(etag, service.last_modified)
+    if is_not_modified(request, etag, service.last_modified):
+        return Response(status_code=304, headers=headers)
+
+    if ndjson:
+        rows: Iterable[EmployeeCertificate]
+        if limit is None:
+            rows = service.iter_expiring_certificates(start, end, after)
+        else:
+            rows, next_key = service.page_expiring_certificates(start, end, limit, after)
+            if next_key is not None:
+                headers["X-Next-Cursor"] = encode_cursor(next_key)
+        return StreamingResponse(_ndjson_lines(rows), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+    cached = cache.get(query, service.version)
+    if cached is None:
+        if limit is None and after is None:
+            certs, next_key = service.get_expiring_certificates(start, end), None
+        else:
+            certs, next_key = service.page_expiring_certificates(start, end, limit or MAX_PAGE_SIZE, after)
+        extra = {"X-Next-Cursor": encode_cursor(next_key)} if next_key is not None else {}
+        cached = CachedResponse(_certificate_list.dump_json(certs), extra)
+        cache.put(query, service.version, cached)
+    return Response(cached.body, media_type="application/json", headers={**headers, **cached.headers})
+
+@router.get(
+    "/certificates/expiring/enriched",
+    response_model=List[EnrichedCertificate],
+    tags=["Certificates"]
+)
+
+def list_expiring_enriched(
+    request: Request,
     start: date = Query(..., description="Start of date range"),
     end: date = Query(..., description="End of date range"),
-    service = Depends(get_service)
-) -> List[EmployeeCertificate]:
-    """List certificates expiring between start and end dates."""
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables pagination"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    service = Depends(get_service),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
+    """List expiring certificates with each employee's name, email, company and department and the course name.
+
+    Same ordering, pagination cursors and caching as `/certificates/expiring`;
+    the join is precomputed when the data is loaded.
+    """
     if start > end:
         raise HTTPException(status_code=400, detail="start must be before end")
-    return service.get_expiring_certificates(start, end)
\ No newline at end of file
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+    query = ("expiring_enriched", start, end, limit, cursor)
+    etag = make_etag(service.version, query)
+    headers = validator_headers(etag, service.last_modified)
+    if is_not_modified(request, etag, service.last_modified):
+        return Response(status_code=304, headers=headers)
+
+    cached = cache.get(query, service.version)
+    if cached is None:
+        certs, next_key = service.page_enriched_expiring_certificates(start, end, limit, after)
+        extra = {"X-Next-Cursor": encode_cursor(next_key)} if next_key is not None else {}
+        cached = CachedResponse(_enriched_list.dump_json(certs), extra)
+        cache.put(query, service.version, cached)
+    return Response(cached.body, media_type="application/json", headers={**headers, **cached.headers})
+
+@router.get(
+    "/companies/{company_name}/certificates/expiring",
+    response_model=List[EmployeeCertificate],
+    tags=["Certificates"]
+)
+
+def list_company_expiring(
+    request: Request,
+    company_name: str,
+    start: Optional[date] = Query(None, description="Start of date range (open if omitted)"),
+    end: Optional[date] = Query(None, description="End of date range (open if omitted)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables pagination"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    service = Depends(get_service),
+) -> Response:
+    """List one company's certificates expiring between start and end, read from that company's partition only."""
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    if not service.has_company(company_name):
+        raise HTTPException(status_code=404, detail="company not found")
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+    query = ("company_expiring", company_name.casefold(), start, end, limit, cursor)
+    etag = make_etag(service.version, query)
+    headers = validator_headers(etag, service.last_modified)
+    if is_not_modified(request, etag, service.last_modified):
+        return Response(status_code=304, headers=headers)
+    certs, next_key = service.page_company_expiring_certificates(company_name, start, end, limit, after)
+    if next_key is not None:
+        headers["X-Next-Cursor"] = encode_cursor(next_key)
+    return Response(_certificate_list.dump_json(certs), media_type="application/json", headers=headers)
+
+@router.get(
+    "/certificates/expiring/summary",
+    response_model=ExpirySummary,
+    tags=["Certificates"]
+)
+
+def summarize_expiring(
+    request: Request,
+    start: Optional[date] = Query(None, description="Start of date range (open if omitted)"),
+    end: Optional[date] = Query(None, description="End of date range (open if omitted)"),
+    group_by: List[ExpiryGrouping] = Query(["course_id", "company", "month"], description="Groupings to include"),
+    service = Depends(get_service),
+) -> Response:
+    """Count certificates expiring between start and end, grouped by course_id, company and expiry month (YYYY-MM)."""
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    query = ("summary", start, end, tuple(sorted(set(group_by))))
+    etag = make_etag(service.version, query)
+    headers = validator_headers(etag, service.last_modified)
+    if is_not_modified(request, etag, service.last_modified):
+        return Response(status_code=304, headers=headers)
+    summary = service.get_expiry_summary(start, end, group_by)
+    return Response(summary.model_dump_json(exclude_none=True), media_type="application/json", headers=headers)
@@ -1,33 +1,114 @@
+import os
 from pathlib import Path
 from functools import lru_cache
-from fastapi import FastAPI, Depends
+from typing import Any, Optional, Union
+from fastapi import FastAPI
 
 from app.data_models.course import Course
-from app.data_models.employee import Employee
+from app.api.response_cache import ResponseCache
+from app.data_accessor.chunk_validation import ChunkValidator, ParallelLoad
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.snapshot import SnapshotCache
 from app.data_accessor.course_handler import CourseHandler
 from app.data_accessor.employee_handler import EmployeeHandler
-from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.reloadable_dataset import ReloadableDataset
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_processor.sqlite_registry import SqliteRegistry
+from app.data_processor.reminder_scheduler import ReminderScheduler
+from app.data_processor.dataset_registry import DatasetRegistry, ServiceRegistry
+from app.data_processor.sqlite_cert_tracker_service import SqliteCertTrackerService
+from app.data_accessor.sqlite import employee_handler as sqlite_employee
+from app.data_accessor.sqlite import course_handler as sqlite_course
+from app.data_accessor.sqlite import employee_certificate_handler as sqlite_employee_cert
 from app.data_processor.cert_tracker_service import CertTrackerService
 from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
 
 app = FastAPI(title="Certificate Manager")
 
+DATA_DIR = Path(os.getenv("CERT_TRACKER_DATA_DIR", "data"))
+
+def get_backend() -> str:
+    # "csv" (default) loads the CSV files into memory; "sqlite" queries a
+    # database created by `python -m app.data_accessor.sqlite.importer`
+    return os.getenv("CERT_TRACKER_BACKEND", "csv")
+
 @lru_cache()
-def get_employee_repo():
-    return EmployeeHandler(Path("data/employees.csv"), Employee)
+def get_sqlite_database() -> SqliteDatabase:
+    return SqliteDatabase(Path(os.getenv("CERT_TRACKER_SQLITE_PATH", str(DATA_DIR / "cert_tracker.db"))))
 
 @lru_cache()
-def get_course_repo():
-    return CourseHandler(Path("data/courses.csv"), Course)
+def get_snapshot_cache() -> Optional[SnapshotCache]:
+    # Set CERT_TRACKER_SNAPSHOT_DIR to an empty string to disable snapshots
+    directory = os.getenv("CERT_TRACKER_SNAPSHOT_DIR", str(DATA_DIR / ".snapshots"))
+    # Skip re-validating snapshot rows; only for snapshot dirs nobody else writes to
+    trusted = os.getenv("CERT_TRACKER_SNAPSHOT_TRUSTED", "0") == "1"
+    return SnapshotCache(Path(directory), trusted) if directory else None
 
 @lru_cache()
-def get_employee_cert_repo():
-    return EmployeeCertificateHandler(Path("data/employee_certs.csv"), EmployeeCertificate)
+def get_registry() -> ServiceRegistry[Any]:
+    registry: ServiceRegistry[Any]
+    if get_backend() == "sqlite":
+        registry = SqliteRegistry(get_sqlite_database())
+    else:
+        registry = get_dataset_registry()
+    # Certificates merged after their reminder day are queued for the next tick
+    registry.on_certificates_added(get_reminder_scheduler().enqueue)
+    return registry
+
+@lru_cache()
+def get_parallel_load() -> Optional[ParallelLoad]:
+    # Worker processes for parsing CSVs of at least CERT_TRACKER_PARALLEL_MIN_BYTES; 1 keeps loads in-process
+    workers = int(os.getenv("CERT_TRACKER_LOAD_WORKERS", str(os.cpu_count() or 1)))
+    min_bytes = int(os.getenv("CERT_TRACKER_PARALLEL_MIN_BYTES", str(ParallelLoad.min_bytes)))
+    return ParallelLoad(workers, min_bytes) if workers > 1 else None
+
+@lru_cache()
+def get_dataset_registry() -> DatasetRegistry:
+    snapshots = get_snapshot_cache()
+    parallel = get_parallel_load()
+    employee_certs = DATA_DIR / "employee_certs.csv"
+    courses = DATA_DIR / "courses.csv"
+    employees = DATA_DIR / "employees.csv"
+    return DatasetRegistry(
+        ReloadableDataset(employee_certs, lambda: EmployeeCertificateHandler(employee_certs, snapshots, parallel)),
+        ReloadableDataset(courses, lambda: CourseHandler(courses, Course, snapshots, parallel)),
+        ReloadableDataset(employees, lambda: EmployeeHandler(employees, snapshots, parallel)),
+        max_indexed_rows=int(os.getenv("CERT_TRACKER_MAX_INDEXED_ROWS", "1000000")),
+    )
+
+def get_reload_interval() -> float:
+    # Seconds between file change checks; 0 disables background reloading
+    return float(os.getenv("CERT_TRACKER_RELOAD_INTERVAL", "30"))
 
 @lru_cache()
-def get_service(
-    emp_cert_repo=Depends(get_employee_cert_repo),
-    course_repo=Depends(get_course_repo),
-    emp_repo=Depends(get_employee_repo),
-):
-    return CertTrackerService(emp_cert_repo, course_repo, emp_repo)
+def get_upload_validator() -> ChunkValidator[EmployeeCertificate]:
+    # Worker processes validating uploaded CSV chunks; 1 validates in-process
+    workers = os.getenv("CERT_TRACKER_UPLOAD_WORKERS")
+    return ChunkValidator(EmployeeCertificate, int(workers) if workers else None)
+
+@lru_cache()
+def get_reminder_scheduler() -> ReminderScheduler:
+    cursor = Path(os.getenv("CERT_TRACKER_REMINDER_CURSOR", str(DATA_DIR / ".reminders.json")))
+    return ReminderScheduler(get_service, cursor)
+
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    return ResponseCache(maxsize=int(os.getenv("CERT_TRACKER_RESPONSE_CACHE_SIZE", "128")))
+
+def get_employee_repo() -> Union[EmployeeHandler, sqlite_employee.EmployeeHandler]:
+    if get_backend() == "sqlite":
+        return sqlite_employee.EmployeeHandler(get_sqlite_database())
+    return get_dataset_registry().employees.current()
+
+def get_course_repo() -> Union[CourseHandler, sqlite_course.CourseHandler]:
+    if get_backend() == "sqlite":
+        return sqlite_course.CourseHandler(get_sqlite_database())
+    return get_dataset_registry().courses.current()
+
+def get_employee_cert_repo() -> Union[EmployeeCertificateHandler, sqlite_employee_cert.EmployeeCertificateHandler]:
+    if get_backend() == "sqlite":
+        return sqlite_employee_cert.EmployeeCertificateHandler(get_sqlite_database())
+    return get_dataset_registry().employee_certs.current()
+
+def get_service() -> Union[CertTrackerService, SqliteCertTrackerService]:
+    return get_registry().service()
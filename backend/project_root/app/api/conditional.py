@@ -0,0 +1,37 @@
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Hashable, Optional
+
+from fastapi import Request
+
+
+def make_etag(version: str, query: Hashable) -> str:
+    """Strong ETag for one query against one dataset version."""
+    digest = hashlib.sha1(repr(query).encode()).hexdigest()[:12]
+    return f'"{version}-{digest}"'
+
+
+def validator_headers(etag: str, last_modified: datetime) -> Dict[str, str]:
+    return {"ETag": etag, "Last-Modified": format_datetime(last_modified, usegmt=True)}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    return "*" in candidates or etag in (tag.removeprefix("W/") for tag in candidates)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """True when the client's cached copy is still current (RFC 9110 section 13.2.2)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since: Optional[datetime] = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return since is not None and since.tzinfo is not None and last_modified <= since
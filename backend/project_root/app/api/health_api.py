@@ -0,0 +1,19 @@
+from typing import Any
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from app.api.cert_tracker_cache import get_registry
+from app.data_processor.dataset_registry import ServiceRegistry
+
+router = APIRouter()
+
+@router.get("/health", tags=["Health"])
+def health() -> dict:
+    """Liveness: the process is up and serving requests."""
+    return {"status": "ok"}
+
+@router.get("/ready", tags=["Health"])
+def ready(registry: ServiceRegistry[Any] = Depends(get_registry)) -> JSONResponse:
+    """Readiness: 200 once the datasets and service are loaded, 503 before. Includes per-step timings and errors."""
+    status = registry.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends
+
+from app.data_models.batch_lookup import BatchLookupRequest, BatchLookupResponse
+from app.api.cert_tracker_cache import get_course_repo, get_employee_repo
+
+router = APIRouter()
+
+@router.post(
+    "/lookup",
+    response_model=BatchLookupResponse,
+    tags=["Lookup"]
+)
+
+def batch_lookup(
+    body: BatchLookupRequest,
+    employee_repo = Depends(get_employee_repo),
+    course_repo = Depends(get_course_repo),
+) -> BatchLookupResponse:
+    """Resolve up to 1000 employee ids and 1000 course ids in one round trip.
+
+    Duplicate ids are resolved once; ids that match nothing are listed under
+    `missing_employee_ids` / `missing_course_ids` instead of failing the request.
+    """
+    employees = employee_repo.get_by_ids(body.employee_ids) if body.employee_ids else {}
+    courses = course_repo.get_by_ids(body.course_ids) if body.course_ids else {}
+    return BatchLookupResponse(
+        employees=list(employees.values()),
+        courses=list(courses.values()),
+        missing_employee_ids=[i for i in dict.fromkeys(body.employee_ids) if i not in employees],
+        missing_course_ids=[i for i in dict.fromkeys(body.course_ids) if i not in courses],
+    )
@@ -0,0 +1,23 @@
+import json
+import base64
+import binascii
+from datetime import date
+
+from app.data_accessor.indexes.expiry_index import SortKey
+
+
+def encode_cursor(key: SortKey) -> str:
+    """Encode an (expiry_date, employee_id, course_id, row_id) sort key as an opaque URL-safe token."""
+    expiry_date, employee_id, course_id, row_id = key
+    raw = json.dumps([expiry_date.isoformat(), employee_id, course_id, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """Inverse of encode_cursor; raises ValueError for tokens it did not produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        expiry_date, employee_id, course_id, row_id = json.loads(raw)
+        return (date.fromisoformat(expiry_date), int(employee_id), str(course_id), int(row_id))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc
@@ -0,0 +1,43 @@
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.data_models.reminder import Reminder
+from app.api.cert_tracker_cache import get_reminder_scheduler
+from app.data_processor.reminder_scheduler import ReminderScheduler
+
+router = APIRouter()
+
+@router.get(
+    "/reminders/due",
+    response_model=List[Reminder],
+    tags=["Reminders"]
+)
+
+def preview_reminders(
+    today: Optional[date] = Query(None, description="Day to preview (default: today)"),
+    scheduler: ReminderScheduler = Depends(get_reminder_scheduler),
+) -> List[Reminder]:
+    """Reminders the next tick would emit, without advancing the cursor."""
+    return scheduler.due(today or date.today())
+
+@router.post(
+    "/reminders/tick",
+    response_model=List[Reminder],
+    tags=["Reminders"]
+)
+
+def tick_reminders(
+    today: Optional[date] = Query(None, description="Day to run for (default: today)"),
+    scheduler: ReminderScheduler = Depends(get_reminder_scheduler),
+) -> List[Reminder]:
+    """Certificates that crossed 90/60/30/0 days before expiry since the last tick; advances the cursor.
+
+    Meant to be called once a day by the reminder cron. Each crossing is
+    returned by exactly one tick, including after restarts. today may be in
+    the past (to re-run a missed day) but not in the future, which would
+    move the cursor past reminders that are not yet due.
+    """
+    if today is not None and today > date.today():
+        raise HTTPException(status_code=400, detail="today must not be in the future")
+    return scheduler.tick(today)
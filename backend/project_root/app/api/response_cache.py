@@ -0,0 +1,49 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class ResponseCache:
+    """
+    Small thread-safe LRU of serialized response bodies keyed by (query, dataset version).
+
+    Bodies larger than max_entry_bytes are never stored, so the cache holds at
+    most maxsize * max_entry_bytes bytes. Entries for old dataset versions are
+    simply never hit again and age out.
+    """
+    def __init__(self, maxsize: int = 128, max_entry_bytes: int = 1 << 20):
+        self.maxsize = maxsize
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[Tuple[Hashable, str], CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, query: Hashable, version: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get((query, version))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((query, version))
+            self.hits += 1
+            return entry
+
+    def put(self, query: Hashable, version: str, response: CachedResponse) -> None:
+        if self.maxsize <= 0 or len(response.body) > self.max_entry_bytes:
+            return
+        with self._lock:
+            self._entries[(query, version)] = response
+            self._entries.move_to_end((query, version))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,30 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query
+
+from app.api.cert_tracker_cache import get_service
+from app.data_models.search_result import SearchKind, SearchResult
+from app.data_processor.name_search import SEARCH_KINDS
+
+MAX_SEARCH_RESULTS = 50
+
+router = APIRouter()
+
+@router.get(
+    "/search",
+    response_model=List[SearchResult],
+    tags=["Search"]
+)
+
+def search_names(
+    q: str = Query(..., min_length=1, max_length=200, description="Text typed so far"),
+    kind: List[SearchKind] = Query(list(SEARCH_KINDS), description="Kinds of names to search"),
+    limit: int = Query(10, ge=1, le=MAX_SEARCH_RESULTS, description="Number of results"),
+    service = Depends(get_service),
+) -> List[SearchResult]:
+    """Type-ahead search over employee, company, course and certificate names, best matches first.
+
+    Names starting with `q` rank highest, then names with a later word starting
+    with `q`; when those are fewer than `limit`, similar spellings (trigram
+    matches) fill the rest. Matching ignores case and extra whitespace.
+    """
+    return service.search_names(q, kind, limit)
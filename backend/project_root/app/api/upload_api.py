@@ -0,0 +1,59 @@
+from typing import Any, Iterator, List
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+
+from app.data_models.upload_report import UploadReport, UploadRowError
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_processor.dataset_registry import ServiceRegistry
+from app.api.cert_tracker_cache import get_registry, get_upload_validator
+from app.data_accessor.chunk_validation import ChunkValidator, iter_csv_chunks, read_header
+
+# Data lines per validation chunk
+UPLOAD_CHUNK_ROWS = 20_000
+# Rejected rows listed individually in the report
+MAX_REPORTED_ERRORS = 1_000
+
+router = APIRouter()
+
+@router.post(
+    "/certificates/upload",
+    response_model=UploadReport,
+    tags=["Certificates"]
+)
+
+def upload_certificates(
+    file: UploadFile = File(..., description="CSV with the employee_certs.csv columns"),
+    registry: ServiceRegistry[Any] = Depends(get_registry),
+    validator: ChunkValidator[EmployeeCertificate] = Depends(get_upload_validator),
+) -> UploadReport:
+    """Validate an uploaded certificate CSV and merge the valid rows into the live dataset.
+
+    The upload is read in chunks that are validated in a process pool, and
+    each chunk's accepted rows are staged (to a file or temporary table)
+    before the next chunk is read, so memory stays bounded whatever the
+    upload size. The staged rows are merged in one swap at the end, so an
+    upload that fails part-way changes nothing. Rows already on file (same employee_id, course_id and issue_date) are
+    counted as duplicates and skipped, so re-uploading a file is harmless.
+    Invalid rows are skipped and listed (up to MAX_REPORTED_ERRORS) with
+    their line number.
+    """
+    header = read_header(file.file)
+    missing = [name for name in EmployeeCertificate.model_fields if name not in header]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"missing columns: {', '.join(missing)}")
+
+    report = UploadReport()
+
+    def accepted() -> Iterator[List[EmployeeCertificate]]:
+        for result in validator.validate(iter_csv_chunks(file.file, header, UPLOAD_CHUNK_ROWS)):
+            report.rows += result.rows
+            report.accepted += len(result.items)
+            report.rejected += len(result.errors)
+            room = MAX_REPORTED_ERRORS - len(report.errors)
+            report.errors.extend(UploadRowError(line=e.line, message=e.message) for e in result.errors[:room])
+            yield result.items
+
+    appended = registry.append_certificate_batches(accepted())
+    report.duplicates = report.accepted - appended
+    report.errors_truncated = report.rejected > len(report.errors)
+    report.version = registry.service().version
+    return report
@@ -0,0 +1,147 @@
+import sys
+
+from datetime import date
+from typing import Any, Dict, Optional, Protocol, Union
+
+from app.data_models.course import Course
+from app.data_models.employee import Employee
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_models.enriched_certificate import EnrichedCertificate
+
+# One shared object per distinct employee id and date among the records of a
+# load; a dataset has far fewer of those than rows, so the pool stays small.
+# Owned by whoever loads the records, so it is freed with them.
+ValuePool = Dict[Any, Any]
+
+
+class CertificateLike(Protocol):
+    @property
+    def employee_id(self) -> int: ...
+    @property
+    def course_id(self) -> str: ...
+    @property
+    def expiry_date(self) -> date: ...
+    @property
+    def row_id(self) -> int: ...
+
+
+class CertificateRecord:
+    """
+    Compact in-memory form of an EmployeeCertificate used by the handler caches and indexes.
+
+    A slotted object instead of a Pydantic model (no per-row __dict__ or
+    fields-set), with course ids and certificate names interned and employee
+    ids and dates shared, so repeated values are stored once per dataset
+    rather than once per row (within the ValuePool passed in by the loader).
+    Models are built from records only for the rows a query returns.
+
+    row_id is the record's 0-based position in load order (the file, then
+    appended rows). It is not a model field; it makes the pagination sort key
+    unique when certificates are duplicated.
+    """
+    __slots__ = ("employee_id", "course_id", "certificate_name", "issue_date", "expiry_date", "row_id")
+    _fields = ("employee_id", "course_id", "certificate_name", "issue_date", "expiry_date")
+
+    employee_id: int
+    course_id: str
+    certificate_name: str
+    issue_date: date
+    expiry_date: date
+    row_id: int
+
+    def __init__(
+        self,
+        employee_id: int,
+        course_id: str,
+        certificate_name: str,
+        issue_date: date,
+        expiry_date: date,
+        row_id: int,
+        pool: Optional[ValuePool] = None,
+    ):
+        if pool is not None:
+            employee_id = pool.setdefault(employee_id, employee_id)
+            issue_date = pool.setdefault(issue_date, issue_date)
+            expiry_date = pool.setdefault(expiry_date, expiry_date)
+        self.employee_id = employee_id
+        self.course_id = sys.intern(course_id)
+        self.certificate_name = sys.intern(certificate_name)
+        self.issue_date = issue_date
+        self.expiry_date = expiry_date
+        self.row_id = row_id
+
+    @classmethod
+    def of(
+        cls, cert: Union[EmployeeCertificate, "CertificateRecord"], row_id: int, pool: Optional[ValuePool] = None,
+    ) -> "CertificateRecord":
+        """A record for cert at position row_id, sharing values through pool; records already at that position are returned as is."""
+        if isinstance(cert, CertificateRecord) and cert.row_id == row_id:
+            return cert
+        return cls(cert.employee_id, cert.course_id, cert.certificate_name, cert.issue_date, cert.expiry_date, row_id, pool)
+
+    def to_model(self) -> EmployeeCertificate:
+        # The record was built from a validated model
+        return EmployeeCertificate.model_construct(
+            employee_id=self.employee_id,
+            course_id=self.course_id,
+            certificate_name=self.certificate_name,
+            issue_date=self.issue_date,
+            expiry_date=self.expiry_date,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CertificateRecord):
+            return NotImplemented
+        # Same certificate, wherever it was loaded
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"CertificateRecord({fields})"
+
+
+class EnrichedRecord:
+    """
+    A certificate record joined with its employee and course.
+
+    Holds references to the shared objects rather than copies of their
+    fields; EnrichedCertificate models are built only for returned rows.
+    """
+    __slots__ = ("certificate", "employee", "course")
+
+    def __init__(self, certificate: CertificateRecord, employee: Optional[Employee], course: Optional[Course]):
+        self.certificate = certificate
+        self.employee = employee
+        self.course = course
+
+    @property
+    def employee_id(self) -> int:
+        return self.certificate.employee_id
+
+    @property
+    def course_id(self) -> str:
+        return self.certificate.course_id
+
+    @property
+    def expiry_date(self) -> date:
+        return self.certificate.expiry_date
+
+    @property
+    def row_id(self) -> int:
+        return self.certificate.row_id
+
+    def to_model(self) -> EnrichedCertificate:
+        cert, employee, course = self.certificate, self.employee, self.course
+        return EnrichedCertificate.model_construct(
+            employee_id=cert.employee_id,
+            course_id=cert.course_id,
+            certificate_name=cert.certificate_name,
+            issue_date=cert.issue_date,
+            expiry_date=cert.expiry_date,
+            first_name=employee.first_name if employee else None,
+            last_name=employee.last_name if employee else None,
+            email=employee.email if employee else None,
+            company_name=employee.company_name if employee else None,
+            department=employee.department if employee else None,
+            course_name=course.course_name if course else None,
+        )
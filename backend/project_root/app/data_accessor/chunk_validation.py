@@ -0,0 +1,234 @@
+import io
+import os
+import csv
+import atexit
+import threading
+import multiprocessing
+
+from collections import deque
+from itertools import chain, islice
+from pathlib import Path
+from dataclasses import dataclass, field, replace
+from pydantic import BaseModel
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, BinaryIO, Callable, Deque, Dict, Generic, Iterable, Iterator, List, Optional, Type, TypeVar
+
+from app.data_accessor.row_validation import RowError, validate_rows
+
+T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# Data lines per chunk handed to a worker
+DEFAULT_CHUNK_ROWS = 20_000
+
+
+@dataclass(frozen=True)
+class CsvChunk:
+    """A run of complete CSV data lines; first_line is the file line number of the first one."""
+    header: List[str]
+    data: bytes
+    first_line: int
+
+
+@dataclass
+class ChunkResult(Generic[T]):
+    """Validated models and rejected rows of one chunk, in source order."""
+    first_line: int
+    items: List[T] = field(default_factory=list)
+    errors: List[RowError] = field(default_factory=list)
+    # Physical lines parsed
+    lines: int = 0
+
+    @property
+    def rows(self) -> int:
+        return len(self.items) + len(self.errors)
+
+
+def read_header(stream: BinaryIO) -> List[str]:
+    return next(csv.reader([stream.readline().decode("utf-8-sig")]), [])
+
+
+def iter_csv_chunks(stream: BinaryIO, header: List[str], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[CsvChunk]:
+    """Split the rest of a CSV stream (after the header) into chunks of chunk_rows lines.
+
+    Only one chunk is held in memory at a time. Chunks end on line
+    boundaries, so quoted fields must not contain newlines.
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be a positive integer")
+    first_line = 2
+    lines: List[bytes] = []
+    for line in stream:
+        lines.append(line)
+        if len(lines) == chunk_rows:
+            yield CsvChunk(header, b"".join(lines), first_line)
+            first_line += len(lines)
+            lines = []
+    if lines:
+        yield CsvChunk(header, b"".join(lines), first_line)
+
+
+@dataclass(frozen=True)
+class FileRange:
+    """Bytes [start, end) of a CSV file; both ends fall on line boundaries."""
+    path: Path
+    header: List[str]
+    start: int
+    end: int
+
+    def read(self) -> bytes:
+        with self.path.open("rb") as f:
+            f.seek(self.start)
+            return f.read(self.end - self.start)
+
+
+def split_ranges(path: Path, parts: int) -> List[FileRange]:
+    """Split the data lines of a CSV file into at most parts byte ranges of similar size.
+
+    Only the header and one line per boundary are read. As with
+    iter_csv_chunks, quoted fields must not contain newlines.
+    """
+    if parts < 1:
+        raise ValueError("parts must be a positive integer")
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        header = read_header(f)
+        boundaries = [f.tell()]
+        step = max((size - boundaries[0]) // parts, 1)
+        for i in range(1, parts):
+            target = boundaries[0] + i * step
+            if target <= boundaries[-1]:
+                continue
+            # Move to the start of the line following the byte before target
+            f.seek(target - 1)
+            f.readline()
+            if f.tell() >= size:
+                break
+            boundaries.append(f.tell())
+    boundaries.append(size)
+    return [FileRange(path, header, start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def validate_chunk(model: Type[T], chunk: CsvChunk) -> ChunkResult[T]:
+    """Parse and validate one chunk; runs in worker processes, so it must stay picklable."""
+    result: ChunkResult[T] = ChunkResult(chunk.first_line)
+    reader = csv.DictReader(io.StringIO(chunk.data.decode("utf-8"), newline=""), fieldnames=chunk.header)
+    rows = ((chunk.first_line + reader.line_num - 1, row) for row in reader)
+    result.items = list(validate_rows(model, rows, result.errors.append))
+    result.lines = reader.line_num
+    return result
+
+
+def validate_range(model: Type[T], file_range: FileRange) -> ChunkResult[T]:
+    """Read and validate one byte range; line numbers are relative to the range (first line = 1)."""
+    return validate_chunk(model, CsvChunk(file_range.header, file_range.read(), 1))
+
+
+# One long-lived pool per worker count, shared by every upload and parallel
+# load; spawned workers re-import the app, which is too slow to pay per call
+_POOLS: Dict[int, ProcessPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _executor(workers: int) -> ProcessPoolExecutor:
+    with _POOLS_LOCK:
+        pool = _POOLS.get(workers)
+        if pool is None:
+            # spawn: forking a multi-threaded server process is not safe
+            pool = _POOLS[workers] = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        return pool
+
+
+def _discard_executor(workers: int, pool: ProcessPoolExecutor) -> None:
+    # A worker died; the next call starts a fresh pool
+    with _POOLS_LOCK:
+        if _POOLS.get(workers) is pool:
+            del _POOLS[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def _shutdown_executors() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def map_ordered(
+    fn: Callable[..., R],
+    items: Iterable[Any],
+    *args: Any,
+    workers: int,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[R]:
+    """
+    Yield fn(*args, item) for each item, computed in a process pool, in input order.
+
+    At most max_in_flight items (default: two per worker) are submitted ahead
+    of the consumer, so memory stays bounded however long the input is. With
+    workers <= 1, or a single item (not worth a round trip to the pool), fn
+    runs inline. The pool is shared and outlives the call.
+    """
+    iterator = iter(items)
+    head = list(islice(iterator, 2))
+    if workers <= 1 or len(head) < 2:
+        for item in chain(head, iterator):
+            yield fn(*args, item)
+        return
+    limit = max_in_flight or 2 * workers
+    pool = _executor(workers)
+    pending: Deque[Future[R]] = deque()
+    try:
+        for item in chain(head, iterator):
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+            pending.append(pool.submit(fn, *args, item))
+        while pending:
+            yield pending.popleft().result()
+    except BrokenProcessPool:
+        _discard_executor(workers, pool)
+        raise
+    finally:
+        # Abandoned or failed: don't leave this call's work queued in the shared pool
+        for future in pending:
+            future.cancel()
+
+
+class ChunkValidator(Generic[T]):
+    """
+    Validates CSV chunks in a process pool and yields the results in input order.
+
+    See `map_ordered` for the in-flight bound and when work stays in-process.
+    """
+    def __init__(self, model: Type[T], max_workers: Optional[int] = None, max_in_flight: Optional[int] = None):
+        self.model = model
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.max_in_flight = max_in_flight
+
+    def validate(self, chunks: Iterable[CsvChunk]) -> Iterator[ChunkResult[T]]:
+        return map_ordered(validate_chunk, chunks, self.model, workers=self.max_workers, max_in_flight=self.max_in_flight)
+
+    def validate_file(self, path: Path, parts: Optional[int] = None) -> Iterator[ChunkResult[T]]:
+        """Validate a whole CSV file split into byte ranges (default: four per worker), in file order."""
+        ranges = split_ranges(path, parts or 4 * max(self.max_workers, 1))
+        line = 1
+        for result in map_ordered(validate_range, ranges, self.model, workers=self.max_workers, max_in_flight=self.max_in_flight):
+            # Workers number lines from the start of their range; make them file line numbers
+            result.first_line += line
+            result.errors = [replace(error, line=error.line + line) for error in result.errors]
+            line += result.lines
+            yield result
+
+
+@dataclass(frozen=True)
+class ParallelLoad:
+    """When and how wide to parse a CSV file across worker processes."""
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    # Smaller files are parsed in-process; starting workers would cost more than it saves
+    min_bytes: int = 64 * 1024 * 1024
+
+    def applies_to(self, path: Path) -> bool:
+        return self.workers > 1 and path.stat().st_size >= self.min_bytes
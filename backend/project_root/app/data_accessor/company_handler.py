@@ -1,5 +1,39 @@
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Type
+
 from app.data_models.company import Company
 from app.data_accessor.csv_handler import CsvHandler
+from app.data_accessor.snapshot import SnapshotCache
+from app.data_accessor.chunk_validation import ParallelLoad
 
 class CompanyHandler(CsvHandler[Company]):
-    pass
+    """
+    Handler for Company data loaded from a CSV file.
+    """
+    def __init__(
+        self,
+        file_path: Path,
+        model: Type[Company] = Company,
+        snapshots: Optional[SnapshotCache] = None,
+        parallel: Optional[ParallelLoad] = None,
+    ):
+        super().__init__(file_path, model, snapshots, parallel)
+        self._by_id: Optional[Dict[int, Company]] = None
+
+    @property
+    def by_id(self) -> Dict[int, Company]:
+        """company_id -> company (first row wins), built on first use."""
+        if self._by_id is None:
+            by_id: Dict[int, Company] = {}
+            for company in self.load_all():
+                by_id.setdefault(company.company_id, company)
+            self._by_id = by_id
+        return self._by_id
+
+    def get_by_id(self, company_id: int) -> Optional[Company]:
+        """Retrieve a company by its ID."""
+        return self.by_id.get(company_id)
+
+    def get_by_ids(self, company_ids: Iterable[int]) -> Dict[int, Company]:
+        """Retrieve many companies by ID; unknown ids are left out."""
+        return {c: self.by_id[c] for c in dict.fromkeys(company_ids) if c in self.by_id}
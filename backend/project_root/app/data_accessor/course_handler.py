@@ -1,5 +1,39 @@
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Type
+
 from app.data_models.course import Course
 from app.data_accessor.csv_handler import CsvHandler
+from app.data_accessor.snapshot import SnapshotCache
+from app.data_accessor.chunk_validation import ParallelLoad
 
 class CourseHandler(CsvHandler[Course]):
-    pass
+    """
+    Handler for Course data loaded from a CSV file.
+    """
+    def __init__(
+        self,
+        file_path: Path,
+        model: Type[Course] = Course,
+        snapshots: Optional[SnapshotCache] = None,
+        parallel: Optional[ParallelLoad] = None,
+    ):
+        super().__init__(file_path, model, snapshots, parallel)
+        self._by_id: Optional[Dict[str, Course]] = None
+
+    @property
+    def by_id(self) -> Dict[str, Course]:
+        """course_id -> course (first row wins), built on first use."""
+        if self._by_id is None:
+            by_id: Dict[str, Course] = {}
+            for course in self.load_all():
+                by_id.setdefault(course.course_id, course)
+            self._by_id = by_id
+        return self._by_id
+
+    def get_by_id(self, course_id: str) -> Optional[Course]:
+        """Retrieve a course by its ID."""
+        return self.by_id.get(course_id)
+
+    def get_by_ids(self, course_ids: Iterable[str]) -> Dict[str, Course]:
+        """Retrieve many courses by ID; unknown ids are left out."""
+        return {c: self.by_id[c] for c in dict.fromkeys(course_ids) if c in self.by_id}
@@ -1,17 +1,137 @@
+import io
 import csv
 
 from pathlib import Path
 from pydantic import BaseModel
-from typing import List, Type, Generic, TypeVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type, Generic, TypeVar, Tuple
+
+from app.data_accessor.row_validation import (
+    LoadStats, LoadTimer, RowError, RowErrorCallback, report_load_stats, log_row_error, validate_rows,
+)
+from app.data_accessor.snapshot import SnapshotCache, SourceFingerprint
+from app.data_accessor.chunk_validation import ChunkValidator, ParallelLoad
 
 T = TypeVar('T', bound=BaseModel)
+R = TypeVar('R')
 
 class CsvHandler(Generic[T]):
-    def __init__(self, file_path: Path, model: Type[T]):
+    def __init__(
+        self,
+        file_path: Path,
+        model: Type[T],
+        snapshots: Optional[SnapshotCache] = None,
+        parallel: Optional[ParallelLoad] = None,
+    ):
         self.file_path = file_path
         self.model = model
+        self.snapshots = snapshots
+        # Parse large files across worker processes; None keeps every load in-process
+        self.parallel = parallel
+        # Rows rejected during the most recent pass over the file
+        self.errors: List[RowError] = []
+        self.last_load_stats: Optional[LoadStats] = None
 
-    def load_all(self) -> List[T]:
+    def _record_error(self, error: RowError) -> None:
+        self.errors.append(error)
+        log_row_error(error)
+
+    def _read_rows(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
         with self.file_path.open(newline='') as f:
             reader = csv.DictReader(f)
-            return [self.model(**row) for row in reader]
\ No newline at end of file
+            for row in reader:
+                yield reader.line_num, row
+
+    def _read_appended_rows(self, start: int, end: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        with self.file_path.open(newline='') as f:
+            header = next(csv.reader(f))
+        with self.file_path.open('rb') as f:
+            f.seek(start)
+            tail = f.read(end - start).decode()
+        reader = csv.DictReader(io.StringIO(tail, newline=''), fieldnames=header)
+        for row in reader:
+            # Line numbers are relative to the start of the appended region
+            yield reader.line_num, row
+
+    def iter_appended(self, start: int, end: int, on_error: Optional[RowErrorCallback] = None) -> Iterator[T]:
+        """Stream rows stored in bytes [start, end) of an append-only file.
+
+        start and end must fall on line boundaries; the header is read from the
+        top of the file so only the appended bytes are parsed.
+        """
+        self.errors = []
+        yield from validate_rows(self.model, self._read_appended_rows(start, end), on_error or self._record_error)
+
+    def iter_all(self, on_error: Optional[RowErrorCallback] = None) -> Iterator[T]:
+        """Stream validated models one row at a time without holding the whole file.
+
+        Invalid rows are reported to on_error (default: recorded in self.errors)
+        and skipped.
+        """
+        self.errors = []
+        yield from validate_rows(self.model, self._read_rows(), on_error or self._record_error)
+
+    def iter_batches(self, size: int, on_error: Optional[RowErrorCallback] = None) -> Iterator[List[T]]:
+        """Stream validated models in lists of at most size rows."""
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+        batch: List[T] = []
+        for item in self.iter_all(on_error):
+            batch.append(item)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _parse_parallel(self) -> List[T]:
+        """Validate byte ranges of the file in worker processes, keeping file order."""
+        assert self.parallel is not None
+        self.errors = []
+        items: List[T] = []
+        for result in ChunkValidator(self.model, self.parallel.workers).validate_file(self.file_path):
+            items.extend(result.items)
+            for error in result.errors:
+                self._record_error(error)
+        return items
+
+    def load_all(self) -> List[T]:
+        return self._load(list)
+
+    def _load(self, collect: Callable[[Iterable[T]], List[R]]) -> List[R]:
+        """Load every row and turn the validated models into a list with collect.
+
+        Without snapshots, a sequential parse hands rows to collect one at a
+        time, so a collect that converts them never holds every model at once.
+        """
+        items: Optional[Iterable[T]] = None
+        if self.snapshots is not None:
+            timer = LoadTimer("snapshot", self.snapshots.trusted)
+            self.errors = []
+            items = self.snapshots.load(self.file_path, self.model, self._record_error)
+        if items is None:
+            parallel = self.parallel is not None and self.parallel.applies_to(self.file_path)
+            timer = LoadTimer("parallel_csv" if parallel else "csv")
+            # Fingerprint before parsing so a concurrent write invalidates the snapshot
+            fingerprint = SourceFingerprint.of(self.file_path) if self.snapshots is not None else None
+            items = self._parse_parallel() if parallel else self.iter_all()
+            if self.snapshots is not None and fingerprint is not None:
+                items = list(items)
+                self.snapshots.save(self.file_path, self.model, fingerprint, items, self.errors)
+        collected = collect(items)
+        self.last_load_stats = timer.stop(len(collected), len(self.errors))
+        report_load_stats(self.model, self.last_load_stats)
+        return collected
+
+    def append_to_file(self, items: Iterable[T]) -> None:
+        """Append items as rows to the end of the CSV file, in its header's column order."""
+        with self.file_path.open(newline='') as f:
+            header = next(csv.reader(f))
+        with self.file_path.open('rb') as f:
+            f.seek(-1, io.SEEK_END)
+            # Never glue the first new row onto an unterminated last line
+            needs_newline = f.read(1) != b"\n"
+        with self.file_path.open('a', newline='') as f:
+            if needs_newline:
+                f.write("\n")
+            writer = csv.DictWriter(f, fieldnames=header, extrasaction='ignore', lineterminator="\n")
+            writer.writerows(item.model_dump(mode="json") for item in items)
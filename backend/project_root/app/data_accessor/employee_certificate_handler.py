@@ -1,34 +1,97 @@
 from app.data_accessor.csv_handler import CsvHandler
+from app.data_accessor.snapshot import SnapshotCache
+from app.data_accessor.chunk_validation import ParallelLoad
+from app.data_accessor.indexes.expiry_index import ExpiryIndex
+from app.data_accessor.certificate_record import CertificateRecord, ValuePool
+from app.data_accessor.indexes.multi_value_index import MultiValueIndex
 from app.data_models.employee_certificate import EmployeeCertificate
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Union
 from datetime import date
 
 class EmployeeCertificateHandler(CsvHandler[EmployeeCertificate]):
     """
     Handler for Employee Certificate data loaded from a CSV file.
+
+    Rows are cached and indexed as compact CertificateRecords; the query
+    methods and load_all build EmployeeCertificate models for the rows they return.
     """
-    def __init__(self, file_path: Path):
-        super().__init__(file_path, EmployeeCertificate)
-        self._cache: Optional[List[EmployeeCertificate]] = None
+    def __init__(
+        self,
+        file_path: Path,
+        snapshots: Optional[SnapshotCache] = None,
+        parallel: Optional[ParallelLoad] = None,
+    ):
+        super().__init__(file_path, EmployeeCertificate, snapshots, parallel)
+        self._cache: Optional[List[CertificateRecord]] = None
+        # Shared employee ids and dates of the cached records
+        self._pool: ValuePool = {}
+        self._expiry_index: Optional[ExpiryIndex[CertificateRecord]] = None
+        self._by_employee_id: Optional[MultiValueIndex[int, CertificateRecord]] = None
+        self._by_course_id: Optional[MultiValueIndex[str, CertificateRecord]] = None
 
-    def load_all(self) -> List[EmployeeCertificate]:
-        """Load and cache all employee certificates from CSV."""
+    def load_records(self) -> List[CertificateRecord]:
+        """Load and cache all employee certificates from CSV as compact records."""
         if self._cache is None:
-            self._cache = super().load_all()
+            self._cache = self._load(self._records)
         return self._cache
 
+    def _records(self, certs: Iterable[Union[EmployeeCertificate, CertificateRecord]]) -> List[CertificateRecord]:
+        # Each streamed model can be freed as soon as its record exists
+        return [CertificateRecord.of(cert, i, self._pool) for i, cert in enumerate(certs)]
+
+    def load_all(self) -> List[EmployeeCertificate]:
+        """All employee certificates as models, built from the cached records on each call."""
+        return _models(self.load_records())
+
+    def clear_cache(self) -> None:
+        """Drop the cached certificates together with every index derived from them."""
+        self._cache = None
+        self._pool = {}
+        self._expiry_index = None
+        self._by_employee_id = None
+        self._by_course_id = None
+
+    def seed_cache(self, certificates: Iterable[Union[EmployeeCertificate, CertificateRecord]]) -> None:
+        """Replace the cached certificates (e.g. after an incremental reload) and drop derived indexes."""
+        self.clear_cache()
+        self._cache = self._records(certificates)
+
+    @property
+    def expiry_index(self) -> ExpiryIndex[CertificateRecord]:
+        """Sorted expiry-date index over the cached certificates, built on first use."""
+        certificates = self.load_records()
+        if self._expiry_index is None:
+            self._expiry_index = ExpiryIndex(certificates)
+        return self._expiry_index
+
+    @property
+    def by_employee_id(self) -> MultiValueIndex[int, CertificateRecord]:
+        """employee_id -> certificates index, built on first use."""
+        certificates = self.load_records()
+        if self._by_employee_id is None:
+            self._by_employee_id = MultiValueIndex(certificates, lambda cert: cert.employee_id, "certificates_by_employee_id")
+        return self._by_employee_id
+
+    @property
+    def by_course_id(self) -> MultiValueIndex[str, CertificateRecord]:
+        """course_id -> certificates index, built on first use."""
+        certificates = self.load_records()
+        if self._by_course_id is None:
+            self._by_course_id = MultiValueIndex(certificates, lambda cert: cert.course_id, "certificates_by_course_id")
+        return self._by_course_id
+
     def get_employee_certificates_by_employee_id(self, employee_id: int) -> List[EmployeeCertificate]:
         """Retrieve all certificates for a specific employee by their ID."""
-        return [cert for cert in self.load_all() if cert.employee_id == employee_id]
+        return _models(self.by_employee_id.get(employee_id))
 
     def get_expired_employee_certificates_by_date_range(self, start_date: date, end_date: date) -> List[EmployeeCertificate]:
-        """Retrieve all expired employee certificates within a specific date range."""
-        return [
-            cert for cert in self.load_all()
-            if start_date <= cert.expiry_date and cert.expiry_date <= end_date
-        ]
+        """Retrieve all expired employee certificates within a specific date range, sorted by expiry date."""
+        return _models(self.expiry_index.range(start_date, end_date))
 
-    def get_employee_certificates_by_course_id(self, course_id: int) -> List[EmployeeCertificate]:
+    def get_employee_certificates_by_course_id(self, course_id: str) -> List[EmployeeCertificate]:
         """Retrieve all certificates for a specific course by its ID."""
-        return [cert for cert in self.load_all() if cert.course_id == course_id]
+        return _models(self.by_course_id.get(course_id))
+
+def _models(records: Iterable[CertificateRecord]) -> List[EmployeeCertificate]:
+    return [record.to_model() for record in records]
@@ -1,16 +1,26 @@
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from app.data_models.employee import Employee
 from app.data_accessor.csv_handler import CsvHandler
+from app.data_accessor.snapshot import SnapshotCache
+from app.data_accessor.chunk_validation import ParallelLoad
+from app.data_accessor.indexes.name_index import NameIndex
 
 class EmployeeHandler(CsvHandler[Employee]):
     """
     Handler for Employee data loaded from a CSV file.
     """
-    def __init__(self, file_path: Path):
-        super().__init__(file_path, Employee)
+    def __init__(
+        self,
+        file_path: Path,
+        snapshots: Optional[SnapshotCache] = None,
+        parallel: Optional[ParallelLoad] = None,
+    ):
+        super().__init__(file_path, Employee, snapshots, parallel)
         self._cache: Optional[List[Employee]] = None
+        self._name_index: Optional[NameIndex[Employee]] = None
+        self._by_id: Optional[Dict[int, Employee]] = None
 
     def load_all(self) -> List[Employee]:
         """Load and cache all employees from CSV."""
@@ -18,14 +28,54 @@ class EmployeeHandler(CsvHandler[Employee]):
             self._cache = super().load_all()
         return self._cache
 
+    def load_records(self) -> List[Employee]:
+        """The cached rows; employees are few, so they are kept as models."""
+        return self.load_all()
+
+    def clear_cache(self) -> None:
+        """Drop the cached employees together with the name and id indexes."""
+        self._cache = None
+        self._name_index = None
+        self._by_id = None
+
+    def seed_cache(self, employees: Iterable[Employee]) -> None:
+        """Replace the cached employees (e.g. after an incremental reload) and drop derived indexes."""
+        self.clear_cache()
+        self._cache = list(employees)
+
+    @property
+    def name_index(self) -> NameIndex[Employee]:
+        """Case-insensitive (first, last) name index, built on first use."""
+        employees = self.load_all()
+        if self._name_index is None:
+            self._name_index = NameIndex((e.first_name, e.last_name, e) for e in employees)
+        return self._name_index
+
+    @property
+    def by_id(self) -> Dict[int, Employee]:
+        """employee_id -> employee (first row wins), built on first use."""
+        employees = self.load_all()
+        if self._by_id is None:
+            by_id: Dict[int, Employee] = {}
+            for employee in employees:
+                by_id.setdefault(employee.employee_id, employee)
+            self._by_id = by_id
+        return self._by_id
+
     def get_by_id(self, employee_id: int) -> Optional[Employee]:
         """Retrieve an employee by their ID."""
-        return next((e for e in self.load_all() if e.employee_id == employee_id), None)
+        return self.by_id.get(employee_id)
+
+    def get_by_ids(self, employee_ids: Iterable[int]) -> Dict[int, Employee]:
+        """Retrieve many employees by ID; unknown ids are left out."""
+        return {e: self.by_id[e] for e in dict.fromkeys(employee_ids) if e in self.by_id}
     
     def get_employee_company_name(self, first_name: str, last_name: str) -> Optional[str]:
-        """Retreive name of a company associated to an employee"""
-        return next((e.company_name for e in self.load_all() if e.first_name == first_name and e.last_name == last_name), None)
+        """Retreive name of a company associated to an employee (first match on duplicate names)"""
+        employee = self.name_index.first(first_name, last_name)
+        return employee.company_name if employee else None
     
     def get_employee_email(self, first_name: str, last_name: str) -> Optional[str]:
-        """Retreive the email of an employee"""
-        return next((e.email for e in self.load_all() if e.first_name == first_name and e.last_name == last_name), None)
\ No newline at end of file
+        """Retreive the email of an employee (first match on duplicate names)"""
+        employee = self.name_index.first(first_name, last_name)
+        return employee.email if employee else None
@@ -0,0 +1,119 @@
+import heapq
+
+from datetime import date
+from bisect import bisect_left, bisect_right
+from app.instrumentation.metrics import INDEX_BUILD_SECONDS, timed
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Protocol, Tuple, TypeVar
+
+
+class HasExpiryDate(Protocol):
+    @property
+    def expiry_date(self) -> date: ...
+
+
+T = TypeVar("T", bound=HasExpiryDate)
+
+SortKey = Tuple[Any, ...]
+
+
+class ExpiryIndex(Generic[T]):
+    """
+    Sorted index over the expiry_date of certificate-like records.
+
+    Built once in O(n log n); range queries are answered by binary search in
+    O(log n + k) and always return records in ascending expiry order. Records
+    sharing an expiry date are ordered by the optional tiebreak key, otherwise
+    they keep their original (load) order.
+
+    The full sort key `(expiry_date, *tiebreak(record))` doubles as a keyset
+    pagination cursor: `after=key` resumes right after the record with that key.
+    Every record with a key equal to the cursor is skipped, so the tiebreak must
+    make keys unique (e.g. end with the record's load position) for paging.
+    """
+    def __init__(self, items: Iterable[T], tiebreak: Optional[Callable[[T], SortKey]] = None):
+        self._tiebreak = tiebreak
+        with timed(INDEX_BUILD_SECONDS, index="expiry"):
+            self._items: List[T] = sorted(items, key=self.sort_key)
+            self._dates: List[date] = [item.expiry_date for item in self._items]
+
+    @classmethod
+    def _from_sorted(cls, items: List[T], tiebreak: Optional[Callable[[T], SortKey]]) -> "ExpiryIndex[T]":
+        index: ExpiryIndex[T] = cls.__new__(cls)
+        index._tiebreak = tiebreak
+        index._items = items
+        index._dates = [item.expiry_date for item in items]
+        return index
+
+    def merged(self, items: Iterable[T]) -> "ExpiryIndex[T]":
+        """
+        A new index with items added, leaving this one untouched for concurrent readers.
+
+        Only the k new records are sorted; they are then merged with the
+        existing order in one linear pass, O(n + k log k) instead of a full
+        re-sort. New records go after existing ones with an equal key.
+        """
+        with timed(INDEX_BUILD_SECONDS, index="expiry_merge"):
+            new = sorted(items, key=self.sort_key)
+            merged = list(heapq.merge(self._items, new, key=self.sort_key))
+            return self._from_sorted(merged, self._tiebreak)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def sort_key(self, item: T) -> SortKey:
+        if self._tiebreak is None:
+            return (item.expiry_date,)
+        return (item.expiry_date, *self._tiebreak(item))
+
+    def _bounds(self, start: Optional[date], end: Optional[date], after: Optional[SortKey] = None) -> Tuple[int, int]:
+        lo = 0 if start is None else bisect_left(self._dates, start)
+        if after is not None:
+            lo = max(lo, bisect_right(self._items, after, key=self.sort_key))
+        hi = len(self._dates) if end is None else bisect_right(self._dates, end)
+        return lo, max(lo, hi)
+
+    def iter_range(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        after: Optional[SortKey] = None,
+    ) -> Iterator[T]:
+        """Yield records with start <= expiry_date <= end; either bound may be open (None)."""
+        lo, hi = self._bounds(start, end, after)
+        for i in range(lo, hi):
+            yield self._items[i]
+
+    def range(self, start: Optional[date] = None, end: Optional[date] = None) -> List[T]:
+        """Return records with start <= expiry_date <= end, sorted by expiry date."""
+        lo, hi = self._bounds(start, end)
+        return self._items[lo:hi]
+
+    def page(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        limit: int,
+        after: Optional[SortKey] = None,
+    ) -> Tuple[List[T], Optional[SortKey]]:
+        """Return up to limit records after the cursor, plus the cursor for the next page (None on the last page)."""
+        lo, hi = self._bounds(start, end, after)
+        stop = min(hi, lo + max(limit, 0))
+        items = self._items[lo:stop]
+        next_key = self.sort_key(items[-1]) if items and stop < hi else None
+        return items, next_key
+
+    def count(self, start: Optional[date] = None, end: Optional[date] = None) -> int:
+        """Count records in the range without materializing them."""
+        lo, hi = self._bounds(start, end)
+        return hi - lo
+
+    def next_expiring(self, after: date, n: int) -> List[T]:
+        """Return the next n records expiring on or after the given date."""
+        lo = bisect_left(self._dates, after)
+        return self._items[lo:lo + max(n, 0)]
+
+    def first_expiry(self) -> Optional[date]:
+        return self._dates[0] if self._dates else None
+
+    def last_expiry(self) -> Optional[date]:
+        return self._dates[-1] if self._dates else None
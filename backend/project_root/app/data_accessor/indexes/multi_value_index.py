@@ -0,0 +1,47 @@
+from app.instrumentation.metrics import INDEX_BUILD_SECONDS, timed
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class MultiValueIndex(Generic[K, T]):
+    """
+    Hash index mapping a key to every record that carries it.
+
+    Built in a single O(n) pass; lookups cost O(k) for the k matching records,
+    which are returned in their original (load) order.
+    """
+    def __init__(self, items: Iterable[T], key: Callable[[T], K], name: str = "multi_value"):
+        self._key = key
+        self.name = name
+        self._buckets: Dict[K, List[T]] = {}
+        with timed(INDEX_BUILD_SECONDS, index=name):
+            for item in items:
+                self._buckets.setdefault(key(item), []).append(item)
+
+    def extended(self, items: Iterable[T]) -> "MultiValueIndex[K, T]":
+        """A new index with items appended; only the buckets they touch are copied."""
+        index: MultiValueIndex[K, T] = MultiValueIndex((), self._key, self.name)
+        index._buckets = dict(self._buckets)
+        copied: Set[K] = set()
+        for item in items:
+            key = self._key(item)
+            if key not in copied:
+                index._buckets[key] = list(index._buckets.get(key, ()))
+                copied.add(key)
+            index._buckets[key].append(item)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._buckets
+
+    def get(self, key: K) -> List[T]:
+        """Return a copy of the records stored under key (empty if none)."""
+        return list(self._buckets.get(key, ()))
+
+    def keys(self) -> List[K]:
+        return list(self._buckets)
@@ -0,0 +1,46 @@
+from app.instrumentation.metrics import INDEX_BUILD_SECONDS, timed
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+def normalize_name(name: str) -> str:
+    """Case-fold a name and collapse runs of whitespace, e.g. '  ALICE   smith' -> 'alice smith'."""
+    return " ".join(name.split()).casefold()
+
+
+def full_name_key(first_name: str, last_name: str) -> str:
+    return normalize_name(f"{first_name} {last_name}")
+
+
+class NameIndex(Generic[V]):
+    """
+    Case-normalized (first, last) name index shared by the CSV and pandas backends.
+
+    Keys are the normalized full name, so 'Alice Smith', ('alice', 'SMITH') and
+    'alice  smith' all resolve to the same entry. When several records share a
+    name, `first` returns the earliest one in load order (matching the previous
+    linear-scan behaviour) and `all` returns every match in load order.
+    """
+    def __init__(self, entries: Iterable[Tuple[str, str, V]]):
+        self._names: Dict[str, List[V]] = {}
+        with timed(INDEX_BUILD_SECONDS, index="name"):
+            for first_name, last_name, value in entries:
+                self._names.setdefault(full_name_key(first_name, last_name), []).append(value)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def first(self, first_name: str, last_name: str) -> Optional[V]:
+        return self.first_by_full_name(f"{first_name} {last_name}")
+
+    def first_by_full_name(self, full_name: str) -> Optional[V]:
+        matches = self._names.get(normalize_name(full_name))
+        return matches[0] if matches else None
+
+    def all(self, first_name: str, last_name: str) -> List[V]:
+        return list(self._names.get(full_name_key(first_name, last_name), ()))
+
+    def duplicates(self) -> Dict[str, List[V]]:
+        """Normalized names that map to more than one record."""
+        return {name: list(values) for name, values in self._names.items() if len(values) > 1}
@@ -0,0 +1,177 @@
+import heapq
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from app.instrumentation.metrics import INDEX_BUILD_SECONDS, timed
+from app.data_accessor.indexes.name_index import normalize_name
+from app.data_models.search_result import MatchKind
+from typing import Dict, Generic, Iterable, List, NamedTuple, Set, Tuple, TypeVar
+
+V = TypeVar("V")
+
+# Postings read per fuzzy query; the rarest trigrams are read first, so only
+# very common ones are skipped once the budget runs out
+DEFAULT_MAX_FUZZY_POSTINGS = 5_000
+# Fuzzy candidates (most shared trigrams) rescored exactly, per requested result
+_FUZZY_CANDIDATES_PER_RESULT = 4
+# Minimum trigram Jaccard similarity for a fuzzy match
+DEFAULT_MIN_SIMILARITY = 0.3
+
+
+class SearchMatch(NamedTuple, Generic[V]):
+    name: str
+    values: List[V]
+    match: MatchKind
+    score: float
+
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex(Generic[V]):
+    """
+    Type-ahead index over names, ranked top-k search.
+
+    Names are normalized like NameIndex keys (case-folded, whitespace
+    collapsed) and deduplicated; each distinct name keeps the first spelling
+    seen and every value it was added with. Queries are answered in tiers:
+
+    - prefix of the whole name (exact matches first), by binary search over
+      the names in sorted order;
+    - prefix of a later word ("smi" finds "Alice Smith"), by binary search
+      over word start offsets sorted by the text that follows them;
+    - only when those give fewer than limit results, trigram similarity,
+      which tolerates typos.
+
+    The prefix tiers cost O(log n + limit) whatever the number of matches.
+    The sorted arrays hold (name id, offset) pairs rather than suffix strings,
+    so they add a few bytes per word.
+    """
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, V]],
+        name: str = "search",
+        max_fuzzy_postings: int = DEFAULT_MAX_FUZZY_POSTINGS,
+        min_similarity: float = DEFAULT_MIN_SIMILARITY,
+    ):
+        self.max_fuzzy_postings = max_fuzzy_postings
+        self.min_similarity = min_similarity
+        with timed(INDEX_BUILD_SECONDS, index=name):
+            ids: Dict[str, int] = {}
+            self._names: List[str] = []
+            # First value per name; the few names added more than once keep the rest aside
+            self._values: List[V] = []
+            self._more_values: Dict[int, List[V]] = {}
+            for display, value in entries:
+                key = normalize_name(display)
+                if not key:
+                    continue
+                i = ids.get(key)
+                if i is None:
+                    ids[key] = len(self._names)
+                    self._names.append(" ".join(display.split()))
+                    self._values.append(value)
+                else:
+                    self._more_values.setdefault(i, []).append(value)
+            self._keys: List[str] = list(ids)
+            keys = self._keys
+
+            self._by_key = array("I", sorted(range(len(keys)), key=keys.__getitem__))
+            word_ids = array("I")
+            word_offsets = array("H")
+            for i, key in enumerate(keys):
+                space = key.find(" ")
+                while space != -1 and space < 0xFFFF - 1:
+                    word_ids.append(i)
+                    word_offsets.append(space + 1)
+                    space = key.find(" ", space + 1)
+            order = sorted(range(len(word_ids)), key=lambda j: keys[word_ids[j]][word_offsets[j]:])
+            self._word_ids = array("I", (word_ids[j] for j in order))
+            self._word_offsets = array("H", (word_offsets[j] for j in order))
+
+            postings: Dict[str, array] = {}
+            for i, key in enumerate(keys):
+                for gram in _trigrams(key):
+                    posting = postings.get(gram)
+                    if posting is None:
+                        posting = postings[gram] = array("I")
+                    posting.append(i)
+            self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _prefix_ids(self, key: str, limit: int) -> List[int]:
+        keys, by_key = self._keys, self._by_key
+        lo = bisect_left(range(len(by_key)), key, key=lambda j: keys[by_key[j]])
+        found: List[int] = []
+        for j in range(lo, min(lo + limit, len(by_key))):
+            i = by_key[j]
+            if not keys[i].startswith(key):
+                break
+            found.append(i)
+        return found
+
+    def _word_prefix_ids(self, key: str, limit: int) -> List[int]:
+        keys, word_ids, offsets = self._keys, self._word_ids, self._word_offsets
+        lo = bisect_left(range(len(word_ids)), key, key=lambda j: keys[word_ids[j]][offsets[j]:])
+        found: List[int] = []
+        j = lo
+        # A name can match at several words; read on until limit distinct names
+        while j < len(word_ids) and len(found) < limit:
+            i = word_ids[j]
+            if not keys[i].startswith(key, offsets[j]):
+                break
+            if i not in found:
+                found.append(i)
+            j += 1
+        return found
+
+    def _fuzzy_scores(self, key: str, limit: int) -> List[Tuple[float, int]]:
+        grams = _trigrams(key)
+        postings = sorted((self._postings[g] for g in grams if g in self._postings), key=len)
+        shared: Counter[int] = Counter()
+        read = 0
+        for posting in postings:
+            if read and read + len(posting) > self.max_fuzzy_postings:
+                break
+            shared.update(posting)
+            read += len(posting)
+        # Candidates come from the trigrams read; their similarity uses all of them
+        scored: List[Tuple[float, int]] = []
+        for i, _ in shared.most_common(limit * _FUZZY_CANDIDATES_PER_RESULT):
+            candidate = _trigrams(self._keys[i])
+            n = len(grams & candidate)
+            similarity = n / (len(grams) + len(candidate) - n)
+            if similarity >= self.min_similarity:
+                scored.append((similarity, i))
+        return heapq.nlargest(limit, scored)
+
+    def search(self, query: str, limit: int = 10) -> List[SearchMatch[V]]:
+        """Up to limit names matching query, best first.
+
+        Scores: 3 for an exact match, 2-3 for a name prefix and 1-2 for a
+        word prefix (longer coverage of the name scores higher), 0-1 for the
+        trigram similarity of a fuzzy match.
+        """
+        key = normalize_name(query)
+        if not key or limit < 1:
+            return []
+        best: Dict[int, Tuple[float, MatchKind]] = {}
+        for i in self._prefix_ids(key, limit):
+            best[i] = (2 + len(key) / len(self._keys[i]), "exact" if self._keys[i] == key else "prefix")
+        for i in self._word_prefix_ids(key, limit):
+            if i not in best:
+                best[i] = (1 + len(key) / len(self._keys[i]), "word_prefix")
+        if len(best) < limit:
+            for similarity, i in self._fuzzy_scores(key, limit):
+                if i not in best:
+                    best[i] = (similarity, "fuzzy")
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], self._keys[item[0]]))[:limit]
+        return [
+            SearchMatch(self._names[i], [self._values[i], *self._more_values.get(i, ())], match, round(score, 4))
+            for i, (score, match) in ranked
+        ]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from app.data_models.company import Company
 
 class CompanyHandlerInterface(ABC):
@@ -9,5 +9,9 @@ class CompanyHandlerInterface(ABC):
     @abstractmethod
     def get_by_id(self, company_id: int) -> Optional[Company]: ...
 
+    @abstractmethod
+    def get_by_ids(self, company_ids: Iterable[int]) -> Dict[int, Company]:
+        """Resolve many ids at once; unknown ids are left out, the rest keep their first-request order."""
+
     @abstractmethod
     def get_company_from_company_name(self, certificate_name: str) -> Optional[Company]: ...
\ No newline at end of file
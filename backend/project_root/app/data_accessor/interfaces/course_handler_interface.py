@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from app.data_models.course import Course
 
 class CourseHandlerInterface(ABC):
@@ -9,5 +9,9 @@ class CourseHandlerInterface(ABC):
     @abstractmethod
     def get_by_id(self, course_id: str) -> Optional[Course]: ...
 
+    @abstractmethod
+    def get_by_ids(self, course_ids: Iterable[str]) -> Dict[str, Course]:
+        """Resolve many ids at once; unknown ids are left out, the rest keep their first-request order."""
+
     @abstractmethod
     def get_by_course_name_from_certificate_name(self, certificate_name: str) -> Optional[str]: ...
\ No newline at end of file
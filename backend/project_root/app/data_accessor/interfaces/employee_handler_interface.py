@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from app.data_models.employee import Employee
 
 class EmployeeHandlerInterface(ABC):
@@ -9,5 +9,9 @@ class EmployeeHandlerInterface(ABC):
     @abstractmethod
     def get_by_id(self, employee_id: int) -> Optional[Employee]: ...
 
+    @abstractmethod
+    def get_by_ids(self, employee_ids: Iterable[int]) -> Dict[int, Employee]:
+        """Resolve many ids at once; unknown ids are left out, the rest keep their first-request order."""
+
     @abstractmethod
     def get_company_name_from_employee_name(self, employee_name: str) -> Optional[str]: ...
\ No newline at end of file
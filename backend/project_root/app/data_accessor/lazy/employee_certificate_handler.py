@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.lazy.mapped_csv import MappedCsv
+from app.instrumentation.metrics import INDEX_BUILD_SECONDS, timed
+from app.data_accessor.interfaces.employee_certificate_handler_interface import EmployeeCertificateHandlerInterface
+
+KEY_COLUMNS = ("expiry_date", "employee_id", "course_id")
+
+
+class EmployeeCertificateHandler(EmployeeCertificateHandlerInterface):
+    """
+    Concrete implementation of EmployeeCertificateHandlerInterface over a memory-mapped CSV.
+
+    Holds no rows: the file stays mapped and only the rows a query returns are
+    decoded and validated, so resident memory is the line offset index (4-8
+    bytes per row) plus whichever key columns were extracted (12 bytes per
+    row for expiry dates, 8 for employee ids, 4 for course ids). Queries on a key
+    that was not extracted fall back to validating every row. Invalid rows
+    are skipped at query time, as the other handlers skip them at load time.
+
+    A standalone accessor for tools and scripts that query a large file
+    without loading it; the app's services do not use it (their aggregate
+    indexes need every row). The file is mapped at its size when the
+    handler is built, so rows appended later are not seen, and truncating
+    the file in place while it is mapped makes reads fault. Hold it in a
+    ReloadableDataset refreshed before use, which maps a new handler when the
+    file's size or mtime changes, and rewrite the file by atomic replace (the
+    old mapping keeps the old file alive) rather than in place.
+    """
+    def __init__(self, file_path: Path, key_columns: Optional[Sequence[str]] = KEY_COLUMNS):
+        unknown = set(key_columns or ()) - set(KEY_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unsupported key columns: {sorted(unknown)}")
+        self.file_path = file_path
+        self.csv = MappedCsv(file_path, EmployeeCertificate)
+        self.key_columns = tuple(c for c in KEY_COLUMNS if c in (key_columns or ()))
+        # Row numbers with a parseable expiry date, sorted by it (ties in file order)
+        self._expiry_rows: Optional[np.ndarray] = None
+        self._expiry_date: Optional[np.ndarray] = None
+        # -1 where the employee id is missing or not an integer
+        self._employee_id: Optional[np.ndarray] = None
+        # Per-row code into _course_codes, -1 where missing
+        self._course_code: Optional[np.ndarray] = None
+        self._course_codes: Dict[str, int] = {}
+        if self.key_columns:
+            with timed(INDEX_BUILD_SECONDS, index="lazy_certificate_keys"):
+                self._extract_keys()
+
+    def _extract_keys(self) -> None:
+        expiry: List[np.ndarray] = []
+        employee: List[np.ndarray] = []
+        course: List[np.ndarray] = []
+        for frame in self.csv.read_columns(self.key_columns):
+            if "expiry_date" in frame:
+                parsed = pd.to_datetime(frame["expiry_date"], format="ISO8601", errors="coerce")
+                expiry.append(parsed.to_numpy().astype("datetime64[D]"))
+            if "employee_id" in frame:
+                ids = pd.to_numeric(frame["employee_id"], errors="coerce")
+                employee.append(ids.fillna(-1).to_numpy().astype(np.int64))
+            if "course_id" in frame:
+                codes, uniques = pd.factorize(frame["course_id"])
+                # Index -1 (missing) picks the appended -1
+                local = np.array([self._course_codes.setdefault(u, len(self._course_codes)) for u in uniques] + [-1], dtype=np.int32)
+                course.append(local[codes])
+        rows = sum(map(len, expiry or employee or course))
+        if rows != len(self.csv):
+            raise ValueError(
+                f"{self.file_path}: {rows} rows parsed but {len(self.csv)} lines indexed; "
+                "quoted fields must not contain newlines"
+            )
+        if expiry:
+            days = np.concatenate(expiry)
+            valid = np.flatnonzero(~np.isnat(days))
+            order = np.argsort(days[valid], kind="stable")
+            self._expiry_rows = valid[order].astype(np.uint32 if len(days) < 2**32 else np.int64)
+            self._expiry_date = days[self._expiry_rows]
+        if employee:
+            self._employee_id = np.concatenate(employee)
+        if course:
+            self._course_code = np.concatenate(course)
+
+    def __len__(self) -> int:
+        """Number of data lines, including any blank or invalid ones."""
+        return len(self.csv)
+
+    @property
+    def key_bytes(self) -> int:
+        """Memory held by the line index and the extracted key arrays."""
+        arrays = (self._expiry_rows, self._expiry_date, self._employee_id, self._course_code)
+        return self.csv.index_bytes + sum(a.nbytes for a in arrays if a is not None)
+
+    def close(self) -> None:
+        self.csv.close()
+
+    def warm_up(self) -> None:
+        """Nothing to load: the keys are extracted when the handler is built and rows are read on demand."""
+
+    def load_all(self) -> List[EmployeeCertificate]:
+        """
+        Validate and return every certificate, in source file order.
+        """
+        return list(self.csv.iter_all())
+
+    def get_by_id(self, name: int) -> Optional[EmployeeCertificate]:
+        """
+        Retrieve a certificate by its row id (0-based position in the source file).
+        """
+        if not 0 <= name < len(self.csv):
+            return None
+        found = self.csv.rows([name])
+        return found[0] if found else None
+
+    def get_certificates_exprining_in_time_range(self, start_data: datetime, end_data: datetime) -> Optional[List[EmployeeCertificate]]:
+        """
+        Retrieve certificates expiring between the given dates (inclusive), sorted by expiry date.
+        """
+        return self.get_expired_employee_certificates_by_date_range(_as_date(start_data), _as_date(end_data))
+
+    def get_expired_employee_certificates_by_date_range(self, start_date: Optional[date], end_date: Optional[date]) -> List[EmployeeCertificate]:
+        """
+        Retrieve certificates expiring within a date range, sorted by expiry date.
+        """
+        if self._expiry_rows is None or self._expiry_date is None:
+            found = [
+                c for c in self.csv.iter_all()
+                if (start_date is None or c.expiry_date >= start_date) and (end_date is None or c.expiry_date <= end_date)
+            ]
+            return sorted(found, key=lambda c: c.expiry_date)
+        lo = 0 if start_date is None else int(np.searchsorted(self._expiry_date, np.datetime64(start_date, "D"), side="left"))
+        hi = len(self._expiry_date) if end_date is None else int(np.searchsorted(self._expiry_date, np.datetime64(end_date, "D"), side="right"))
+        return self.csv.rows(self._expiry_rows[lo:hi].tolist())
+
+    def get_employee_certificates_by_employee_id(self, employee_id: int) -> List[EmployeeCertificate]:
+        """
+        Retrieve all certificates for a specific employee by their ID.
+        """
+        if self._employee_id is None:
+            return [c for c in self.csv.iter_all() if c.employee_id == employee_id]
+        rows = np.flatnonzero(self._employee_id == employee_id).tolist()
+        # The extracted id is a coarse filter; the validated value decides
+        return [c for c in self.csv.rows(rows) if c.employee_id == employee_id]
+
+    def get_employee_certificates_by_course_id(self, course_id: str) -> List[EmployeeCertificate]:
+        """
+        Retrieve all certificates for a specific course by its ID.
+        """
+        if self._course_code is None:
+            return [c for c in self.csv.iter_all() if c.course_id == course_id]
+        code = self._course_codes.get(course_id)
+        if code is None:
+            return []
+        return self.csv.rows(np.flatnonzero(self._course_code == code).tolist())
+
+
+def _as_date(value: datetime | date) -> date:
+    return value.date() if isinstance(value, datetime) else value
@@ -0,0 +1,109 @@
+import csv
+import mmap
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from pydantic import BaseModel
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from app.data_accessor.row_validation import RowError, RowErrorCallback, log_row_error, validate_rows
+
+T = TypeVar("T", bound=BaseModel)
+
+# Bytes scanned for newlines per step while indexing, bounding the temporary arrays
+DEFAULT_INDEX_BLOCK_BYTES = 64 * 2**20
+# Rows per pandas chunk when extracting columns
+DEFAULT_COLUMN_CHUNK_ROWS = 1_000_000
+
+
+class MappedCsv(Generic[T]):
+    """
+    Read-only memory map of a CSV file plus the start offset of every data line.
+
+    Opening the file costs one vectorized pass for newlines; nothing is
+    decoded. Rows are decoded and validated only when asked for, straight
+    from the mapped pages, which the OS shares between every process mapping
+    the same file. Row numbers are 0-based data line numbers (file line - 2);
+    blank lines keep their number but hold no row. As with split_ranges,
+    quoted fields must not contain newlines.
+    """
+    def __init__(self, file_path: Path, model: Type[T], block_bytes: int = DEFAULT_INDEX_BLOCK_BYTES):
+        self.file_path = file_path
+        self.model = model
+        # Rows rejected by the most recent read
+        self.errors: List[RowError] = []
+        with file_path.open("rb") as f:
+            size = f.seek(0, 2)
+            self._data: Union[mmap.mmap, bytes] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        header_end = self._data.find(b"\n") + 1 or len(self._data)
+        self.header: List[str] = next(csv.reader([self._data[:header_end].decode("utf-8-sig")]), [])
+        self._starts = self._index_lines(header_end, block_bytes)
+
+    def _index_lines(self, header_end: int, block_bytes: int) -> np.ndarray:
+        size = len(self._data)
+        starts = [np.array([header_end], dtype=np.int64)]
+        for offset in range(header_end, size, block_bytes):
+            block = np.frombuffer(self._data, dtype=np.uint8, count=min(block_bytes, size - offset), offset=offset)
+            starts.append(np.flatnonzero(block == ord("\n")) + (offset + 1))
+            # Release the exported buffer so the map can be closed
+            del block
+        offsets = np.concatenate(starts)
+        # A newline at the very end starts no line
+        offsets = offsets[offsets < size]
+        return offsets.astype(np.uint32 if size < 2**32 else np.uint64)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def index_bytes(self) -> int:
+        """Memory held by the line offset index."""
+        return int(self._starts.nbytes)
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def _record_error(self, error: RowError) -> None:
+        self.errors.append(error)
+        log_row_error(error)
+
+    def line(self, row: int) -> str:
+        """The raw text of one data line, without its line ending."""
+        start = int(self._starts[row])
+        end = self._data.find(b"\n", start)
+        return self._data[start:end if end != -1 else len(self._data)].decode("utf-8").rstrip("\r")
+
+    def _parsed(self, rows: Iterable[int]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        for row in rows:
+            values = next(csv.reader([self.line(row)]), None)
+            # Blank lines hold no row, as with csv.DictReader
+            if values:
+                yield row + 2, dict(zip(self.header, values))
+
+    def rows(self, rows: Iterable[int], on_error: Optional[RowErrorCallback] = None) -> List[T]:
+        """Decode and validate the given rows, in the order given.
+
+        Invalid rows are reported to on_error (default: recorded in
+        self.errors) and skipped; out-of-range row numbers raise IndexError.
+        """
+        self.errors = []
+        return list(validate_rows(self.model, self._parsed(rows), on_error or self._record_error))
+
+    def iter_all(self, on_error: Optional[RowErrorCallback] = None) -> Iterator[T]:
+        """Stream every row as a validated model, in file order."""
+        self.errors = []
+        yield from validate_rows(self.model, self._parsed(range(len(self))), on_error or self._record_error)
+
+    def read_columns(self, columns: Sequence[str], chunk_rows: int = DEFAULT_COLUMN_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """Stream the named columns as strings through pandas' C parser, chunk_rows rows at a time.
+
+        Frames have one row per data line, so their positions are row numbers;
+        blank lines come through as NaN.
+        """
+        with pd.read_csv(
+            self.file_path, usecols=list(columns), dtype=str, skip_blank_lines=False,
+            chunksize=chunk_rows, memory_map=True,
+        ) as reader:
+            yield from reader
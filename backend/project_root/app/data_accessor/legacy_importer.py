@@ -0,0 +1,285 @@
+"""
+Streaming import of the legacy business/contact/course export into the CSV datasets.
+
+    python -m app.data_accessor.legacy_importer data/business_names_with_contacts_course_with_dates.csv data
+"""
+import os
+import re
+import csv
+import logging
+
+from pathlib import Path
+from calendar import monthrange
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+import typer
+
+from app.data_models.course import Course
+from app.data_models.company import Company
+from app.data_models.employee import Employee
+from app.data_accessor.company_handler import CompanyHandler
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_accessor.row_validation import RowError, log_row_error
+from app.data_accessor.indexes.name_index import full_name_key, normalize_name
+
+logger = logging.getLogger(__name__)
+
+LEGACY_COLUMNS = ("Business Name", "Contact Name", "Course", "Course Date")
+DEFAULT_VALIDITY_MONTHS = 36
+DEFAULT_DEPARTMENT = "Unassigned"
+DEFAULT_EMAIL_DOMAIN = "example.com"
+
+_COURSE_ID = re.compile(r"c-(\d+)")
+
+
+@dataclass(frozen=True)
+class ValidityPeriods:
+    """How long a certificate stays valid after its course date, in months, optionally per course name."""
+    default_months: int = DEFAULT_VALIDITY_MONTHS
+    by_course: Mapping[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Course names match case- and whitespace-insensitively
+        object.__setattr__(self, "by_course", {normalize_name(k): v for k, v in self.by_course.items()})
+
+    def expiry(self, course_name: str, issued: date) -> date:
+        return _add_months(issued, self.by_course.get(normalize_name(course_name), self.default_months))
+
+
+@dataclass
+class LegacyImportResult:
+    rows: Dict[str, int] = field(default_factory=dict)
+    errors: List[RowError] = field(default_factory=list)
+
+
+def _add_months(day: date, months: int) -> date:
+    # Clamp to the end of shorter months, e.g. Feb 29 + 12 months -> Feb 28
+    year, month = divmod(day.month - 1 + months, 12)
+    year += day.year
+    return date(year, month + 1, min(day.day, monthrange(year, month + 1)[1]))
+
+
+def _slug(text: str, separator: str) -> str:
+    return re.sub(r"[^a-z0-9]+", separator, normalize_name(text)).strip(separator)
+
+
+class _Entities:
+    """
+    Distinct companies, employees and courses seen so far, keyed by normalized name.
+
+    Ids are handed out in order of first appearance, after any ids already
+    present in the output directory, so re-importing a grown export keeps
+    every existing id.
+    """
+    def __init__(self, email_domain: str, department: str):
+        self.email_domain = email_domain
+        self.department = department
+        self.companies: Dict[str, Company] = {}
+        self.employees: Dict[Tuple[str, str], Employee] = {}
+        self.courses: Dict[str, Course] = {}
+        self._emails: Set[str] = set()
+        self._next_company_id = 1
+        self._next_employee_id = 1
+        self._next_course_id = 1
+
+    def seed(self, out_dir: Path) -> None:
+        """Keep the ids of a previous import into out_dir."""
+        if (out_dir / "companies.csv").exists():
+            for company in CompanyHandler(out_dir / "companies.csv").load_all():
+                self.companies.setdefault(normalize_name(company.company_name), company)
+                self._next_company_id = max(self._next_company_id, company.company_id + 1)
+        if (out_dir / "employees.csv").exists():
+            for employee in EmployeeHandler(out_dir / "employees.csv").load_all():
+                key = (full_name_key(employee.first_name, employee.last_name), normalize_name(employee.company_name))
+                self.employees.setdefault(key, employee)
+                self._emails.add(employee.email.casefold())
+                self._next_employee_id = max(self._next_employee_id, employee.employee_id + 1)
+        if (out_dir / "courses.csv").exists():
+            for course in CourseHandler(out_dir / "courses.csv").load_all():
+                self.courses.setdefault(normalize_name(course.course_name), course)
+                match = _COURSE_ID.fullmatch(course.course_id)
+                if match:
+                    self._next_course_id = max(self._next_course_id, int(match.group(1)) + 1)
+
+    def company(self, name: str) -> Company:
+        key = normalize_name(name)
+        company = self.companies.get(key)
+        if company is None:
+            company_id, self._next_company_id = self._next_company_id, self._next_company_id + 1
+            domain = f"{_slug(name, '-') or f'company-{company_id}'}.{self.email_domain}"
+            company = self.companies[key] = Company(
+                company_id=company_id, company_name=" ".join(name.split()), company_email=f"info@{domain}",
+            )
+        return company
+
+    def employee(self, contact_name: str, company: Company) -> Employee:
+        key = (normalize_name(contact_name), normalize_name(company.company_name))
+        employee = self.employees.get(key)
+        if employee is None:
+            employee_id, self._next_employee_id = self._next_employee_id, self._next_employee_id + 1
+            first_name, _, last_name = " ".join(contact_name.split()).partition(" ")
+            local = _slug(contact_name, ".") or f"employee.{employee_id}"
+            domain = company.company_email.partition("@")[2]
+            email = f"{local}@{domain}"
+            # Names that differ only in punctuation would share an address
+            if email.casefold() in self._emails:
+                email = f"{local}.{employee_id}@{domain}"
+            self._emails.add(email.casefold())
+            employee = self.employees[key] = Employee(
+                employee_id=employee_id, first_name=first_name, last_name=last_name,
+                company_name=company.company_name, department=self.department, email=email,
+            )
+        return employee
+
+    def course(self, name: str) -> Course:
+        key = normalize_name(name)
+        course = self.courses.get(key)
+        if course is None:
+            course_id, self._next_course_id = self._next_course_id, self._next_course_id + 1
+            course_name = " ".join(name.split())
+            course = self.courses[key] = Course(
+                course_id=f"c-{course_id}", course_name=course_name, certificate_name=f"{course_name} Certification",
+            )
+        return course
+
+
+def _legacy_rows(source: Path, on_error: List[RowError]) -> Iterator[Tuple[Dict[str, str], date]]:
+    with source.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        missing = set(LEGACY_COLUMNS) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{source} is missing columns: {sorted(missing)}")
+        for row in reader:
+            blank = [c for c in LEGACY_COLUMNS if not (row.get(c) or "").strip()]
+            try:
+                if blank:
+                    raise ValueError(f"empty {', '.join(blank)}")
+                issued = date.fromisoformat(row["Course Date"].strip())
+            except ValueError as exc:
+                error = RowError(reader.line_num, row, str(exc))
+                log_row_error(error)
+                on_error.append(error)
+                continue
+            yield row, issued
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_suffix(f".tmp-{os.getpid()}")
+
+
+def _write_csv(path: Path, header: Tuple[str, ...], rows: Iterable[Tuple[object, ...]]) -> None:
+    with _tmp_path(path).open("w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def import_legacy_csv(
+    source: Path,
+    out_dir: Path,
+    validity: Optional[ValidityPeriods] = None,
+    email_domain: str = DEFAULT_EMAIL_DOMAIN,
+    department: str = DEFAULT_DEPARTMENT,
+) -> LegacyImportResult:
+    """
+    Normalize a legacy export (Business Name, Contact Name, Course, Course Date)
+    into companies.csv, employees.csv, courses.csv and employee_certs.csv in out_dir.
+
+    One pass over the source: each row looks up or creates its company,
+    employee (contact name within a company) and course in hash maps, and its
+    certificate (issued on the course date, expiring after the course's
+    validity period) is written out immediately. Memory is therefore bounded
+    by the number of distinct entities, not rows. The legacy format has no
+    emails or departments, so emails are derived from the names and
+    email_domain, and every employee gets department. Invalid rows are logged
+    and skipped. Outputs are written to temporary files and renamed into place
+    once all four are complete, so no file is ever seen half-written. The
+    renames are separate steps: the entity files go first and
+    employee_certs.csv last, so a reader between them may see new entities
+    with the previous certificates, but never a certificate whose employee or
+    course is missing.
+    """
+    validity = validity or ValidityPeriods()
+    result = LegacyImportResult()
+    entities = _Entities(email_domain, department)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    entities.seed(out_dir)
+
+    certificates = 0
+
+    def certificate_rows() -> Iterator[Tuple[object, ...]]:
+        nonlocal certificates
+        for row, issued in _legacy_rows(source, result.errors):
+            company = entities.company(row["Business Name"])
+            employee = entities.employee(row["Contact Name"], company)
+            course = entities.course(row["Course"])
+            certificates += 1
+            yield (
+                employee.employee_id, course.course_id, course.certificate_name,
+                issued.isoformat(), validity.expiry(course.course_name, issued).isoformat(),
+            )
+
+    # Certificates stream straight to disk; the entity files are written once all rows are seen
+    outputs = [out_dir / name for name in ("employee_certs.csv", "companies.csv", "employees.csv", "courses.csv")]
+    try:
+        _write_csv(outputs[0], ("employee_id", "course_id", "certificate_name", "issue_date", "expiry_date"), certificate_rows())
+        _write_csv(
+            outputs[1], ("company_id", "company_name", "company_email"),
+            ((c.company_id, c.company_name, c.company_email) for c in entities.companies.values()),
+        )
+        _write_csv(
+            outputs[2], ("employee_id", "first_name", "last_name", "company_name", "department", "email"),
+            ((e.employee_id, e.first_name, e.last_name, e.company_name, e.department, e.email) for e in entities.employees.values()),
+        )
+        _write_csv(
+            outputs[3], ("course_id", "course_name", "certificate_name"),
+            ((c.course_id, c.course_name, c.certificate_name) for c in entities.courses.values()),
+        )
+    except BaseException:
+        for path in outputs:
+            _tmp_path(path).unlink(missing_ok=True)
+        raise
+    # Entities before the certificates that refer to them
+    for path in outputs[1:] + outputs[:1]:
+        os.replace(_tmp_path(path), path)
+
+    result.rows = {
+        "companies": len(entities.companies),
+        "employees": len(entities.employees),
+        "courses": len(entities.courses),
+        "employee_certificates": certificates,
+    }
+    logger.info("Imported %s from %s into %s (%d rejected)", result.rows, source, out_dir, len(result.errors))
+    return result
+
+
+def _parse_course_validity(values: List[str]) -> Dict[str, int]:
+    periods: Dict[str, int] = {}
+    for value in values:
+        name, sep, months = value.rpartition("=")
+        if not sep or not name.strip() or not months.strip().isdigit():
+            raise typer.BadParameter(f"expected COURSE=MONTHS, got {value!r}")
+        periods[name] = int(months)
+    return periods
+
+
+def main(
+    source: Path = typer.Argument(
+        Path("data/business_names_with_contacts_course_with_dates.csv"), help="Legacy export to import",
+    ),
+    out_dir: Path = typer.Argument(Path("data"), help="Directory to write the CSV datasets to"),
+    validity_months: int = typer.Option(DEFAULT_VALIDITY_MONTHS, help="Months a certificate stays valid"),
+    course_validity: List[str] = typer.Option([], help="Per-course override as COURSE=MONTHS; repeatable"),
+    email_domain: str = typer.Option(DEFAULT_EMAIL_DOMAIN, help="Domain for derived company and employee emails"),
+    department: str = typer.Option(DEFAULT_DEPARTMENT, help="Department given to every imported employee"),
+) -> None:
+    logging.basicConfig(level=logging.INFO)
+    validity = ValidityPeriods(validity_months, _parse_course_validity(course_validity))
+    result = import_legacy_csv(source, out_dir, validity, email_domain, department)
+    typer.echo(f"{out_dir}: rows {result.rows}, rejected {len(result.errors)}")
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+from datetime import date
+from typing import List, Optional
+
+from app.data_models.employee_certificate import EmployeeCertificate
+
+
+class CertificateStore:
+    """
+    Columnar, NumPy-backed certificate storage.
+
+    Rows are kept sorted by expiry_date so date ranges resolve with
+    `searchsorted`; employee and course filters run as vectorized masks over
+    integer arrays (course_id and certificate_name are dictionary-encoded).
+    Pydantic objects are only created for the rows a query returns.
+    """
+    def __init__(self, df: pd.DataFrame):
+        expiry = pd.to_datetime(df["expiry_date"], format="ISO8601").to_numpy().astype("datetime64[D]")
+        order = np.argsort(expiry, kind="stable")
+
+        self.expiry_date: np.ndarray = expiry[order]
+        self.issue_date: np.ndarray = (
+            pd.to_datetime(df["issue_date"], format="ISO8601").to_numpy().astype("datetime64[D]")[order]
+        )
+        self.employee_id: np.ndarray = df["employee_id"].to_numpy().astype(np.int64)[order]
+
+        course_codes, course_ids = pd.factorize(df["course_id"].astype(str))
+        self.course_code: np.ndarray = course_codes.astype(np.int32)[order]
+        self.course_ids: np.ndarray = np.asarray(course_ids, dtype=object)
+        self._course_lookup = {course_id: code for code, course_id in enumerate(self.course_ids)}
+
+        name_codes, certificate_names = pd.factorize(df["certificate_name"].astype(str))
+        self.certificate_code: np.ndarray = name_codes.astype(np.int32)[order]
+        self.certificate_names: np.ndarray = np.asarray(certificate_names, dtype=object)
+
+        # Row id = position in the source file; position_of maps it to the sorted position
+        self.row_id: np.ndarray = order.astype(np.int64)
+        self.position_of: np.ndarray = np.empty_like(self.row_id)
+        self.position_of[order] = np.arange(len(order), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.expiry_date)
+
+    def expiry_range(self, start: Optional[date], end: Optional[date]) -> np.ndarray:
+        """Sorted positions with start <= expiry_date <= end; either bound may be None."""
+        lo = 0 if start is None else int(np.searchsorted(self.expiry_date, np.datetime64(start, "D"), side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.expiry_date, np.datetime64(end, "D"), side="right"))
+        return np.arange(lo, max(lo, hi), dtype=np.int64)
+
+    def employee_rows(self, employee_id: int) -> np.ndarray:
+        return self._in_file_order(np.flatnonzero(self.employee_id == employee_id))
+
+    def course_rows(self, course_id: str) -> np.ndarray:
+        code = self._course_lookup.get(course_id)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return self._in_file_order(np.flatnonzero(self.course_code == code))
+
+    def all_rows(self) -> np.ndarray:
+        """Every position, in source file order."""
+        return self.position_of
+
+    def _in_file_order(self, positions: np.ndarray) -> np.ndarray:
+        return positions[np.argsort(self.row_id[positions], kind="stable")]
+
+    def materialize(self, positions: np.ndarray) -> List[EmployeeCertificate]:
+        """Build EmployeeCertificate models for the given positions only."""
+        # The handler drops rows with missing or unparseable values before building
+        # the store, and the columns were typed then, so skip re-validation
+        employee_ids = self.employee_id[positions].tolist()
+        course_ids = self.course_ids[self.course_code[positions]].tolist()
+        names = self.certificate_names[self.certificate_code[positions]].tolist()
+        issue_dates = self.issue_date[positions].astype(object).tolist()
+        expiry_dates = self.expiry_date[positions].astype(object).tolist()
+        return [
+            EmployeeCertificate.model_construct(
+                employee_id=employee_id,
+                course_id=course_id,
+                certificate_name=name,
+                issue_date=issue_date,
+                expiry_date=expiry_date,
+            )
+            for employee_id, course_id, name, issue_date, expiry_date
+            in zip(employee_ids, course_ids, names, issue_dates, expiry_dates)
+        ]
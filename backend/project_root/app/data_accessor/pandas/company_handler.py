@@ -1,15 +1,17 @@
 from pathlib import Path
 from typing import Optional, Dict, Any
 from app.data_models.company import Company
+from app.data_accessor.chunk_validation import ParallelLoad
 from app.data_accessor.pandas.pandas_handler import PandasHandler
 from app.data_accessor.interfaces.company_handler_interface import CompanyHandlerInterface
 
 class CompanyHandler(PandasHandler[Company], CompanyHandlerInterface):
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, parallel: Optional[ParallelLoad] = None):
         super().__init__(
             file_path,
             Company,
-            index_col="company_id"
+            index_col="company_id",
+            parallel=parallel,
         )
 
     def get_by_id(self, company_id: int) -> Optional[Company]:
@@ -2,6 +2,7 @@ from pathlib import Path
 #from typing import Optional, Dict, Any
 from typing import Optional
 from app.data_models.course import Course
+from app.data_accessor.chunk_validation import ParallelLoad
 from app.data_accessor.pandas.pandas_handler import PandasHandler
 from app.data_accessor.interfaces.course_handler_interface import CourseHandlerInterface
 
@@ -9,11 +10,12 @@ class CourseHandler(PandasHandler[Course], CourseHandlerInterface):
     """
     Concrete implementation of CourseHandlerInterface using PandasHandler.
     """
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, parallel: Optional[ParallelLoad] = None):
         super().__init__(
             file_path,
             Course,
-            index_col="course_id"
+            index_col="course_id",
+            parallel=parallel,
         )
 
     def get_by_id(self, course_id: str) -> Optional[Course]:
@@ -0,0 +1,101 @@
+import pandas as pd
+
+from pathlib import Path
+from datetime import date, datetime
+from typing import List, Optional, Set
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.chunk_validation import ParallelLoad
+from app.data_accessor.row_validation import RowError, validate_rows
+from app.data_accessor.pandas.pandas_handler import PandasHandler
+from app.data_accessor.pandas.certificate_store import CertificateStore
+from app.data_accessor.interfaces.employee_certificate_handler_interface import EmployeeCertificateHandlerInterface
+
+class EmployeeCertificateHandler(PandasHandler[EmployeeCertificate], EmployeeCertificateHandlerInterface):
+    """
+    Concrete implementation of EmployeeCertificateHandlerInterface backed by a columnar CertificateStore.
+    """
+    def __init__(self, file_path: Path, parallel: Optional[ParallelLoad] = None):
+        super().__init__(file_path, EmployeeCertificate, parallel=parallel)
+        self.store = CertificateStore(self._valid_rows(self.df))
+        # The store holds everything queries need; don't keep the text columns twice
+        self.df = self.df.iloc[0:0]
+
+    def _valid_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop rows the store cannot hold faithfully: missing values (which
+        would become "nan" strings) and ids or dates that do not parse.
+
+        The store builds models without validation, so those rows are run
+        through the model here instead; failures are recorded in self.errors
+        and skipped like in load_all, and rows that do pass keep their
+        validated values.
+        """
+        self.errors = []
+        employee_ids = pd.to_numeric(df["employee_id"], errors="coerce")
+        suspect = (
+            df[list(EmployeeCertificate.model_fields)].isna().any(axis=1)
+            | employee_ids.isna()
+            | (employee_ids % 1 != 0)
+            | pd.to_datetime(df["issue_date"], format="ISO8601", errors="coerce").isna()
+            | pd.to_datetime(df["expiry_date"], format="ISO8601", errors="coerce").isna()
+        )
+        if not suspect.any():
+            return df
+        positions = suspect.to_numpy().nonzero()[0].tolist()
+        rejected: Set[int] = set()
+
+        def reject(error: RowError) -> None:
+            rejected.add(error.line)
+            self._record_error(error)
+
+        # Line numbers count the header as line 1
+        rows = zip((p + 2 for p in positions), self._frame_rows(df.iloc[positions], 0))
+        passed = list(validate_rows(self.model, ((line, row) for line, (_, row) in rows), reject))
+        kept = [position for position in positions if position + 2 not in rejected]
+        valid = df[~suspect.to_numpy()]
+        if not kept:
+            return valid.reset_index(drop=True)
+        repaired = pd.DataFrame([m.model_dump(mode="json") for m in passed], index=kept)
+        return pd.concat([valid, repaired]).sort_index().reset_index(drop=True)
+
+    def load_all(self) -> List[EmployeeCertificate]:
+        """
+        Materialize every certificate, in source file order.
+        """
+        return self.store.materialize(self.store.all_rows())
+
+    def get_by_id(self, name: int) -> Optional[EmployeeCertificate]:
+        """
+        Retrieve a certificate by its row id (0-based position in the source file).
+        """
+        if not 0 <= name < len(self.store):
+            return None
+        return self.store.materialize(self.store.position_of[[name]])[0]
+
+    def get_certificates_exprining_in_time_range(self, start_data: datetime, end_data: datetime) -> Optional[List[EmployeeCertificate]]:
+        """
+        Retrieve certificates expiring between the given dates (inclusive), sorted by expiry date.
+        """
+        return self.get_expired_employee_certificates_by_date_range(_as_date(start_data), _as_date(end_data))
+
+    def get_expired_employee_certificates_by_date_range(self, start_date: Optional[date], end_date: Optional[date]) -> List[EmployeeCertificate]:
+        """
+        Retrieve certificates expiring within a date range, sorted by expiry date.
+        """
+        return self.store.materialize(self.store.expiry_range(start_date, end_date))
+
+    def get_employee_certificates_by_employee_id(self, employee_id: int) -> List[EmployeeCertificate]:
+        """
+        Retrieve all certificates for a specific employee by their ID.
+        """
+        return self.store.materialize(self.store.employee_rows(employee_id))
+
+    def get_employee_certificates_by_course_id(self, course_id: str) -> List[EmployeeCertificate]:
+        """
+        Retrieve all certificates for a specific course by its ID.
+        """
+        return self.store.materialize(self.store.course_rows(course_id))
+
+
+def _as_date(value: datetime | date) -> date:
+    return value.date() if isinstance(value, datetime) else value
@@ -1,16 +1,29 @@
 from pathlib import Path
 from typing import Optional, Dict, Any
 from app.data_models.employee import Employee
+from app.data_accessor.indexes.name_index import NameIndex
+from app.data_accessor.chunk_validation import ParallelLoad
 from app.data_accessor.pandas.pandas_handler import PandasHandler
 from app.data_accessor.interfaces.employee_handler_interface import EmployeeHandlerInterface
 
 class EmployeeHandler(PandasHandler[Employee], EmployeeHandlerInterface):
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, parallel: Optional[ParallelLoad] = None):
         super().__init__(
             file_path,
             Employee,
-            index_col="employee_id"
+            index_col="employee_id",
+            parallel=parallel,
         )
+        self._name_index: Optional[NameIndex[Any]] = None
+
+    @property
+    def name_index(self) -> NameIndex[Any]:
+        """Case-insensitive full-name -> employee_id index, built once per load."""
+        if self._name_index is None:
+            self._name_index = NameIndex(
+                zip(self.df["first_name"], self.df["last_name"], self.df.index)
+            )
+        return self._name_index
 
     def get_by_id(self, employee_id: int) -> Optional[Employee]:
         try:
@@ -24,13 +37,8 @@ class EmployeeHandler(PandasHandler[Employee], EmployeeHandlerInterface):
         return Employee(**row_dict)
 
     def get_company_name_from_employee_name(self, employee_name: str) -> Optional[str]:
-        # Build lowercase full names Series
-        full_names = self.df.apply(
-            lambda r: f"{r['first_name']} {r['last_name']}", axis=1
-        ).str.lower()
-        target = employee_name.lower()
-        matches = full_names[full_names == target]
-        if matches.empty:
+        # First row in file order wins when several employees share a name
+        emp_id = self.name_index.first_by_full_name(employee_name)
+        if emp_id is None:
             return None
-        emp_id = matches.index[0]
         return self.df.at[emp_id, 'company_name']
@@ -1,10 +1,22 @@
+import io
 import pandas as pd
 from pathlib import Path
 from pydantic import BaseModel
-from typing import Generic, Type, TypeVar, List, Optional, Dict, Any
+from typing import Generic, Type, TypeVar, List, Optional, Dict, Any, Iterable, Iterator, Tuple
+
+from app.data_accessor.chunk_validation import FileRange, ParallelLoad, map_ordered, split_ranges
+from app.data_accessor.row_validation import (
+    LoadStats, LoadTimer, RowError, RowErrorCallback, report_load_stats, log_row_error, validate_rows,
+)
 
 T = TypeVar("T", bound=BaseModel)
 
+def read_range_frame(parse_dates: List[str], file_range: FileRange) -> pd.DataFrame:
+    """Parse one byte range of a CSV file; runs in worker processes."""
+    return pd.read_csv(
+        io.BytesIO(file_range.read()), header=None, names=file_range.header, parse_dates=parse_dates,
+    )
+
 class PandasHandler(Generic[T]):
     def __init__(
         self,
@@ -12,21 +24,86 @@ class PandasHandler(Generic[T]):
         model: Type[T],
         parse_dates: Optional[List[str]] = None,
         index_col: Optional[str] = None,
+        parallel: Optional[ParallelLoad] = None,
     ):
         self.file_path = file_path
         self.model = model
+        self.parse_dates = parse_dates or []
+        self.parallel = parallel
+        # Rows rejected during the most recent validation pass
+        self.errors: List[RowError] = []
+        self.last_load_stats: Optional[LoadStats] = None
         # Load CSV into DataFrame with optional date parsing
-        self.df = pd.read_csv(file_path, parse_dates=parse_dates or [])
+        self.df = self._read_frame()
         # Set index for lookups if provided
         if index_col:
             self.df.set_index(index_col, inplace=True)
 
+    def _read_frame(self) -> pd.DataFrame:
+        if self.parallel is None or not self.parallel.applies_to(self.file_path):
+            return pd.read_csv(self.file_path, parse_dates=self.parse_dates)
+        # Parse byte ranges in worker processes and stitch them back together in file order
+        ranges = split_ranges(self.file_path, 4 * self.parallel.workers)
+        frames = list(map_ordered(read_range_frame, ranges, self.parse_dates, workers=self.parallel.workers))
+        return pd.concat(frames, ignore_index=True)
+
+    def _record_error(self, error: RowError) -> None:
+        self.errors.append(error)
+        log_row_error(error)
+
+    @staticmethod
+    def _frame_rows(frame: pd.DataFrame, first_line: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        # Stringify column labels once instead of re-keying every row dict;
+        # line numbers count the header as line 1
+        frame = frame.set_axis([str(c) for c in frame.columns], axis=1)
+        records: List[Dict[str, Any]] = frame.to_dict(orient="records")  # type: ignore[assignment]
+        return enumerate(records, start=first_line)
+
+    def iter_batches(self, size: int, on_error: Optional[RowErrorCallback] = None) -> Iterator[List[T]]:
+        """Stream the CSV from disk in chunks of size rows, validating each chunk.
+
+        Only one chunk is held in memory at a time. Invalid rows are reported
+        to on_error (default: recorded in self.errors) and skipped.
+        """
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+        self.errors = []
+        report = on_error or self._record_error
+        first_line = 2
+        with pd.read_csv(self.file_path, parse_dates=self.parse_dates, chunksize=size) as reader:
+            for chunk in reader:
+                batch = list(validate_rows(self.model, self._frame_rows(chunk, first_line), report))
+                first_line += len(chunk)
+                if batch:
+                    yield batch
+
+    def iter_all(self, on_error: Optional[RowErrorCallback] = None, chunk_size: int = 10_000) -> Iterator[T]:
+        """Stream validated models from disk one row at a time."""
+        for batch in self.iter_batches(chunk_size, on_error):
+            yield from batch
+
     def load_all(self) -> List[T]:
-        # Convert DataFrame rows to list of Pydantic models
-        records = self.df.reset_index().to_dict(orient="records")  # List[Dict[str, Any]]
-        result: List[T] = []
-        for rec in records:
-            # Ensure keys are strings for ** unpacking
-            rec_dict: Dict[str, Any] = {str(k): v for k, v in rec.items()}
-            result.append(self.model(**rec_dict))
+        # Convert the in-memory DataFrame rows to a list of Pydantic models
+        timer = LoadTimer("dataframe")
+        self.errors = []
+        result = list(validate_rows(self.model, self._frame_rows(self.df.reset_index(), 2), self._record_error))
+        self.last_load_stats = timer.stop(len(result), len(self.errors))
+        report_load_stats(self.model, self.last_load_stats)
         return result
+
+    def get_by_ids(self, ids: Iterable[Any]) -> Dict[Any, T]:
+        """Models for many index labels in one vectorized lookup, keyed by label in first-request order.
+
+        Unknown labels are left out; when a label occurs more than once the
+        first row in file order wins.
+        """
+        wanted = list(dict.fromkeys(ids))
+        index = self.df.index
+        if index.is_unique:
+            positions = index.get_indexer(pd.Index(wanted))
+            frame = self.df.iloc[positions[positions >= 0]]
+        else:
+            frame = self.df[index.isin(wanted) & ~index.duplicated()]
+        rows = self._frame_rows(frame.reset_index(), 0)
+        found = {key: self.model(**row) for key, (_, row) in zip(frame.index.tolist(), rows)}
+        return {key: found[key] for key in wanted if key in found}
@@ -0,0 +1,174 @@
+import hashlib
+import logging
+import threading
+
+from pathlib import Path
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Protocol, Tuple, TypeVar, runtime_checkable
+
+logger = logging.getLogger(__name__)
+
+H = TypeVar("H")
+
+# Bytes before the previous end of file that must be unchanged for an append to be trusted
+_TAIL_SIGNATURE_BYTES = 4096
+# Full reloads retry while the file keeps changing underneath them
+_MAX_LOAD_ATTEMPTS = 3
+
+
+@runtime_checkable
+class AppendableHandler(Protocol):
+    def load_records(self) -> List[Any]: ...
+    def iter_appended(self, start: int, end: int) -> Iterator[Any]: ...
+    def seed_cache(self, items: Iterable[Any]) -> None: ...
+
+
+@runtime_checkable
+class WritableHandler(AppendableHandler, Protocol):
+    def append_to_file(self, items: List[Any]) -> None: ...
+
+
+@dataclass(frozen=True)
+class FileState:
+    """What a handler was built from: bytes consumed, mtime and a signature of the last bytes."""
+    size: int
+    mtime_ns: int
+    tail_signature: str
+
+    @classmethod
+    def capture(cls, path: Path, size: Optional[int] = None) -> "FileState":
+        stat = path.stat()
+        end = stat.st_size if size is None else size
+        return cls(end, stat.st_mtime_ns, _tail_signature(path, end))
+
+
+def _tail_signature(path: Path, end: int) -> str:
+    start = max(0, end - _TAIL_SIGNATURE_BYTES)
+    with path.open("rb") as f:
+        f.seek(start)
+        return hashlib.sha1(f.read(end - start)).hexdigest()
+
+
+class ReloadableDataset(Generic[H]):
+    """
+    Holds the current handler for one CSV file and rebuilds it when the file changes.
+
+    Changes are detected from size and mtime. When the file only grew and the
+    bytes before the old end are unchanged, only the new complete lines are
+    parsed and appended to a copy of the cached rows (handlers that support
+    `load_records` and `seed_cache`); any other change triggers a full
+    reload. The new handler is built off to the side and swapped in with a
+    single assignment, so readers never observe a half-built dataset.
+    """
+    def __init__(self, file_path: Path, factory: Callable[[], H]):
+        self.file_path = file_path
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._handler: Optional[H] = None
+        self._state: Optional[FileState] = None
+        self.version = 0
+
+    def current(self) -> H:
+        """Return the live handler, loading it on first use."""
+        handler = self._handler
+        if handler is None:
+            with self._lock:
+                if self._handler is None:
+                    self._swap(*self._load_full())
+                handler = self._handler
+        assert handler is not None
+        return handler
+
+    def current_with_state(self) -> Tuple[H, FileState]:
+        """Return the live handler together with the file state it was built from."""
+        self.current()
+        with self._lock:
+            assert self._handler is not None and self._state is not None
+            return self._handler, self._state
+
+    def refresh(self) -> bool:
+        """Pick up changes to the file; returns True when a new handler was swapped in."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> bool:
+        if self._handler is None or self._state is None:
+            self._swap(*self._load_full())
+            return True
+        stat = self.file_path.stat()
+        if stat.st_size == self._state.size and stat.st_mtime_ns == self._state.mtime_ns:
+            return False
+        appended = self._load_appended(self._handler, self._state, stat.st_size)
+        if appended is None:
+            self._swap(*self._load_full())
+            return True
+        handler, state = appended
+        if state.size == self._state.size:
+            # Only a partial line so far; wait for the writer to finish it
+            return False
+        self._swap(handler, state)
+        return True
+
+    def append(self, items: List[Any]) -> H:
+        """
+        Write items to the end of the file and swap in a handler that has them cached.
+
+        Pending changes to the file are picked up first; the file is not
+        re-read afterwards, and the recorded state covers the written rows so
+        the next `refresh` does not ingest them twice.
+        """
+        with self._lock:
+            self._refresh()
+            old = self._handler
+            if not isinstance(old, WritableHandler):
+                raise TypeError(f"{type(old).__name__} does not support appending rows")
+            old.append_to_file(items)
+            handler = self._factory()
+            assert isinstance(handler, WritableHandler)
+            handler.seed_cache(list(old.load_records()) + list(items))
+            self._swap(handler, FileState.capture(self.file_path))
+            logger.info("Wrote %d rows to %s", len(items), self.file_path)
+            return handler
+
+    def _swap(self, handler: H, state: FileState) -> None:
+        self._handler, self._state = handler, state
+        self.version += 1
+
+    def _load_full(self) -> Tuple[H, FileState]:
+        for _ in range(_MAX_LOAD_ATTEMPTS):
+            before = FileState.capture(self.file_path)
+            handler = self._factory()
+            # Warm the handler's cache, in its compact form where it has one;
+            # handlers that read rows on demand say how to warm up instead
+            load = (
+                getattr(handler, "warm_up", None) or getattr(handler, "load_records", None) or getattr(handler, "load_all", None)
+            )
+            if callable(load):
+                load()
+            if FileState.capture(self.file_path) == before:
+                break
+        logger.info("Loaded %s (%d bytes)", self.file_path, before.size)
+        return handler, before
+
+    def _load_appended(self, old: H, state: FileState, size: int) -> Optional[Tuple[H, FileState]]:
+        if not isinstance(old, AppendableHandler) or size <= state.size:
+            return None
+        if _tail_signature(self.file_path, state.size) != state.tail_signature:
+            return None
+        with self.file_path.open("rb") as f:
+            if state.size > 0:
+                f.seek(state.size - 1)
+                if f.read(1) != b"\n":
+                    return None
+            tail = f.read(size - state.size)
+        end = state.size + tail.rfind(b"\n") + 1
+        if end == state.size:
+            return old, state
+        handler = self._factory()
+        assert isinstance(handler, AppendableHandler)
+        old_rows = old.load_records()
+        # Streamed, so handlers with a compact form never hold the new rows as models
+        handler.seed_cache(chain(old_rows, handler.iter_appended(state.size, end)))
+        logger.info("Appended %d rows from %s", len(handler.load_records()) - len(old_rows), self.file_path)
+        return handler, FileState.capture(self.file_path, end)
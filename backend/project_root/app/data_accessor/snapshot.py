@@ -0,0 +1,163 @@
+import os
+import pickle
+import hashlib
+import logging
+
+from pathlib import Path
+from dataclasses import dataclass, replace
+from pydantic import BaseModel
+from typing import Any, List, Optional, Tuple, Type, TypeVar
+
+from app.data_accessor.row_validation import RowError, RowErrorCallback, validate_rows
+
+T = TypeVar('T', bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the on-disk layout changes; older snapshots are then ignored
+SNAPSHOT_FORMAT_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class SourceFingerprint:
+    """Identity of a source file: resolved path, size, mtime and content hash."""
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    @classmethod
+    def of(cls, source: Path) -> "SourceFingerprint":
+        stat = source.stat()
+        return cls(str(source.resolve()), stat.st_size, stat.st_mtime_ns, file_sha256(source))
+
+
+def file_sha256(source: Path) -> str:
+    digest = hashlib.sha256()
+    with source.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class Snapshot:
+    format_version: int
+    model: str
+    fields: Tuple[str, ...]
+    source: SourceFingerprint
+    rows: List[Tuple[Any, ...]]
+    errors: List[RowError]
+
+
+def _model_key(model: Type[BaseModel]) -> str:
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+class SnapshotCache:
+    """
+    Versioned pickle snapshots of validated handler data, one file per (source, model).
+
+    A snapshot is reused while the source file keeps the same size and mtime, or
+    (after a touch/copy) the same content hash; any other change falls back to
+    parsing the CSV and rewrites the snapshot. Rows are stored as tuples of
+    already-converted field values so loading skips CSV text parsing.
+
+    Snapshot rows are re-validated on load unless trusted=True, which builds
+    models with model_construct; only enable it when the snapshot directory is
+    not writable by anything but this service.
+    """
+    def __init__(self, directory: Path, trusted: bool = False):
+        self.directory = directory
+        self.trusted = trusted
+
+    def snapshot_path(self, source: Path, model: Type[BaseModel]) -> Path:
+        key = hashlib.sha1(f"{source.resolve()}|{_model_key(model)}".encode()).hexdigest()[:16]
+        return self.directory / f"{source.stem}-{key}.snapshot"
+
+    def _read(self, path: Path) -> Optional[Snapshot]:
+        try:
+            with path.open("rb") as f:
+                snapshot = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Ignoring unreadable snapshot %s: %s", path, exc)
+            return None
+        return snapshot if isinstance(snapshot, Snapshot) else None
+
+    def _write(self, path: Path, snapshot: Snapshot) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".tmp-{os.getpid()}")
+        with tmp.open("wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def _is_fresh(self, snapshot: Snapshot, source: Path, model: Type[BaseModel]) -> bool:
+        if (
+            snapshot.format_version != SNAPSHOT_FORMAT_VERSION
+            or snapshot.model != _model_key(model)
+            or snapshot.fields != tuple(model.model_fields)
+        ):
+            return False
+        stat = source.stat()
+        if stat.st_size != snapshot.source.size:
+            return False
+        if stat.st_mtime_ns == snapshot.source.mtime_ns:
+            return True
+        # Same size, new mtime: only trust the snapshot if the content is unchanged
+        if file_sha256(source) != snapshot.source.sha256:
+            return False
+        snapshot.source = replace(snapshot.source, mtime_ns=stat.st_mtime_ns)
+        try:
+            self._write(self.snapshot_path(source, model), snapshot)
+        except OSError as exc:
+            # The snapshot is still valid; it just keeps hashing the source until rewritten
+            logger.warning("Could not refresh snapshot for %s: %s", source, exc)
+        return True
+
+    def load(
+        self,
+        source: Path,
+        model: Type[T],
+        on_error: RowErrorCallback,
+    ) -> Optional[List[T]]:
+        """Return the snapshotted models for source, or None if missing or stale.
+
+        Row errors recorded when the snapshot was written are replayed to on_error.
+        """
+        snapshot = self._read(self.snapshot_path(source, model))
+        if snapshot is None or not self._is_fresh(snapshot, source, model):
+            return None
+        for error in snapshot.errors:
+            on_error(error)
+        fields = snapshot.fields
+        # Source line numbers are not kept, so re-validation errors report line 0
+        rows = ((0, dict(zip(fields, row))) for row in snapshot.rows)
+        return list(validate_rows(model, rows, on_error, trusted=self.trusted))
+
+    def save(
+        self,
+        source: Path,
+        model: Type[T],
+        fingerprint: SourceFingerprint,
+        items: List[T],
+        errors: List[RowError],
+    ) -> None:
+        """Write a snapshot of items parsed from source (fingerprint taken before parsing)."""
+        fields = tuple(model.model_fields)
+        snapshot = Snapshot(
+            format_version=SNAPSHOT_FORMAT_VERSION,
+            model=_model_key(model),
+            fields=fields,
+            source=fingerprint,
+            rows=[tuple(getattr(item, name) for name in fields) for item in items],
+            errors=list(errors),
+        )
+        try:
+            self._write(self.snapshot_path(source, model), snapshot)
+        except OSError as exc:
+            logger.warning("Could not write snapshot for %s: %s", source, exc)
+
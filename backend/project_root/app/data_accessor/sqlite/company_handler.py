@@ -0,0 +1,26 @@
+from typing import Dict, Iterable, Optional
+from app.data_models.company import Company
+from app.data_accessor.indexes.name_index import normalize_name
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_accessor.sqlite.sqlite_handler import SqliteHandler
+from app.data_accessor.interfaces.company_handler_interface import CompanyHandlerInterface
+
+class CompanyHandler(SqliteHandler[Company], CompanyHandlerInterface):
+    """
+    Concrete implementation of CompanyHandlerInterface backed by SQLite.
+    """
+    table = "companies"
+    columns = ("company_id", "company_name", "company_email")
+
+    def __init__(self, database: SqliteDatabase):
+        super().__init__(database, Company)
+
+    def get_by_id(self, company_id: int) -> Optional[Company]:
+        return self._query_one("WHERE company_id = ?", (company_id,))
+
+    def get_by_ids(self, company_ids: Iterable[int]) -> Dict[int, Company]:
+        return self._query_by_ids("company_id", company_ids)
+
+    def get_company_from_company_name(self, certificate_name: str) -> Optional[Company]:
+        """Case- and whitespace-insensitive company name lookup (first match in import order)."""
+        return self._query_one("WHERE name_key = ?", (normalize_name(certificate_name),))
@@ -0,0 +1,28 @@
+from typing import Dict, Iterable, Optional
+from app.data_models.course import Course
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_accessor.sqlite.sqlite_handler import SqliteHandler
+from app.data_accessor.interfaces.course_handler_interface import CourseHandlerInterface
+
+class CourseHandler(SqliteHandler[Course], CourseHandlerInterface):
+    """
+    Concrete implementation of CourseHandlerInterface backed by SQLite.
+    """
+    table = "courses"
+    columns = ("course_id", "course_name", "certificate_name")
+
+    def __init__(self, database: SqliteDatabase):
+        super().__init__(database, Course)
+
+    def get_by_id(self, course_id: str) -> Optional[Course]:
+        return self._query_one("WHERE course_id = ?", (course_id,))
+
+    def get_by_ids(self, course_ids: Iterable[str]) -> Dict[str, Course]:
+        return self._query_by_ids("course_id", course_ids)
+
+    def get_by_course_name_from_certificate_name(self, certificate_name: str) -> Optional[str]:
+        """
+        Retrieve the course name that corresponds to the given certificate name.
+        """
+        course = self._query_one("WHERE certificate_name = ?", (certificate_name,))
+        return course.course_name if course else None
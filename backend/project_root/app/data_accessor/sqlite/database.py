@@ -0,0 +1,127 @@
+import sqlite3
+import threading
+
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Bump when SCHEMA changes; databases written by another version must be re-imported
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS employees (
+    employee_id INTEGER NOT NULL,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    company_name TEXT NOT NULL,
+    department TEXT NOT NULL,
+    email TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    company_key TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS courses (
+    course_id TEXT NOT NULL,
+    course_name TEXT NOT NULL,
+    certificate_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS companies (
+    company_id INTEGER NOT NULL,
+    company_name TEXT NOT NULL,
+    company_email TEXT NOT NULL,
+    name_key TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS employee_certificates (
+    row_id INTEGER PRIMARY KEY,
+    employee_id INTEGER NOT NULL,
+    course_id TEXT NOT NULL,
+    certificate_name TEXT NOT NULL,
+    issue_date TEXT NOT NULL,
+    expiry_date TEXT NOT NULL
+);
+"""
+
+# Created after a bulk import so rows are inserted without index maintenance.
+# Dates are stored as ISO text, so text order is date order. name_key and
+# company_key hold the normalize_name() form used by the in-memory NameIndex.
+INDEXES = """
+CREATE INDEX IF NOT EXISTS employees_employee_id ON employees (employee_id);
+CREATE INDEX IF NOT EXISTS employees_name_key ON employees (name_key);
+CREATE INDEX IF NOT EXISTS employees_company_key ON employees (company_key);
+CREATE INDEX IF NOT EXISTS courses_course_id ON courses (course_id);
+CREATE INDEX IF NOT EXISTS courses_certificate_name ON courses (certificate_name);
+CREATE INDEX IF NOT EXISTS companies_company_id ON companies (company_id);
+CREATE INDEX IF NOT EXISTS companies_name_key ON companies (name_key);
+CREATE INDEX IF NOT EXISTS certificates_expiry ON employee_certificates (expiry_date, employee_id, course_id);
+CREATE INDEX IF NOT EXISTS certificates_employee_id ON employee_certificates (employee_id);
+CREATE INDEX IF NOT EXISTS certificates_course_id ON employee_certificates (course_id);
+"""
+
+TABLES = ("employees", "courses", "companies", "employee_certificates")
+
+
+class SqliteDatabase:
+    """
+    A SQLite database file shared by the SQLite handlers.
+
+    Each thread gets its own connection, opened on first use and reused for
+    the thread's lifetime (sqlite3 connections must not be used concurrently).
+    The database runs in WAL mode so readers never block on, and never see a
+    partial, bulk import.
+    """
+    def __init__(self, path: Path, mmap_size: int = 256 * 1024 * 1024):
+        self.path = path
+        self.mmap_size = mmap_size
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened (and configured) on first use."""
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit mode; writers open explicit transactions via `transaction`.
+            # check_same_thread is off only so `close` can run from another thread.
+            connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            connection.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+            connection.executescript(SCHEMA)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction on this thread's connection; rolled back on error."""
+        connection = self.connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def execute(self, sql: str, params: Any = ()) -> List[Any]:
+        return self.connection().execute(sql, params).fetchall()
+
+    def meta(self) -> Dict[str, str]:
+        return {key: value for key, value in self.execute("SELECT key, value FROM meta")}
+
+    @staticmethod
+    def write_meta(connection: sqlite3.Connection, values: Dict[str, str]) -> None:
+        connection.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", values.items())
+
+    def close(self) -> None:
+        """Close every connection opened through this database, from any thread."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
@@ -0,0 +1,263 @@
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from app.data_accessor.indexes.expiry_index import SortKey
+from app.data_accessor.indexes.name_index import normalize_name
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_accessor.sqlite.sqlite_handler import SqliteHandler
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_models.enriched_certificate import EnrichedCertificate
+from app.data_accessor.interfaces.employee_certificate_handler_interface import EmployeeCertificateHandlerInterface
+
+# Matches the (expiry_date, employee_id, course_id, row_id) cursor order of the
+# in-memory service; row_id (the load position) makes every key unique. Served
+# straight from the certificates_expiry index, which also stores row_id.
+CURSOR_ORDER = "expiry_date, employee_id, course_id, row_id"
+
+C = TypeVar("C", bound=EmployeeCertificate)
+
+# Per-connection scratch table for uploads; the unique key drops repeated certificates
+STAGING_TABLE = "temp.staged_certificates"
+STAGING_SCHEMA = (
+    f"CREATE TABLE IF NOT EXISTS {STAGING_TABLE} (employee_id INTEGER NOT NULL, course_id TEXT NOT NULL, "
+    "certificate_name TEXT NOT NULL, issue_date TEXT NOT NULL, expiry_date TEXT NOT NULL, "
+    "UNIQUE (employee_id, course_id, issue_date))"
+)
+
+# Company of a certificate's employee; the last row wins for duplicate
+# employee ids, as in the service's employee_id -> employee dict
+_COMPANY_OF = (
+    "coalesce((SELECT e.company_name FROM employees e WHERE e.employee_id = c.employee_id "
+    "ORDER BY e.rowid DESC LIMIT 1), ?)"
+)
+
+GROUP_EXPRESSIONS = {
+    "course_id": "c.course_id",
+    "company": _COMPANY_OF,
+    "month": "substr(c.expiry_date, 1, 7)",
+}
+
+class EmployeeCertificateHandler(SqliteHandler[EmployeeCertificate], EmployeeCertificateHandlerInterface):
+    """
+    Concrete implementation of EmployeeCertificateHandlerInterface backed by SQLite.
+
+    Date ranges, employee and course filters are answered from indexes, so
+    only the matching rows are read from disk.
+    """
+    table = "employee_certificates"
+    columns = ("employee_id", "course_id", "certificate_name", "issue_date", "expiry_date")
+
+    def __init__(self, database: SqliteDatabase):
+        super().__init__(database, EmployeeCertificate)
+
+    def _to_model(self, row: Sequence[Any]) -> EmployeeCertificate:
+        employee_id, course_id, certificate_name, issue_date, expiry_date = row
+        return EmployeeCertificate.model_construct(
+            employee_id=employee_id,
+            course_id=course_id,
+            certificate_name=certificate_name,
+            issue_date=date.fromisoformat(issue_date),
+            expiry_date=date.fromisoformat(expiry_date),
+        )
+
+    @staticmethod
+    def sort_key(cert: EmployeeCertificate, row_id: int) -> SortKey:
+        return (cert.expiry_date, cert.employee_id, cert.course_id, row_id)
+
+    @staticmethod
+    def _range_filter(
+        start: Optional[date], end: Optional[date], after: Optional[SortKey] = None, alias: str = ""
+    ) -> Tuple[List[str], List[Any]]:
+        # alias qualifies the columns when the certificates table is joined
+        p = f"{alias}." if alias else ""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if start is not None:
+            clauses.append(f"{p}expiry_date >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append(f"{p}expiry_date <= ?")
+            params.append(end.isoformat())
+        if after is not None:
+            expiry_date, employee_id, course_id, row_id = after
+            clauses.append(f"({p}expiry_date, {p}employee_id, {p}course_id, {p}row_id) > (?, ?, ?, ?)")
+            params.extend((expiry_date.isoformat(), employee_id, course_id, row_id))
+        return clauses, params
+
+    def _page(self, certs: List[C], row_ids: List[int], limit: int) -> Tuple[List[C], Optional[SortKey]]:
+        # The query fetched one extra row to learn whether another page follows
+        if len(certs) > limit:
+            return certs[:limit], self.sort_key(certs[limit - 1], row_ids[limit - 1])
+        return certs, None
+
+    @staticmethod
+    def _where(clauses: List[str]) -> str:
+        return f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    def append(self, certs: List[EmployeeCertificate], meta: Dict[str, str]) -> None:
+        """Insert certs after the existing rows and update the import metadata, in one transaction."""
+        with self.database.transaction() as connection:
+            connection.executemany(
+                "INSERT INTO employee_certificates (employee_id, course_id, certificate_name, issue_date, expiry_date) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((c.employee_id, c.course_id, c.certificate_name, c.issue_date.isoformat(), c.expiry_date.isoformat()) for c in certs),
+            )
+            self.database.write_meta(connection, meta)
+
+    def append_staged(self, batches: Iterable[List[EmployeeCertificate]], meta: Dict[str, str]) -> Tuple[int, int]:
+        """
+        Stage batches in a temporary table, then insert the new ones after the existing rows in one transaction.
+
+        Staging keeps the first row per (employee_id, course_id, issue_date)
+        and the insert skips keys already stored, so only one batch is in
+        memory at a time and duplicates never reach the table. The import
+        metadata is updated with the rows. Returns the number of rows
+        inserted and the last row_id before them.
+        """
+        connection = self.database.connection()
+        connection.execute(STAGING_SCHEMA)
+        try:
+            for batch in batches:
+                connection.executemany(
+                    f"INSERT OR IGNORE INTO {STAGING_TABLE} VALUES (?, ?, ?, ?, ?)",
+                    ((c.employee_id, c.course_id, c.certificate_name, c.issue_date.isoformat(), c.expiry_date.isoformat()) for c in batch),
+                )
+            with self.database.transaction() as transaction:
+                last = transaction.execute("SELECT coalesce(max(row_id), -1) FROM employee_certificates").fetchone()[0]
+                inserted = transaction.execute(
+                    "INSERT INTO employee_certificates (employee_id, course_id, certificate_name, issue_date, expiry_date) "
+                    f"SELECT s.employee_id, s.course_id, s.certificate_name, s.issue_date, s.expiry_date FROM {STAGING_TABLE} s "
+                    "WHERE NOT EXISTS (SELECT 1 FROM employee_certificates c WHERE c.employee_id = s.employee_id "
+                    "AND c.course_id = s.course_id AND c.issue_date = s.issue_date) ORDER BY s.rowid"
+                ).rowcount
+                if inserted:
+                    self.database.write_meta(transaction, meta)
+            return inserted, last
+        finally:
+            connection.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+
+    def iter_after(self, row_id: int) -> Iterator[EmployeeCertificate]:
+        """Certificates stored after row_id, in row order, streamed from one query."""
+        for row in self.database.connection().execute(f"{self._select()} WHERE row_id > ? ORDER BY row_id", (row_id,)):
+            yield self._to_model(row)
+
+    def get_by_id(self, name: int) -> Optional[EmployeeCertificate]:
+        """
+        Retrieve a certificate by its row id (0-based position in the source file).
+        """
+        return self._query_one("WHERE row_id = ?", (name,))
+
+    def get_certificates_exprining_in_time_range(self, start_data: datetime, end_data: datetime) -> Optional[List[EmployeeCertificate]]:
+        return self.get_expired_employee_certificates_by_date_range(_as_date(start_data), _as_date(end_data))
+
+    def get_expired_employee_certificates_by_date_range(self, start_date: Optional[date], end_date: Optional[date]) -> List[EmployeeCertificate]:
+        """Retrieve certificates expiring within a date range, sorted by expiry date (file order on ties)."""
+        clauses, params = self._range_filter(start_date, end_date)
+        return self._query(self._where(clauses), params, order_by="expiry_date, row_id")
+
+    def get_employee_certificates_by_employee_id(self, employee_id: int) -> List[EmployeeCertificate]:
+        """Retrieve all certificates for a specific employee by their ID."""
+        return self._query("WHERE employee_id = ?", (employee_id,))
+
+    def get_employee_certificates_by_course_id(self, course_id: str) -> List[EmployeeCertificate]:
+        """Retrieve all certificates for a specific course by its ID."""
+        return self._query("WHERE course_id = ?", (course_id,))
+
+    def page(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        limit: int,
+        after: Optional[SortKey] = None,
+        company_name: Optional[str] = None,
+    ) -> Tuple[List[EmployeeCertificate], Optional[SortKey]]:
+        """Up to limit certificates in cursor order after `after`, plus the next page's cursor (None on the last page).
+
+        With company_name, only certificates of that company's employees are returned.
+        """
+        clauses, params = self._range_filter(start, end, after)
+        if company_name is not None:
+            clauses.append("employee_id IN (SELECT employee_id FROM employees WHERE company_key = ?)")
+            params.append(normalize_name(company_name))
+        rows = self.database.execute(
+            f"SELECT {', '.join(self.columns)}, row_id FROM {self.table} {self._where(clauses)} "
+            f"ORDER BY {CURSOR_ORDER} LIMIT {max(int(limit), 0) + 1}",
+            params,
+        )
+        return self._page([self._to_model(row[:5]) for row in rows], [row[5] for row in rows], limit)
+
+    def page_enriched(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        limit: int,
+        after: Optional[SortKey] = None,
+    ) -> Tuple[List[EnrichedCertificate], Optional[SortKey]]:
+        """Like `page`, with each certificate joined to its employee and course.
+
+        The joins are index probes per returned row (the last row wins for
+        duplicate ids, as in the in-memory service).
+        """
+        clauses, params = self._range_filter(start, end, after, alias="c")
+        columns = ", ".join(f"c.{column}" for column in self.columns)
+        rows = self.database.execute(
+            f"SELECT {columns}, e.first_name, e.last_name, e.email, e.company_name, e.department, k.course_name, c.row_id "
+            "FROM employee_certificates c "
+            "LEFT JOIN employees e ON e.rowid = (SELECT max(rowid) FROM employees WHERE employee_id = c.employee_id) "
+            "LEFT JOIN courses k ON k.rowid = (SELECT max(rowid) FROM courses WHERE course_id = c.course_id) "
+            f"{self._where(clauses)} ORDER BY {_qualified(CURSOR_ORDER)} LIMIT {max(int(limit), 0) + 1}",
+            params,
+        )
+        certs = [
+            EnrichedCertificate.model_construct(
+                **dict(self._to_model(row[:5])),
+                **dict(zip(("first_name", "last_name", "email", "company_name", "department", "course_name"), row[5:11])),
+            )
+            for row in rows
+        ]
+        return self._page(certs, [row[11] for row in rows], limit)
+
+    def iter_range(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        after: Optional[SortKey] = None,
+        company_name: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[EmployeeCertificate]:
+        """Lazily yield certificates in cursor order, one keyset page per query.
+
+        No cursor is held open between batches, so the iterator may be resumed
+        from any thread (each query runs on that thread's connection).
+        """
+        while True:
+            certs, after = self.page(start, end, batch_size, after, company_name)
+            yield from certs
+            if after is None:
+                return
+
+    def count(self, start: Optional[date], end: Optional[date]) -> int:
+        clauses, params = self._range_filter(start, end)
+        return self.database.execute(f"SELECT count(*) FROM employee_certificates {self._where(clauses)}", params)[0][0]
+
+    def next_expiring(self, after: date, n: int) -> List[EmployeeCertificate]:
+        """The next n certificates expiring on or after the given date."""
+        return self._query("WHERE expiry_date >= ?", (after.isoformat(),), order_by=f"expiry_date, row_id LIMIT {max(int(n), 0)}")
+
+    def expiry_counts(self, group_by: str, start: Optional[date], end: Optional[date], unknown: str) -> Dict[str, int]:
+        """Count certificates in the range per course_id, company or expiry month (YYYY-MM), sorted by group."""
+        expression = GROUP_EXPRESSIONS[group_by]
+        clauses, params = self._range_filter(start, end)
+        group_params = [unknown] if group_by == "company" else []
+        rows = self.database.execute(
+            f"SELECT {expression} AS grp, count(*) FROM employee_certificates c "
+            f"{self._where(clauses)} GROUP BY grp ORDER BY grp",
+            [*group_params, *params],
+        )
+        return {group: count for group, count in rows}
+
+def _qualified(order: str) -> str:
+    return ", ".join(f"c.{column.strip()}" for column in order.split(","))
+
+def _as_date(value: datetime | date) -> date:
+    return value.date() if isinstance(value, datetime) else value
@@ -0,0 +1,45 @@
+from typing import Dict, Iterable, Optional
+from app.data_models.employee import Employee
+from app.data_accessor.indexes.name_index import full_name_key, normalize_name
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_accessor.sqlite.sqlite_handler import SqliteHandler
+from app.data_accessor.interfaces.employee_handler_interface import EmployeeHandlerInterface
+
+class EmployeeHandler(SqliteHandler[Employee], EmployeeHandlerInterface):
+    """
+    Concrete implementation of EmployeeHandlerInterface backed by SQLite.
+
+    Name lookups go through the normalized name_key column, so they match the
+    CSV and pandas backends: case-insensitive, first row in import order wins.
+    """
+    table = "employees"
+    columns = ("employee_id", "first_name", "last_name", "company_name", "department", "email")
+
+    def __init__(self, database: SqliteDatabase):
+        super().__init__(database, Employee)
+
+    def get_by_id(self, employee_id: int) -> Optional[Employee]:
+        return self._query_one("WHERE employee_id = ?", (employee_id,))
+
+    def get_by_ids(self, employee_ids: Iterable[int]) -> Dict[int, Employee]:
+        return self._query_by_ids("employee_id", employee_ids)
+
+    def get_company_name_from_employee_name(self, employee_name: str) -> Optional[str]:
+        employee = self._query_one("WHERE name_key = ?", (normalize_name(employee_name),))
+        return employee.company_name if employee else None
+
+    def get_employee_company_name(self, first_name: str, last_name: str) -> Optional[str]:
+        """Retreive name of a company associated to an employee (first match on duplicate names)"""
+        employee = self._query_one("WHERE name_key = ?", (full_name_key(first_name, last_name),))
+        return employee.company_name if employee else None
+
+    def get_employee_email(self, first_name: str, last_name: str) -> Optional[str]:
+        """Retreive the email of an employee (first match on duplicate names)"""
+        employee = self._query_one("WHERE name_key = ?", (full_name_key(first_name, last_name),))
+        return employee.email if employee else None
+
+    def has_company(self, company_name: str) -> bool:
+        """Whether any employee works for the company (case-insensitive)."""
+        return bool(self.database.execute(
+            "SELECT 1 FROM employees WHERE company_key = ? LIMIT 1", (normalize_name(company_name),)
+        ))
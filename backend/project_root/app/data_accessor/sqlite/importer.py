@@ -0,0 +1,135 @@
+"""
+One-shot bulk import of the CSV datasets into a SQLite database.
+
+    python -m app.data_accessor.sqlite.importer data data/cert_tracker.db
+"""
+import uuid
+import itertools
+import logging
+import sqlite3
+
+from pathlib import Path
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+import typer
+
+from app.data_models.course import Course
+from app.data_models.company import Company
+from app.data_accessor.csv_handler import CsvHandler
+from app.data_accessor.company_handler import CompanyHandler
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_accessor.indexes.name_index import full_name_key, normalize_name
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+from app.data_accessor.sqlite.database import INDEXES, SCHEMA, SCHEMA_VERSION, TABLES, SqliteDatabase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 10_000
+
+@dataclass
+class ImportResult:
+    version: str
+    rows: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+
+def _copy(
+    connection: sqlite3.Connection,
+    handler: CsvHandler[Any],
+    sql: str,
+    to_row: Callable[[Any], Sequence[Any]],
+    batch_size: int,
+) -> int:
+    rows = 0
+    for batch in handler.iter_batches(batch_size):
+        connection.executemany(sql, (to_row(item) for item in batch))
+        rows += len(batch)
+    return rows
+
+def import_csvs(
+    data_dir: Path,
+    database: SqliteDatabase,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ImportResult:
+    """
+    Replace the database contents with employee_certs.csv, courses.csv,
+    employees.csv and (if present) companies.csv from data_dir.
+
+    Rows are validated with the CSV handlers (invalid rows are logged and
+    skipped) and streamed in batches, so memory stays bounded by batch_size.
+    Everything runs in one transaction: readers keep seeing the previous
+    data until the import commits. Indexes are created after the rows are
+    inserted, which is much faster than maintaining them row by row.
+    """
+    result = ImportResult(version=uuid.uuid4().hex[:16])
+    handlers: Dict[str, CsvHandler[Any]] = {
+        "employee_certificates": EmployeeCertificateHandler(data_dir / "employee_certs.csv"),
+        "courses": CourseHandler(data_dir / "courses.csv", Course),
+        "employees": EmployeeHandler(data_dir / "employees.csv"),
+    }
+    if (data_dir / "companies.csv").exists():
+        handlers["companies"] = CompanyHandler(data_dir / "companies.csv", Company)
+
+    # row_id is the 0-based position among the imported certificate rows
+    row_ids = itertools.count()
+    copies: Dict[str, Tuple[str, Callable[[Any], Sequence[Any]]]] = {
+        "employee_certificates": (
+            "INSERT INTO employee_certificates VALUES (?, ?, ?, ?, ?, ?)",
+            lambda c: (next(row_ids), c.employee_id, c.course_id, c.certificate_name, c.issue_date.isoformat(), c.expiry_date.isoformat()),
+        ),
+        "courses": (
+            "INSERT INTO courses VALUES (?, ?, ?)",
+            lambda c: (c.course_id, c.course_name, c.certificate_name),
+        ),
+        "employees": (
+            "INSERT INTO employees VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            lambda e: (
+                e.employee_id, e.first_name, e.last_name, e.company_name, e.department, e.email,
+                full_name_key(e.first_name, e.last_name), normalize_name(e.company_name),
+            ),
+        ),
+        "companies": (
+            "INSERT INTO companies VALUES (?, ?, ?, ?)",
+            lambda c: (c.company_id, c.company_name, c.company_email, normalize_name(c.company_name)),
+        ),
+    }
+
+    with database.transaction() as connection:
+        for table in TABLES:
+            connection.execute(f"DROP TABLE IF EXISTS {table}")
+        for statement in SCHEMA.split(";"):
+            if statement.strip():
+                connection.execute(statement)
+        for table, handler in handlers.items():
+            sql, to_row = copies[table]
+            result.rows[table] = _copy(connection, handler, sql, to_row, batch_size)
+            result.errors[table] = len(handler.errors)
+        for statement in INDEXES.split(";"):
+            if statement.strip():
+                connection.execute(statement)
+        connection.execute("ANALYZE")
+        database.write_meta(connection, {
+            "version": result.version,
+            "imported_at": datetime.now(timezone.utc).isoformat(),
+            "schema_version": str(SCHEMA_VERSION),
+        })
+    logger.info("Imported %s into %s (%s rejected)", result.rows, database.path, result.errors)
+    return result
+
+def main(
+    data_dir: Path = typer.Argument(Path("data"), help="Directory holding the CSV datasets"),
+    db_path: Path = typer.Argument(Path("data/cert_tracker.db"), help="SQLite database to (re)create"),
+    batch_size: int = typer.Option(DEFAULT_BATCH_SIZE, help="Rows inserted per executemany call"),
+) -> None:
+    logging.basicConfig(level=logging.INFO)
+    database = SqliteDatabase(db_path)
+    try:
+        result = import_csvs(data_dir, database, batch_size)
+    finally:
+        database.close()
+    typer.echo(f"{db_path}: version {result.version}, rows {result.rows}, rejected {result.errors}")
+
+if __name__ == "__main__":
+    typer.run(main)
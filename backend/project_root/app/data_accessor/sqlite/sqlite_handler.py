@@ -0,0 +1,62 @@
+from pydantic import BaseModel
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from app.data_accessor.sqlite.database import SqliteDatabase
+
+T = TypeVar("T", bound=BaseModel)
+
+# Ids bound per IN (...) query, under SQLite's default host parameter limit
+_IDS_PER_QUERY = 500
+
+class SqliteHandler(Generic[T]):
+    """
+    Base class for handlers that read one table of a SqliteDatabase.
+
+    Rows are validated once by the importer, so models are built with
+    `model_construct`. Nothing is cached: every call is an indexed query.
+    """
+    table: str = ""
+    columns: Tuple[str, ...] = ()
+
+    def __init__(self, database: SqliteDatabase, model: Type[T]):
+        self.database = database
+        self.model = model
+
+    def _select(self) -> str:
+        return f"SELECT {', '.join(self.columns)} FROM {self.table}"
+
+    def _to_model(self, row: Sequence[Any]) -> T:
+        return self.model.model_construct(**dict(zip(self.columns, row)))
+
+    def _query(self, where: str = "", params: Sequence[Any] = (), order_by: str = "rowid") -> List[T]:
+        sql = f"{self._select()} {where} ORDER BY {order_by}"
+        return [self._to_model(row) for row in self.database.execute(sql, params)]
+
+    def _query_one(self, where: str, params: Sequence[Any]) -> Optional[T]:
+        rows = self.database.execute(f"{self._select()} {where} ORDER BY rowid LIMIT 1", params)
+        return self._to_model(rows[0]) if rows else None
+
+    def _query_by_ids(self, column: str, ids: Iterable[Any]) -> Dict[Any, T]:
+        """Rows whose column matches one of ids, keyed by id in first-request order (first row per id wins)."""
+        wanted = list(dict.fromkeys(ids))
+        found: Dict[Any, T] = {}
+        for i in range(0, len(wanted), _IDS_PER_QUERY):
+            chunk = wanted[i:i + _IDS_PER_QUERY]
+            for item in self._query(f"WHERE {column} IN ({', '.join('?' * len(chunk))})", chunk):
+                found.setdefault(getattr(item, column), item)
+        return {key: found[key] for key in wanted if key in found}
+
+    def load_all(self) -> List[T]:
+        """Every row, in import (source file) order."""
+        return self._query()
+
+    def iter_batches(self, size: int) -> Iterator[List[T]]:
+        """Stream rows in import order, holding at most size rows in memory."""
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+        cursor = self.database.connection().execute(f"{self._select()} ORDER BY rowid")
+        while batch := cursor.fetchmany(size):
+            yield [self._to_model(row) for row in batch]
+
+    def __len__(self) -> int:
+        return self.database.execute(f"SELECT count(*) FROM {self.table}")[0][0]
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import List
+from app.data_models.course import Course
+from app.data_models.employee import Employee
+
+# Ids accepted per kind in one batch request
+MAX_BATCH_IDS = 1000
+
+class BatchLookupRequest(BaseModel):
+    employee_ids: List[int] = Field(default=[], max_length=MAX_BATCH_IDS)
+    course_ids: List[str] = Field(default=[], max_length=MAX_BATCH_IDS)
+
+class BatchLookupResponse(BaseModel):
+    """Resolved records in first-request order, and the ids that matched nothing."""
+    employees: List[Employee] = []
+    courses: List[Course] = []
+    missing_employee_ids: List[int] = []
+    missing_course_ids: List[str] = []
@@ -0,0 +1,11 @@
+from typing import Optional
+from app.data_models.employee_certificate import EmployeeCertificate
+
+class EnrichedCertificate(EmployeeCertificate):
+    """An employee certificate joined with its employee and course (None when they are not on file)."""
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    company_name: Optional[str] = None
+    department: Optional[str] = None
+    course_name: Optional[str] = None
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import Dict, Optional
+
+class ExpirySummary(BaseModel):
+    start: Optional[date]
+    end: Optional[date]
+    total: int
+    by_course_id: Optional[Dict[str, int]] = None
+    by_company: Optional[Dict[str, int]] = None
+    by_month: Optional[Dict[str, int]] = None
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from datetime import date
+from app.data_models.employee_certificate import EmployeeCertificate
+
+class Reminder(BaseModel):
+    """A certificate that reached threshold_days before expiry on the due date."""
+    threshold_days: int
+    due: date
+    certificate: EmployeeCertificate
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import List, Literal, Union
+
+SearchKind = Literal["employee", "company", "course", "certificate"]
+MatchKind = Literal["exact", "prefix", "word_prefix", "fuzzy"]
+
+class SearchResult(BaseModel):
+    """One name matching a search; ids are employee ids, or course ids for course and certificate names."""
+    kind: SearchKind
+    name: str
+    match: MatchKind
+    score: float
+    ids: List[Union[int, str]] = []
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class UploadRowError(BaseModel):
+    line: int
+    message: str
+
+class UploadReport(BaseModel):
+    rows: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    # Accepted rows skipped because the certificate was already on file
+    duplicates: int = 0
+    errors: List[UploadRowError] = []
+    # True when more rows were rejected than are listed in errors
+    errors_truncated: bool = False
+    # Dataset version after the accepted rows were merged
+    version: Optional[str] = None
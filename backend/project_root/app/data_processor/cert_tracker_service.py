@@ -1,21 +1,209 @@
-from typing import List
-from datetime import date
+import copy
+import uuid
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple, Union
+from datetime import date, datetime, timezone
 
 from app.data_accessor.course_handler import CourseHandler
 from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_accessor.indexes.expiry_index import ExpiryIndex, SortKey
+from app.data_accessor.certificate_record import CertificateLike, CertificateRecord, EnrichedRecord
+from app.instrumentation.metrics import timed_query
+from app.data_models.expiry_summary import ExpirySummary
+from app.data_models.search_result import SearchKind, SearchResult
+from app.data_processor.name_search import SEARCH_KINDS, NameSearch
+from app.data_models.enriched_certificate import EnrichedCertificate
+from app.data_processor.expiry_aggregates import ExpiryHistogram
+from app.data_processor.company_partitions import CompanyPartitions
+from app.data_accessor.indexes.multi_value_index import MultiValueIndex
 from app.data_models.employee_certificate import EmployeeCertificate
 from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
 
+ExpiryGrouping = Literal["course_id", "company", "month"]
+EXPIRY_GROUPINGS: Tuple[ExpiryGrouping, ...] = ("course_id", "company", "month")
+
+# Index entries kept across hot per-company partitions before LRU eviction;
+# not a memory bound, the certificate records themselves are always resident
+DEFAULT_MAX_INDEXED_ROWS = 1_000_000
+
+# Company label for certificates whose employee_id is not in the employee data
+UNKNOWN_COMPANY = "unknown"
+
+def _cursor_tiebreak(cert: CertificateLike) -> SortKey:
+    # row_id keeps the key unique when the same certificate was loaded twice
+    return (cert.employee_id, cert.course_id, cert.row_id)
+
+def _models(records: Iterable[CertificateRecord]) -> List[EmployeeCertificate]:
+    return [record.to_model() for record in records]
+
 class CertTrackerService:
     def __init__(
         self,
         employee_cert_repo: EmployeeCertificateHandler,
         course_repo: CourseHandler,
         employee_repo: EmployeeHandler,
+        version: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+        max_indexed_rows: int = DEFAULT_MAX_INDEXED_ROWS,
     ):
-        self.employee_certs = employee_cert_repo.load_all()
+        # Identifies the loaded dataset; changes whenever the data may have changed
+        self.version = version or uuid.uuid4().hex[:16]
+        self.last_modified = (last_modified or datetime.now(timezone.utc)).replace(microsecond=0)
+        # Compact records; EmployeeCertificate models are only built for returned rows
+        self.employee_certs = employee_cert_repo.load_records()
         self.courses = {c.course_id: c for c in course_repo.load_all()}
         self.employees = {e.employee_id: e for e in employee_repo.load_all()}
+        # Built once at load time so range queries are O(log n + k); the
+        # (expiry_date, employee_id, course_id, row_id) order backs pagination cursors
+        self.expiry_index = ExpiryIndex(self.employee_certs, tiebreak=_cursor_tiebreak)
+        # Denormalized certificate + employee + course rows, joined once here so
+        # enriched queries are plain range scans with no per-row lookups
+        self.enriched_index = ExpiryIndex(self._enrich(self.employee_certs), tiebreak=_cursor_tiebreak)
+        self.certs_by_employee = MultiValueIndex(self.employee_certs, lambda c: c.employee_id, "certificates_by_employee_id")
+        self.max_indexed_rows = max_indexed_rows
+        # Names do not change when certificates are merged in, so copies share it
+        self.name_search = NameSearch(self.employees.values(), self.courses.values())
+        self.company_partitions = self._company_partitions()
+        # Per-day cumulative counts so aggregate queries cost O(groups), not O(certificates)
+        self.expiry_histograms: Dict[ExpiryGrouping, ExpiryHistogram] = {
+            g: ExpiryHistogram(self._histogram_entries(g, self.employee_certs), f"expiry_by_{g}") for g in EXPIRY_GROUPINGS
+        }
+
+    def _enrich(self, certs: Iterable[CertificateRecord]) -> Iterator[EnrichedRecord]:
+        for cert in certs:
+            yield EnrichedRecord(cert, self.employees.get(cert.employee_id), self.courses.get(cert.course_id))
+
+    def _company_partitions(self) -> CompanyPartitions:
+        return CompanyPartitions(
+            list(self.employees.values()), self.certs_by_employee, self.max_indexed_rows, _cursor_tiebreak
+        )
+
+    def _histogram_entries(self, grouping: ExpiryGrouping, certs: Iterable[CertificateRecord]) -> Iterator[Tuple[str, date]]:
+        for c in certs:
+            if grouping == "course_id":
+                yield c.course_id, c.expiry_date
+            elif grouping == "company":
+                yield self.company_of(c.employee_id), c.expiry_date
+            else:
+                yield f"{c.expiry_date:%Y-%m}", c.expiry_date
+
+    def with_certificates(
+        self,
+        certs: Sequence[Union[EmployeeCertificate, CertificateRecord]],
+        version: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+    ) -> "CertTrackerService":
+        """
+        A new service with certs merged into every index, without reloading anything.
+
+        This service is left untouched, so requests already using it are not
+        affected. Company partitions start empty and are rebuilt on demand.
+        """
+        service = copy.copy(self)
+        service.version = version or uuid.uuid4().hex[:16]
+        service.last_modified = (last_modified or datetime.now(timezone.utc)).replace(microsecond=0)
+        first = len(self.employee_certs)
+        records = [CertificateRecord.of(cert, first + i) for i, cert in enumerate(certs)]
+        service.employee_certs = self.employee_certs + records
+        service.expiry_index = self.expiry_index.merged(records)
+        service.enriched_index = self.enriched_index.merged(self._enrich(records))
+        service.certs_by_employee = self.certs_by_employee.extended(records)
+        service.company_partitions = service._company_partitions()
+        service.expiry_histograms = {
+            g: histogram.extended(self._histogram_entries(g, records)) for g, histogram in self.expiry_histograms.items()
+        }
+        return service
+
+    def company_of(self, employee_id: int) -> str:
+        employee = self.employees.get(employee_id)
+        return employee.company_name if employee else UNKNOWN_COMPANY
+
+    @timed_query
+    def get_expiring_certificates(self, start: Optional[date], end: Optional[date]) -> List[EmployeeCertificate]:
+        """Certificates expiring between start and end (inclusive), sorted by expiry date.
 
-    def get_expiring_certificates(self, start: date, end: date) -> List[EmployeeCertificate]:
-        return [cert for cert in self.employee_certs if start <= cert.expiry_date <= end]
\ No newline at end of file
+        Either bound may be None for an open-ended range.
+        """
+        return _models(self.expiry_index.range(start, end))
+
+    @timed_query
+    def get_next_expiring_certificates(self, n: int, after: Optional[date] = None) -> List[EmployeeCertificate]:
+        """The next n certificates to expire on or after the given date (default: today)."""
+        return _models(self.expiry_index.next_expiring(after or date.today(), n))
+
+    def iter_expiring_certificates(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        after: Optional[SortKey] = None,
+    ) -> Iterator[EmployeeCertificate]:
+        """Lazily yield certificates expiring between start and end, resuming after a cursor key."""
+        return (record.to_model() for record in self.expiry_index.iter_range(start, end, after))
+
+    @timed_query
+    def page_expiring_certificates(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        limit: int,
+        after: Optional[SortKey] = None,
+    ) -> Tuple[List[EmployeeCertificate], Optional[SortKey]]:
+        """One page of expiring certificates and the cursor key of the next page, if any."""
+        records, next_key = self.expiry_index.page(start, end, limit, after)
+        return _models(records), next_key
+
+    @timed_query
+    def page_enriched_expiring_certificates(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        limit: Optional[int] = None,
+        after: Optional[SortKey] = None,
+    ) -> Tuple[List[EnrichedCertificate], Optional[SortKey]]:
+        """Expiring certificates with employee and course details, in the same order and with the same cursors as the plain queries."""
+        if limit is None:
+            return [row.to_model() for row in self.enriched_index.iter_range(start, end, after)], None
+        rows, next_key = self.enriched_index.page(start, end, limit, after)
+        return [row.to_model() for row in rows], next_key
+
+    @timed_query
+    def get_expiry_summary(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        group_by: Iterable[ExpiryGrouping] = EXPIRY_GROUPINGS,
+    ) -> ExpirySummary:
+        """Counts of certificates expiring in the range, grouped by course, company and/or expiry month."""
+        groups = set(group_by)
+        counts = {g: self.expiry_histograms[g].counts(start, end) for g in EXPIRY_GROUPINGS if g in groups}
+        return ExpirySummary(
+            start=start,
+            end=end,
+            total=self.expiry_index.count(start, end),
+            by_course_id=counts.get("course_id"),
+            by_company=counts.get("company"),
+            by_month=counts.get("month"),
+        )
+
+    def has_company(self, company_name: str) -> bool:
+        return company_name in self.company_partitions
+
+    @timed_query
+    def search_names(self, query: str, kinds: Iterable[SearchKind] = SEARCH_KINDS, limit: int = 10) -> List[SearchResult]:
+        """Top-limit employee, company, course and certificate names matching query (prefix first, then fuzzy)."""
+        return self.name_search.search(query, kinds, limit)
+
+    @timed_query
+    def page_company_expiring_certificates(
+        self,
+        company_name: str,
+        start: Optional[date],
+        end: Optional[date],
+        limit: Optional[int] = None,
+        after: Optional[SortKey] = None,
+    ) -> Tuple[List[EmployeeCertificate], Optional[SortKey]]:
+        """Expiring certificates of one company, read from that company's partition only."""
+        partition = self.company_partitions.get(company_name)
+        if limit is None:
+            return _models(partition.iter_range(start, end, after)), None
+        records, next_key = partition.page(start, end, limit, after)
+        return _models(records), next_key
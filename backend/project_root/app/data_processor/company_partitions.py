@@ -0,0 +1,84 @@
+import threading
+
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from app.data_models.employee import Employee
+from app.data_accessor.indexes.expiry_index import ExpiryIndex, SortKey
+from app.data_accessor.indexes.name_index import normalize_name
+from app.data_accessor.indexes.multi_value_index import MultiValueIndex
+from app.data_accessor.certificate_record import CertificateRecord
+
+
+class CompanyPartitions:
+    """
+    Per-company certificate partitions, each with its own expiry index.
+
+    A partition is built on first use from the company's employees and their
+    certificates (via the employee_id index), so it only touches that tenant's
+    rows. Hot partitions are kept in an LRU holding at most max_indexed_rows
+    index entries in total; the least recently used ones are dropped once
+    that is exceeded and rebuilt on demand.
+
+    Partitions reference the service's certificate records rather than
+    copying them, and those stay resident for the life of the service, so
+    max_indexed_rows caps index entries (two list slots, about 16 bytes, per
+    certificate), not the memory held by the certificates.
+    """
+    def __init__(
+        self,
+        employees: List[Employee],
+        certs_by_employee: MultiValueIndex[int, CertificateRecord],
+        max_indexed_rows: int,
+        tiebreak: Optional[Callable[[CertificateRecord], SortKey]] = None,
+    ):
+        self._employees_by_company: MultiValueIndex[str, Employee] = MultiValueIndex(
+            employees, lambda e: normalize_name(e.company_name), "employees_by_company"
+        )
+        self._certs_by_employee = certs_by_employee
+        self._tiebreak = tiebreak
+        self.max_indexed_rows = max_indexed_rows
+        self._partitions: "OrderedDict[str, ExpiryIndex[CertificateRecord]]" = OrderedDict()
+        self._rows = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, company_name: object) -> bool:
+        return isinstance(company_name, str) and normalize_name(company_name) in self._employees_by_company
+
+    @property
+    def indexed_rows(self) -> int:
+        return self._rows
+
+    def resident_companies(self) -> List[str]:
+        return list(self._partitions)
+
+    def get(self, company_name: str) -> ExpiryIndex[CertificateRecord]:
+        """The expiry index for one company (empty for unknown companies)."""
+        key = normalize_name(company_name)
+        with self._lock:
+            partition = self._partitions.get(key)
+            if partition is not None:
+                self._partitions.move_to_end(key)
+                return partition
+        partition = self._build(key)
+        with self._lock:
+            if key not in self._partitions:
+                self._partitions[key] = partition
+                self._rows += len(partition)
+                self._evict(keep=key)
+            return self._partitions[key]
+
+    def _build(self, key: str) -> ExpiryIndex[CertificateRecord]:
+        certs = [
+            cert
+            for employee in self._employees_by_company.get(key)
+            for cert in self._certs_by_employee.get(employee.employee_id)
+        ]
+        return ExpiryIndex(certs, tiebreak=self._tiebreak)
+
+    def _evict(self, keep: str) -> None:
+        while self._rows > self.max_indexed_rows and len(self._partitions) > 1:
+            oldest = next(iter(self._partitions))
+            if oldest == keep:
+                break
+            self._rows -= len(self._partitions.pop(oldest))
@@ -0,0 +1,339 @@
+import os
+import time
+import shutil
+import hashlib
+import logging
+import threading
+
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from itertools import chain
+from datetime import date, datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar, Union
+
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_accessor.reloadable_dataset import ReloadableDataset
+from app.data_processor.cert_tracker_service import CertTrackerService, DEFAULT_MAX_INDEXED_ROWS
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.certificate_record import CertificateRecord
+
+logger = logging.getLogger(__name__)
+
+S = TypeVar("S")
+
+# Seconds between warm-up attempts while loading keeps failing
+DEFAULT_WARM_UP_RETRY_SECONDS = 10.0
+
+def certificate_key(cert: Union[EmployeeCertificate, CertificateRecord]) -> Tuple[int, str, date]:
+    """What makes an uploaded certificate a duplicate of one already on file."""
+    return (cert.employee_id, cert.course_id, cert.issue_date)
+
+def new_certificates(
+    certs: List[EmployeeCertificate],
+    on_file: Iterable[Union[EmployeeCertificate, CertificateRecord]],
+    seen: Optional[Set[Tuple[int, str, date]]] = None,
+) -> List[EmployeeCertificate]:
+    """certs without those whose key is on file, in seen or repeats an earlier cert, in order; seen gains the kept keys."""
+    seen = set() if seen is None else seen
+    seen.update(certificate_key(c) for c in on_file)
+    fresh: List[EmployeeCertificate] = []
+    for cert in certs:
+        key = certificate_key(cert)
+        if key not in seen:
+            seen.add(key)
+            fresh.append(cert)
+    return fresh
+
+@dataclass
+class LoadStatus:
+    """Progress of one warm-up step, as reported by the readiness endpoint."""
+    state: str = "pending"
+    seconds: Optional[float] = None
+    error: Optional[str] = None
+
+class ServiceRegistry(ABC, Generic[S]):
+    """
+    Builds a query service, reports warm-up progress and swaps in a fresh
+    service when `refresh` (run periodically by `start`) detects changed data.
+    """
+    steps: Tuple[str, ...] = ("service",)
+
+    def __init__(self) -> None:
+        self._service: Optional[S] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._warm_up_thread: Optional[threading.Thread] = None
+        self._listeners: List[Callable[[Iterable[EmployeeCertificate]], Any]] = []
+        self.load_status: Dict[str, LoadStatus] = {name: LoadStatus() for name in self.steps}
+
+    @property
+    def ready(self) -> bool:
+        return self._service is not None
+
+    def _timed(self, name: str, step: Callable[[], Any]) -> None:
+        status = self.load_status[name]
+        status.state, status.error = "loading", None
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:
+            status.state, status.error = "failed", f"{type(exc).__name__}: {exc}"
+            raise
+        else:
+            status.state = "ready"
+        finally:
+            status.seconds = round(time.perf_counter() - started, 6)
+
+    def warm_up(self) -> None:
+        self._timed("service", self.service)
+
+    def status(self) -> Dict[str, Any]:
+        service = self._service
+        return {
+            "ready": service is not None,
+            "version": getattr(service, "version", None),
+            "steps": {name: asdict(status) for name, status in self.load_status.items()},
+        }
+
+    def service(self) -> S:
+        """Return the live service, building it on first use."""
+        service = self._service
+        if service is None:
+            with self._lock:
+                if self._service is None:
+                    self._service = self._build_service()
+                service = self._service
+        return service
+
+    @abstractmethod
+    def _build_service(self) -> S: ...
+
+    @abstractmethod
+    def refresh(self) -> bool:
+        """Swap in a new service if the underlying data changed; returns True if it did."""
+
+    def append_certificates(self, certs: List[EmployeeCertificate]) -> int:
+        """Persist certs and merge them into the live service without a full reload; see append_certificate_batches."""
+        return self.append_certificate_batches([certs])
+
+    @abstractmethod
+    def append_certificate_batches(self, batches: Iterable[List[EmployeeCertificate]]) -> int:
+        """
+        Stage batches of certificates as they arrive, then persist and merge them all at once.
+
+        Each batch is written to staging storage before the next is read, so
+        memory stays bounded however many batches there are, and nothing is
+        applied unless every batch was staged. Certificates already on file
+        (same employee_id, course_id and issue_date), or repeated within the
+        batches, are skipped, so re-uploading a file is harmless. Returns the
+        number of rows appended.
+        """
+
+    def on_certificates_added(self, listener: Callable[[Iterable[EmployeeCertificate]], Any]) -> None:
+        """Call listener with the certificates merged into an already loaded dataset (appends and appended files)."""
+        self._listeners.append(listener)
+
+    def _certificates_added(self, certs: Callable[[], Iterable[EmployeeCertificate]]) -> None:
+        # certs makes a fresh iterator per listener, so nothing is materialized for them
+        for listener in self._listeners:
+            try:
+                listener(certs())
+            except Exception:
+                # The certificates are merged either way
+                logger.exception("Certificate listener %r failed", listener)
+
+    def start_warm_up(self, retry_interval: float = DEFAULT_WARM_UP_RETRY_SECONDS) -> None:
+        """
+        Run warm_up on a daemon thread, retrying every retry_interval seconds until it succeeds.
+
+        Failures are logged and left in load_status, so the readiness endpoint
+        reports them instead of the server failing to start. Steps that did
+        succeed keep their loaded data, so a retry only redoes the failed ones.
+        """
+        if self._warm_up_thread is not None:
+            return
+        self._warm_up_thread = threading.Thread(
+            target=self._warm_up_until_ready, args=(retry_interval,), name="dataset-warmup", daemon=True,
+        )
+        self._warm_up_thread.start()
+
+    def _warm_up_until_ready(self, retry_interval: float) -> None:
+        while True:
+            try:
+                self.warm_up()
+            except Exception:
+                logger.exception("Warm-up failed; retrying in %.0f s", retry_interval)
+            else:
+                logger.info("Datasets ready: %s", self.status())
+                return
+            if self._stop.wait(retry_interval):
+                return
+
+    def start(self, interval: float) -> None:
+        """Poll for changes every interval seconds on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, args=(interval,), name="dataset-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                if self.refresh():
+                    logger.info("Datasets reloaded")
+            except Exception:
+                # Keep serving the previous data if a reload fails
+                logger.exception("Dataset reload failed")
+
+class DatasetRegistry(ServiceRegistry[CertTrackerService]):
+    """
+    Owns the three reloadable datasets and the CertTrackerService built from them.
+
+    `refresh` (run periodically by `start`) rebuilds changed datasets and then a
+    new service in the calling thread, and swaps the service in atomically;
+    requests keep using the previous service until the new one is complete.
+    """
+    steps = ("employee_certs", "courses", "employees", "service")
+
+    def __init__(
+        self,
+        employee_certs: ReloadableDataset[EmployeeCertificateHandler],
+        courses: ReloadableDataset[CourseHandler],
+        employees: ReloadableDataset[EmployeeHandler],
+        max_indexed_rows: int = DEFAULT_MAX_INDEXED_ROWS,
+    ):
+        super().__init__()
+        self.employee_certs = employee_certs
+        self.courses = courses
+        self.employees = employees
+        self.max_indexed_rows = max_indexed_rows
+
+    def warm_up(self, max_workers: int = 3) -> None:
+        """Load the three datasets concurrently in a thread pool, then build the service."""
+        datasets: Dict[str, ReloadableDataset[Any]] = {
+            "employee_certs": self.employee_certs, "courses": self.courses, "employees": self.employees,
+        }
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dataset-warmup") as pool:
+            futures = [pool.submit(self._timed, name, dataset.current) for name, dataset in datasets.items()]
+            for future in futures:
+                future.result()
+        self._timed("service", self.service)
+
+    def _version(self) -> Tuple[str, datetime]:
+        states = [dataset.current_with_state()[1] for dataset in (self.employee_certs, self.courses, self.employees)]
+        # Derived from the source files only, so every worker serving the same
+        # files reports the same version
+        version = hashlib.sha1(
+            "|".join(f"{s.size}:{s.mtime_ns}:{s.tail_signature}" for s in states).encode()
+        ).hexdigest()[:16]
+        last_modified = datetime.fromtimestamp(max(s.mtime_ns for s in states) / 1e9, tz=timezone.utc)
+        return version, last_modified
+
+    def _build_service(self) -> CertTrackerService:
+        employee_certs = self.employee_certs.current()
+        courses = self.courses.current()
+        employees = self.employees.current()
+        version, last_modified = self._version()
+        return CertTrackerService(
+            employee_certs,
+            courses,
+            employees,
+            version=version,
+            last_modified=last_modified,
+            max_indexed_rows=self.max_indexed_rows,
+        )
+
+    def refresh(self) -> bool:
+        """Reload changed datasets and swap in a new service; returns True if anything changed."""
+        with self._lock:
+            loaded = self._service is not None
+            old = self.employee_certs.current().load_records() if loaded else []
+            changed = [dataset.refresh() for dataset in (self.employee_certs, self.courses, self.employees)]
+            if any(changed) or self._service is None:
+                self._service = self._build_service()
+                added = _appended(old, self.employee_certs.current().load_records()) if loaded and changed[0] else []
+            else:
+                return False
+        if added:
+            self._certificates_added(lambda: (record.to_model() for record in added))
+        return True
+
+    def append_certificate_batches(self, batches: Iterable[List[EmployeeCertificate]]) -> int:
+        """
+        Stage new certs in a file next to employee_certs.csv, then swap in the grown file with one os.replace.
+
+        Memory holds one batch plus the keys of the staged rows. The swap
+        copies employee_certs.csv once; the existing rows keep their bytes,
+        so the reload that follows parses only the appended ones.
+        """
+        path = self.employee_certs.file_path
+        staged = path.with_suffix(f".staged-{os.getpid()}")
+        grown = path.with_suffix(f".tmp-{os.getpid()}")
+        with self._lock:
+            service = self._service
+            if service is None:
+                service = self._service = self._build_service()
+            old = self.employee_certs.current().load_records()
+            try:
+                count = self._stage(service, batches, staged)
+                if not count:
+                    return 0
+                shutil.copyfile(path, grown)
+                with grown.open("r+b") as out, staged.open("rb") as rows:
+                    if out.seek(0, os.SEEK_END):
+                        out.seek(-1, os.SEEK_END)
+                        # Never glue the first new row onto an unterminated last line
+                        if out.read(1) != b"\n":
+                            out.write(b"\n")
+                    rows.readline()
+                    shutil.copyfileobj(rows, out)
+                os.replace(grown, path)
+            finally:
+                staged.unlink(missing_ok=True)
+                grown.unlink(missing_ok=True)
+            before = self.employee_certs.version
+            self.employee_certs.refresh()
+            added = _appended(old, self.employee_certs.current().load_records())
+            if self.employee_certs.version != before + 1 or len(added) != count:
+                # The file had also changed underneath us; rebuild from the datasets
+                self._service = self._build_service()
+            else:
+                version, last_modified = self._version()
+                self._service = service.with_certificates(added, version, last_modified)
+        self._certificates_added(lambda: (record.to_model() for record in added))
+        return count
+
+    def _stage(self, service: CertTrackerService, batches: Iterable[List[EmployeeCertificate]], staged: Path) -> int:
+        # Rows go to a CSV with the live file's header, batch by batch
+        with self.employee_certs.file_path.open("rb") as f:
+            staged.write_bytes(f.readline())
+        staging = EmployeeCertificateHandler(staged)
+        seen: Set[Tuple[int, str, date]] = set()
+        count = 0
+        for batch in batches:
+            on_file = chain.from_iterable(service.certs_by_employee.get(i) for i in {c.employee_id for c in batch})
+            fresh = new_certificates(batch, on_file, seen)
+            if fresh:
+                staging.append_to_file(fresh)
+                count += len(fresh)
+        return count
+
+
+def _appended(old: List[CertificateRecord], new: List[CertificateRecord]) -> List[CertificateRecord]:
+    # An incremental reload keeps the old records and adds the new rows after
+    # them; after a full reload nothing can be told apart, so nothing is reported
+    if len(new) <= len(old) or (old and new[len(old) - 1] is not old[-1]):
+        return []
+    return new[len(old):]
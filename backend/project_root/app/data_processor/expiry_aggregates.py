@@ -0,0 +1,68 @@
+from datetime import date
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.instrumentation.metrics import INDEX_BUILD_SECONDS, timed
+
+
+class ExpiryHistogram:
+    """
+    Per-group cumulative counts over the distinct expiry days of each group.
+
+    For every group we keep its sorted expiry days and a running total, so the
+    number of certificates in any [start, end] range is two bisects and a
+    subtraction per group: O(groups * log days), independent of the number of
+    certificates.
+    """
+    def __init__(self, entries: Iterable[Tuple[str, date]], name: str = "expiry_histogram"):
+        self.name = name
+        self._days: Dict[str, List[date]] = {}
+        self._cumulative: Dict[str, List[int]] = {}
+        with timed(INDEX_BUILD_SECONDS, index=name):
+            self._add(_count_by_group(entries))
+
+    def _add(self, per_group: Dict[str, Counter[date]]) -> None:
+        for group, counter in per_group.items():
+            # Fold in the group's existing per-day counts, if any
+            previous = 0
+            for day, total in zip(self._days.get(group, ()), self._cumulative.get(group, ())):
+                counter[day] += total - previous
+                previous = total
+            days = sorted(counter)
+            running, cumulative = 0, []
+            for day in days:
+                running += counter[day]
+                cumulative.append(running)
+            self._days[group] = days
+            self._cumulative[group] = cumulative
+
+    def extended(self, entries: Iterable[Tuple[str, date]]) -> "ExpiryHistogram":
+        """A new histogram with entries added; only the groups they touch are rebuilt."""
+        histogram = ExpiryHistogram((), self.name)
+        histogram._days = dict(self._days)
+        histogram._cumulative = dict(self._cumulative)
+        with timed(INDEX_BUILD_SECONDS, index=self.name):
+            histogram._add(_count_by_group(entries))
+        return histogram
+
+    def groups(self) -> List[str]:
+        return sorted(self._days)
+
+    def counts(self, start: Optional[date], end: Optional[date]) -> Dict[str, int]:
+        """Certificates per group with start <= expiry_date <= end (groups with zero omitted)."""
+        result: Dict[str, int] = {}
+        for group, days in self._days.items():
+            cumulative = self._cumulative[group]
+            lo = 0 if start is None else bisect_left(days, start)
+            hi = len(days) if end is None else bisect_right(days, end)
+            if hi > lo:
+                result[group] = cumulative[hi - 1] - (cumulative[lo - 1] if lo else 0)
+        return dict(sorted(result.items()))
+
+
+def _count_by_group(entries: Iterable[Tuple[str, date]]) -> Dict[str, Counter[date]]:
+    per_group: Dict[str, Counter[date]] = {}
+    for group, expiry_date in entries:
+        per_group.setdefault(group, Counter())[expiry_date] += 1
+    return per_group
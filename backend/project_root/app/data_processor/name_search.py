@@ -0,0 +1,48 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+from app.data_models.course import Course
+from app.data_models.employee import Employee
+from app.data_models.search_result import SearchKind, SearchResult
+from app.data_accessor.indexes.search_index import SearchIndex
+
+SEARCH_KINDS: Tuple[SearchKind, ...] = ("employee", "company", "course", "certificate")
+
+class NameSearch:
+    """
+    Type-ahead search over employee full names, company names, course names
+    and certificate names, with one SearchIndex per kind.
+
+    Companies are the company names of the loaded employees, which are the
+    companies the service can answer queries about.
+    """
+    def __init__(self, employees: Iterable[Employee], courses: Iterable[Course]):
+        employees = list(employees)
+        courses = list(courses)
+        self.indexes: Dict[SearchKind, SearchIndex[Any]] = {
+            "employee": SearchIndex(
+                ((f"{e.first_name} {e.last_name}", e.employee_id) for e in employees), "search_employee"
+            ),
+            "company": SearchIndex(
+                ((name, None) for name in dict.fromkeys(e.company_name for e in employees)), "search_company"
+            ),
+            "course": SearchIndex(((c.course_name, c.course_id) for c in courses), "search_course"),
+            "certificate": SearchIndex(((c.certificate_name, c.course_id) for c in courses), "search_certificate"),
+        }
+
+    def search(self, query: str, kinds: Iterable[SearchKind] = SEARCH_KINDS, limit: int = 10) -> List[SearchResult]:
+        """The limit best matches across the requested kinds; ties keep the SEARCH_KINDS order."""
+        wanted = set(kinds)
+        results: List[SearchResult] = []
+        for kind in SEARCH_KINDS:
+            if kind not in wanted:
+                continue
+            for match in self.indexes[kind].search(query, limit):
+                results.append(SearchResult(
+                    kind=kind,
+                    name=match.name,
+                    match=match.match,
+                    score=match.score,
+                    ids=[value for value in match.values if value is not None],
+                ))
+        results.sort(key=lambda r: -r.score)
+        return results[:limit]
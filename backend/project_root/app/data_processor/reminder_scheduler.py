@@ -0,0 +1,142 @@
+import os
+import json
+import logging
+import threading
+
+from pathlib import Path
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+from app.data_models.reminder import Reminder
+from app.data_models.employee_certificate import EmployeeCertificate
+
+logger = logging.getLogger(__name__)
+
+# Days before expiry at which a reminder is due; 0 is the expiry day itself
+DEFAULT_THRESHOLDS = (90, 60, 30, 0)
+
+@dataclass
+class _Cursor:
+    # Day before the first run; crossings up to it are never owed
+    since: date
+    last_run: date
+    # Reminders for certificates merged after their crossing day, emitted by the next tick
+    pending: List[Reminder] = field(default_factory=list)
+
+
+class ReminderScheduler:
+    """
+    Emits each certificate once per threshold, on the day it comes within that
+    many days of expiry.
+
+    A certificate crosses threshold t on expiry_date - t, so the crossings
+    since the last run are exactly the certificates expiring in
+    (last_run + t, today + t]. Those are range queries on the service's
+    sorted expiry index, so a tick costs O(thresholds * log n + crossings)
+    however large the dataset is; missed days are caught up on the next
+    tick. A certificate merged after its crossing day (an upload or an
+    appended file) falls outside those ranges, so the registry hands new
+    certificates to `enqueue`, which queues the reminders the earlier ticks
+    would have emitted. The cursor (first and last run, and the queued
+    reminders) is persisted to cursor_path, written atomically, so a restart
+    neither re-emits nor skips reminders; a cursor that cannot be read is
+    logged and replaced as on a first run.
+    """
+    def __init__(
+        self,
+        service: Callable[[], Any],
+        cursor_path: Path,
+        thresholds: Sequence[int] = DEFAULT_THRESHOLDS,
+    ):
+        if any(t < 0 for t in thresholds):
+            raise ValueError("thresholds must be non-negative")
+        # Called on every tick so the live (possibly reloaded) service is used
+        self._service = service
+        self.cursor_path = cursor_path
+        self.thresholds = tuple(sorted(set(thresholds), reverse=True))
+        self._lock = threading.Lock()
+
+    def last_run(self) -> Optional[date]:
+        cursor = self._load()
+        return cursor.last_run if cursor else None
+
+    def _load(self) -> Optional[_Cursor]:
+        try:
+            data = json.loads(self.cursor_path.read_text())
+            return _Cursor(
+                # Cursors written before "since" was recorded had emitted everything up to last_run
+                since=date.fromisoformat(data.get("since", data["last_run"])),
+                last_run=date.fromisoformat(data["last_run"]),
+                pending=[Reminder.model_validate(r) for r in data.get("pending", [])],
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable reminder cursor %s: %s", self.cursor_path, exc)
+            return None
+
+    def _save(self, cursor: _Cursor) -> None:
+        self.cursor_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cursor_path.with_suffix(f".tmp-{os.getpid()}")
+        tmp.write_text(json.dumps({
+            "since": cursor.since.isoformat(),
+            "last_run": cursor.last_run.isoformat(),
+            "pending": [r.model_dump(mode="json") for r in cursor.pending],
+        }))
+        os.replace(tmp, self.cursor_path)
+
+    def _due(self, today: date, cursor: Optional[_Cursor]) -> List[Reminder]:
+        reminders = list(cursor.pending) if cursor else []
+        last = cursor.last_run if cursor else today - timedelta(days=1)
+        if today > last:
+            service = self._service()
+            for threshold in self.thresholds:
+                offset = timedelta(days=threshold)
+                for cert in service.iter_expiring_certificates(last + offset + timedelta(days=1), today + offset):
+                    reminders.append(Reminder(threshold_days=threshold, due=cert.expiry_date - offset, certificate=cert))
+        # Queued reminders join the crossings of their threshold
+        return sorted(reminders, key=lambda r: (-r.threshold_days, r.certificate.expiry_date))
+
+    def due(self, today: date) -> List[Reminder]:
+        """Reminders the next tick on today would emit, by threshold (largest first) then expiry order."""
+        return self._due(today, self._load())
+
+    def enqueue(self, certs: Iterable[EmployeeCertificate]) -> int:
+        """
+        Queue reminders for newly merged certs whose crossing days have already been ticked.
+
+        Only crossings after the first run and certificates not expired by the
+        last run are owed, as for certificates that were there all along.
+        Returns the number of reminders queued.
+        """
+        with self._lock:
+            cursor = self._load()
+            if cursor is None:
+                # No tick yet: the first one starts from its own day
+                return 0
+            late = [
+                Reminder(threshold_days=t, due=cert.expiry_date - timedelta(days=t), certificate=cert)
+                for cert in certs
+                for t in self.thresholds
+                if cursor.since < cert.expiry_date - timedelta(days=t) <= cursor.last_run < cert.expiry_date
+            ]
+            if late:
+                cursor.pending.extend(late)
+                self._save(cursor)
+        if late:
+            logger.info("Queued %d reminders for certificates added after their reminder day", len(late))
+        return len(late)
+
+    def tick(self, today: Optional[date] = None) -> List[Reminder]:
+        """Return the crossings since the last tick plus queued reminders, and advance the persisted cursor to today."""
+        today = today or date.today()
+        with self._lock:
+            cursor = self._load()
+            reminders = self._due(today, cursor)
+            if cursor is None:
+                self._save(_Cursor(since=today - timedelta(days=1), last_run=today))
+            elif today > cursor.last_run or cursor.pending:
+                self._save(_Cursor(cursor.since, max(today, cursor.last_run)))
+        logger.info("Reminder tick for %s: %d reminders", today, len(reminders))
+        return reminders
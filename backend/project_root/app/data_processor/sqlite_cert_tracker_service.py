@@ -0,0 +1,135 @@
+from datetime import date, datetime, timezone
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from app.instrumentation.metrics import timed_query
+from app.data_models.expiry_summary import ExpirySummary
+from app.data_models.search_result import SearchKind, SearchResult
+from app.data_processor.name_search import SEARCH_KINDS, NameSearch
+from app.data_models.enriched_certificate import EnrichedCertificate
+from app.data_accessor.indexes.expiry_index import SortKey
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_accessor.sqlite.course_handler import CourseHandler
+from app.data_accessor.sqlite.employee_handler import EmployeeHandler
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.sqlite.employee_certificate_handler import EmployeeCertificateHandler
+from app.data_processor.cert_tracker_service import EXPIRY_GROUPINGS, UNKNOWN_COMPANY, ExpiryGrouping
+
+class SqliteCertTrackerService:
+    """
+    CertTrackerService counterpart that answers every query from SQLite indexes.
+
+    Nothing is loaded up front, so start-up is instant and datasets larger
+    than RAM stay queryable; results and cursors match CertTrackerService.
+    """
+    def __init__(self, database: SqliteDatabase):
+        self.database = database
+        meta = database.meta()
+        # Written by the importer; changes on every import
+        self.version = meta.get("version", "empty")
+        imported_at = meta.get("imported_at")
+        self.last_modified = (
+            datetime.fromisoformat(imported_at) if imported_at else datetime.now(timezone.utc)
+        ).replace(microsecond=0)
+        self.employee_certs = EmployeeCertificateHandler(database)
+        self.courses = CourseHandler(database)
+        self.employees = EmployeeHandler(database)
+        self._name_search: Optional[NameSearch] = None
+
+    @timed_query
+    def get_expiring_certificates(self, start: Optional[date], end: Optional[date]) -> List[EmployeeCertificate]:
+        """Certificates expiring between start and end (inclusive), in cursor order."""
+        return list(self.employee_certs.iter_range(start, end))
+
+    @timed_query
+    def get_next_expiring_certificates(self, n: int, after: Optional[date] = None) -> List[EmployeeCertificate]:
+        """The next n certificates to expire on or after the given date (default: today)."""
+        return self.employee_certs.next_expiring(after or date.today(), n)
+
+    def iter_expiring_certificates(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        after: Optional[SortKey] = None,
+    ) -> Iterator[EmployeeCertificate]:
+        """Lazily yield certificates expiring between start and end, resuming after a cursor key."""
+        return self.employee_certs.iter_range(start, end, after)
+
+    @timed_query
+    def page_expiring_certificates(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        limit: int,
+        after: Optional[SortKey] = None,
+    ) -> Tuple[List[EmployeeCertificate], Optional[SortKey]]:
+        """One page of expiring certificates and the cursor key of the next page, if any."""
+        return self.employee_certs.page(start, end, limit, after)
+
+    @timed_query
+    def page_enriched_expiring_certificates(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        limit: Optional[int] = None,
+        after: Optional[SortKey] = None,
+    ) -> Tuple[List[EnrichedCertificate], Optional[SortKey]]:
+        """Expiring certificates with employee and course details, in the same order and with the same cursors as the plain queries."""
+        if limit is not None:
+            return self.employee_certs.page_enriched(start, end, limit, after)
+        certs: List[EnrichedCertificate] = []
+        while True:
+            page, after = self.employee_certs.page_enriched(start, end, 1000, after)
+            certs.extend(page)
+            if after is None:
+                return certs, None
+
+    @timed_query
+    def get_expiry_summary(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        group_by: Iterable[ExpiryGrouping] = EXPIRY_GROUPINGS,
+    ) -> ExpirySummary:
+        """Counts of certificates expiring in the range, grouped by course, company and/or expiry month."""
+        groups = set(group_by)
+        counts = {
+            g: self.employee_certs.expiry_counts(g, start, end, UNKNOWN_COMPANY)
+            for g in EXPIRY_GROUPINGS if g in groups
+        }
+        return ExpirySummary(
+            start=start,
+            end=end,
+            total=self.employee_certs.count(start, end),
+            by_course_id=counts.get("course_id"),
+            by_company=counts.get("company"),
+            by_month=counts.get("month"),
+        )
+
+    def has_company(self, company_name: str) -> bool:
+        return self.employees.has_company(company_name)
+
+    @property
+    def name_search(self) -> NameSearch:
+        """Search indexes over the employee and course tables, built on the first search of this version."""
+        if self._name_search is None:
+            self._name_search = NameSearch(self.employees.load_all(), self.courses.load_all())
+        return self._name_search
+
+    @timed_query
+    def search_names(self, query: str, kinds: Iterable[SearchKind] = SEARCH_KINDS, limit: int = 10) -> List[SearchResult]:
+        """Top-limit employee, company, course and certificate names matching query (prefix first, then fuzzy)."""
+        return self.name_search.search(query, kinds, limit)
+
+    @timed_query
+    def page_company_expiring_certificates(
+        self,
+        company_name: str,
+        start: Optional[date],
+        end: Optional[date],
+        limit: Optional[int] = None,
+        after: Optional[SortKey] = None,
+    ) -> Tuple[List[EmployeeCertificate], Optional[SortKey]]:
+        """Expiring certificates of one company's employees."""
+        if limit is None:
+            return list(self.employee_certs.iter_range(start, end, after, company_name)), None
+        return self.employee_certs.page(start, end, limit, after, company_name)
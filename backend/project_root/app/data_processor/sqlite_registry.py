@@ -0,0 +1,51 @@
+import uuid
+
+from typing import Iterable, List
+from datetime import datetime, timezone
+
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.sqlite.employee_certificate_handler import EmployeeCertificateHandler
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_processor.dataset_registry import ServiceRegistry
+from app.data_processor.sqlite_cert_tracker_service import SqliteCertTrackerService
+
+class SqliteRegistry(ServiceRegistry[SqliteCertTrackerService]):
+    """
+    Serves a SqliteCertTrackerService over an imported database.
+
+    Building the service only reads the import metadata, so warm-up is
+    instant; `refresh` swaps in a new service (and so a new version for
+    ETags and the response cache) after each re-import.
+    """
+    def __init__(self, database: SqliteDatabase):
+        super().__init__()
+        self.database = database
+
+    def _build_service(self) -> SqliteCertTrackerService:
+        return SqliteCertTrackerService(self.database)
+
+    def refresh(self) -> bool:
+        with self._lock:
+            version = self.database.meta().get("version", "empty")
+            if self._service is None or self._service.version != version:
+                self._service = self._build_service()
+                return True
+            return False
+
+    def append_certificate_batches(self, batches: Iterable[List[EmployeeCertificate]]) -> int:
+        """Stage the batches in a temporary table and insert the new certificates in one transaction."""
+        handler = EmployeeCertificateHandler(self.database)
+        with self._lock:
+            count, last = handler.append_staged(batches, {
+                "version": uuid.uuid4().hex[:16],
+                "imported_at": datetime.now(timezone.utc).isoformat(),
+            })
+            if not count:
+                return 0
+            self._service = self._build_service()
+        self._certificates_added(lambda: handler.iter_after(last))
+        return count
+
+    def stop(self) -> None:
+        super().stop()
+        self.database.close()
@@ -0,0 +1,30 @@
+import time
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+from app.instrumentation.metrics import HTTP_REQUEST_SECONDS, server_timing_header, start_server_timing
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """
+    Records request latency per route template and adds a Server-Timing header
+    listing the service queries timed during the request plus the total.
+    """
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        timings = start_server_timing()
+        started = time.perf_counter()
+        response = await call_next(request)
+        elapsed = time.perf_counter() - started
+        # Label by route template, not raw path, to keep cardinality bounded
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            elapsed,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(response.status_code),
+        )
+        timings.append(("total", elapsed))
+        response.headers["Server-Timing"] = server_timing_header(timings)
+        return response
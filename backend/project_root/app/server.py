@@ -1,17 +1,46 @@
 import uvicorn
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from fastapi import FastAPI
 from app.api.cert_tracker_api import router 
+from app.api.health_api import router as health_router
+from app.api.upload_api import router as upload_router
+from app.api.reminder_api import router as reminder_router
+from app.api.lookup_api import router as lookup_router
+from app.api.search_api import router as search_router
+from app.api.metrics_api import router as metrics_router
+from app.instrumentation.middleware import MetricsMiddleware
+from app.api.cert_tracker_cache import get_registry, get_reload_interval
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Load in the background so the server starts even when loading fails;
+    # /ready answers 503 with the failing step until warm-up succeeds
+    registry = get_registry()
+    registry.start_warm_up()
+    interval = get_reload_interval()
+    if interval > 0:
+        registry.start(interval)
+    yield
+    registry.stop()
 
 # Create FastAPI app
-app = FastAPI(title="Certificate Manager")
+app = FastAPI(title="Certificate Manager", lifespan=lifespan)
 
 # Mount API routers
 app.include_router(router, prefix="/api")
+app.include_router(upload_router, prefix="/api")
+app.include_router(reminder_router, prefix="/api")
+app.include_router(lookup_router, prefix="/api")
+app.include_router(search_router, prefix="/api")
+app.include_router(health_router)
+app.include_router(metrics_router)
+app.add_middleware(MetricsMiddleware)
 
 if __name__ == "__main__":
     uvicorn.run(
-        "app.main:app",    # module:path to app instance
+        "app.server:app",  # module:path to app instance
         host="0.0.0.0",    # listen on all interfaces
         port=8000,
         reload=True         # auto-reload on code changes (dev only)
-    )
\ No newline at end of file
+    )
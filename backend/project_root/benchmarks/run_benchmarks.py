@@ -0,0 +1,312 @@
+"""
+Benchmark suite for handlers, CertTrackerService and the HTTP API.
+
+    python -m benchmarks.run_benchmarks run --certificates 100000
+    python -m benchmarks.run_benchmarks compare results/old.json results/new.json
+
+`run` generates (or reuses) a synthetic dataset, times each scenario and
+writes the results as JSON under benchmarks/results/ so runs can be diffed.
+"""
+import gc
+import json
+import time
+import random
+import asyncio
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from pathlib import Path
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import typer
+from fastapi import FastAPI
+
+from app.data_models.course import Course
+from app.data_accessor.snapshot import SnapshotCache
+from app.data_accessor.chunk_validation import ParallelLoad
+from app.api.cert_tracker_api import router
+from app.api.response_cache import ResponseCache
+from app.api.cert_tracker_cache import get_response_cache, get_service
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_processor.cert_tracker_service import CertTrackerService
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+from app.data_accessor.pandas.employee_handler import EmployeeHandler as PandasEmployeeHandler
+from app.data_accessor.pandas.employee_certificate_handler import (
+    EmployeeCertificateHandler as PandasEmployeeCertificateHandler,
+)
+from app.data_accessor.lazy.employee_certificate_handler import (
+    EmployeeCertificateHandler as LazyEmployeeCertificateHandler,
+)
+from benchmarks.synthetic_data import DatasetSize, generate
+
+cli = typer.Typer(help=__doc__)
+
+BENCH_DIR = Path(__file__).parent
+RESULTS_DIR = BENCH_DIR / "results"
+
+
+class Suite:
+    """Collects timing and memory results for one run."""
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.results: List[Dict[str, Any]] = []
+
+    def time(self, group: str, name: str, fn: Callable[[], Any], repeat: Optional[int] = None, **extra: Any) -> None:
+        samples = []
+        for _ in range(repeat or self.repeat):
+            gc.collect()
+            started = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - started) * 1000)
+        self.record(group, name, samples, extra)
+
+    def memory(self, group: str, name: str, fn: Callable[[], Any]) -> None:
+        """Peak traced Python allocations while fn runs, and what its result keeps alive (timed separately: tracing slows code down)."""
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = fn()
+            gc.collect()
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+        entry = self._find(group, name)
+        if entry is not None:
+            entry["peak_mb"] = round(peak / 2**20, 2)
+            entry["retained_mb"] = round(retained / 2**20, 2)
+
+    def _find(self, group: str, name: str) -> Optional[Dict[str, Any]]:
+        return next((r for r in self.results if r["group"] == group and r["name"] == name), None)
+
+    def record(self, group: str, name: str, samples: List[float], extra: Dict[str, Any]) -> None:
+        ordered = sorted(samples)
+        entry = {
+            "group": group,
+            "name": name,
+            "runs": len(samples),
+            "min_ms": round(ordered[0], 4),
+            "median_ms": round(statistics.median(ordered), 4),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+            "mean_ms": round(statistics.fmean(ordered), 4),
+            **extra,
+        }
+        self.results.append(entry)
+        typer.echo(f"{group:>8} {name:<48} median {entry['median_ms']:>10.3f} ms  p95 {entry['p95_ms']:>10.3f} ms")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=BENCH_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_loading(suite: Suite, data_dir: Path, snapshot_dir: Path) -> None:
+    certs = data_dir / "employee_certs.csv"
+    employees = data_dir / "employees.csv"
+
+    suite.time("load", "csv certificates load_all", lambda: EmployeeCertificateHandler(certs).load_all(), repeat=1)
+    suite.memory("load", "csv certificates load_all", lambda: EmployeeCertificateHandler(certs).load_all())
+    # The compact records the handler caches, against the models above
+    suite.time("load", "csv certificates load_records", lambda: EmployeeCertificateHandler(certs).load_records(), repeat=1)
+    suite.memory("load", "csv certificates load_records", lambda: EmployeeCertificateHandler(certs).load_records())
+    suite.time("load", "csv employees load_all", lambda: EmployeeHandler(employees).load_all(), repeat=1)
+    suite.time("load", "pandas columnar certificates", lambda: PandasEmployeeCertificateHandler(certs), repeat=1)
+    suite.memory("load", "pandas columnar certificates", lambda: PandasEmployeeCertificateHandler(certs))
+    # Mapped file pages are page cache, not heap; only the index and key arrays are retained
+    suite.time("load", "mmap lazy certificates", lambda: LazyEmployeeCertificateHandler(certs), repeat=1)
+    suite.memory("load", "mmap lazy certificates", lambda: LazyEmployeeCertificateHandler(certs))
+    suite.memory("load", "mmap lazy certificates (no keys)", lambda: LazyEmployeeCertificateHandler(certs, key_columns=None))
+    parallel = ParallelLoad(min_bytes=0)
+    if parallel.workers > 1:
+        suite.time(
+            "load", f"parallel csv certificates load_all ({parallel.workers} workers)",
+            lambda: EmployeeCertificateHandler(certs, parallel=parallel).load_all(), repeat=1,
+        )
+
+    # First load writes the snapshot, later ones read it
+    EmployeeCertificateHandler(certs, SnapshotCache(snapshot_dir)).load_all()
+    EmployeeHandler(employees, SnapshotCache(snapshot_dir)).load_all()
+    for trusted in (False, True):
+        label = "trusted" if trusted else "validated"
+        suite.time(
+            "load", f"snapshot certificates ({label})",
+            lambda trusted=trusted: EmployeeCertificateHandler(certs, SnapshotCache(snapshot_dir, trusted)).load_all(), repeat=1,
+        )
+        suite.time(
+            "load", f"snapshot employees ({label})",
+            lambda trusted=trusted: EmployeeHandler(employees, SnapshotCache(snapshot_dir, trusted)).load_all(), repeat=1,
+        )
+
+
+def bench_lookups(suite: Suite, data_dir: Path, rng: random.Random) -> None:
+    certs = EmployeeCertificateHandler(data_dir / "employee_certs.csv")
+    employees = EmployeeHandler(data_dir / "employees.csv")
+    pandas_certs = PandasEmployeeCertificateHandler(data_dir / "employee_certs.csv")
+    lazy_certs = LazyEmployeeCertificateHandler(data_dir / "employee_certs.csv")
+    pandas_employees = PandasEmployeeHandler(data_dir / "employees.csv")
+    people = employees.load_all()
+    sample = [rng.choice(people) for _ in range(100)]
+    # Warm the caches and the name index so only the lookups are timed
+    certs.load_all()
+    _ = employees.name_index
+
+    suite.time("lookup", "csv employee get_by_id x100", lambda: [employees.get_by_id(e.employee_id) for e in sample])
+    suite.time("lookup", "pandas employee get_by_id x100", lambda: [pandas_employees.get_by_id(e.employee_id) for e in sample])
+    suite.time(
+        "lookup", "csv employee name x100",
+        lambda: [employees.get_employee_email(e.first_name, e.last_name) for e in sample],
+    )
+    suite.time(
+        "lookup", "pandas employee name x100",
+        lambda: [pandas_employees.get_company_name_from_employee_name(f"{e.first_name} {e.last_name}") for e in sample],
+    )
+    suite.time(
+        "lookup", "csv certificates by employee x100",
+        lambda: [certs.get_employee_certificates_by_employee_id(e.employee_id) for e in sample],
+    )
+    suite.time(
+        "lookup", "pandas certificates by employee x100",
+        lambda: [pandas_certs.get_employee_certificates_by_employee_id(e.employee_id) for e in sample],
+    )
+    suite.time(
+        "lookup", "mmap lazy certificates by employee x100",
+        lambda: [lazy_certs.get_employee_certificates_by_employee_id(e.employee_id) for e in sample],
+    )
+
+
+def build_service(data_dir: Path) -> CertTrackerService:
+    return CertTrackerService(
+        EmployeeCertificateHandler(data_dir / "employee_certs.csv"),
+        CourseHandler(data_dir / "courses.csv", Course),
+        EmployeeHandler(data_dir / "employees.csv"),
+    )
+
+
+def bench_ranges(suite: Suite, service: CertTrackerService, data_dir: Path) -> None:
+    pandas_certs = PandasEmployeeCertificateHandler(data_dir / "employee_certs.csv")
+    lazy_certs = LazyEmployeeCertificateHandler(data_dir / "employee_certs.csv")
+    windows = {"30 days": (date(2025, 6, 1), date(2025, 6, 30)), "1 year": (date(2025, 1, 1), date(2025, 12, 31))}
+    for label, (start, end) in windows.items():
+        count = len(service.get_expiring_certificates(start, end))
+        suite.time("range", f"service expiring {label}", lambda start=start, end=end: service.get_expiring_certificates(start, end), rows=count)
+        suite.time(
+            "range", f"pandas store expiring {label}",
+            lambda start=start, end=end: pandas_certs.get_expired_employee_certificates_by_date_range(start, end), rows=count,
+        )
+        suite.time(
+            "range", f"mmap lazy expiring {label}",
+            lambda start=start, end=end: lazy_certs.get_expired_employee_certificates_by_date_range(start, end), rows=count,
+        )
+    suite.time("range", "service next 100 expiring", lambda: service.get_next_expiring_certificates(100, date(2025, 6, 1)))
+
+
+def bench_search(suite: Suite, service: CertTrackerService, rng: random.Random) -> None:
+    employees = list(service.employees.values())
+    sample = [rng.choice(employees) for _ in range(100)]
+    queries = {
+        "name prefix": [e.first_name[:3] for e in sample],
+        "exact name": [f"{e.first_name} {e.last_name}" for e in sample],
+        "word prefix": [e.last_name[:4] for e in sample],
+        "typo": [f"{e.first_name} {e.last_name[:-1]}x" for e in sample],
+    }
+    for label, texts in queries.items():
+        suite.time("search", f"service search {label} x100", lambda texts=texts: [service.search_names(q) for q in texts])
+
+
+def bench_api(suite: Suite, service: CertTrackerService, requests: int) -> None:
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_service] = lambda: service
+    cache = ResponseCache()
+    app.dependency_overrides[get_response_cache] = lambda: cache
+    params = {"start": "2025-06-01", "end": "2025-06-30"}
+
+    async def timed_requests(headers: Dict[str, str], extra: Dict[str, Any]) -> List[float]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            samples = []
+            for _ in range(requests):
+                started = time.perf_counter()
+                response = await client.get("/api/certificates/expiring", params={**params, **extra}, headers=headers)
+                response.raise_for_status()
+                samples.append((time.perf_counter() - started) * 1000)
+            return samples
+
+    scenarios = {
+        "api expiring 30 days (cached body)": ({}, {}),
+        "api expiring 30 days page of 100": ({}, {"limit": 100}),
+        "api expiring 30 days ndjson": ({"Accept": "application/x-ndjson"}, {}),
+    }
+    for name, (headers, extra) in scenarios.items():
+        samples = asyncio.run(timed_requests(headers, extra))
+        suite.record("api", name, samples, {})
+
+
+@cli.command()
+def run(
+    certificates: int = typer.Option(100_000, help="Certificate rows in the synthetic dataset (10k-10M)"),
+    seed: int = typer.Option(0, help="Random seed for data and sampling"),
+    repeat: int = typer.Option(5, help="Repetitions for fast benchmarks"),
+    requests: int = typer.Option(50, help="HTTP requests per API scenario"),
+    data_dir: Optional[Path] = typer.Option(None, help="Reuse/generate data here (default: benchmarks/data/<n>)"),
+    output: Optional[Path] = typer.Option(None, help="Result file (default: benchmarks/results/<timestamp>-<n>.json)"),
+) -> None:
+    """Generate data if needed, run every benchmark and save the results as JSON."""
+    data_dir = data_dir or BENCH_DIR / "data" / str(certificates)
+    if not (data_dir / "employee_certs.csv").exists():
+        typer.echo(f"Generating {certificates} certificates in {data_dir}")
+        generate(data_dir, DatasetSize.for_certificates(certificates), seed)
+    snapshot_dir = data_dir / ".snapshots"
+
+    suite = Suite(repeat)
+    rng = random.Random(seed)
+    bench_loading(suite, data_dir, snapshot_dir)
+    bench_lookups(suite, data_dir, rng)
+    service = build_service(data_dir)
+    bench_ranges(suite, service, data_dir)
+    bench_search(suite, service, rng)
+    bench_api(suite, service, requests)
+
+    started = datetime.now(timezone.utc)
+    report = {
+        "meta": {
+            "timestamp": started.isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "certificates": certificates,
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": suite.results,
+    }
+    output = output or RESULTS_DIR / f"{started:%Y%m%dT%H%M%S}-{certificates}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    typer.echo(f"Results written to {output}")
+
+
+@cli.command()
+def compare(baseline: Path, candidate: Path) -> None:
+    """Print the median-time ratio (candidate / baseline) for every benchmark present in both files."""
+    def by_key(path: Path) -> Dict[str, Dict[str, Any]]:
+        return {f"{r['group']}/{r['name']}": r for r in json.loads(path.read_text())["results"]}
+
+    old, new = by_key(baseline), by_key(candidate)
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key]["median_ms"], new[key]["median_ms"]
+        ratio = after / before if before else float("inf")
+        flag = "  REGRESSION" if ratio > 1.10 else ""
+        typer.echo(f"{key:<60} {before:>10.3f} -> {after:>10.3f} ms  x{ratio:.2f}{flag}")
+
+
+if __name__ == "__main__":
+    cli()
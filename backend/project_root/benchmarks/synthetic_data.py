@@ -0,0 +1,130 @@
+"""
+Synthetic dataset generator for benchmarks.
+
+Writes employees.csv, courses.csv, companies.csv and employee_certs.csv in the
+layout cert_tracker_cache.py expects. Output is deterministic for a given
+scale and seed, and rows are streamed to disk so even 10M certificates need
+only memory proportional to the number of employees.
+
+    python -m benchmarks.synthetic_data data/bench --certificates 1000000
+"""
+import csv
+import random
+from pathlib import Path
+from datetime import date, timedelta
+from dataclasses import dataclass
+
+import typer
+
+FIRST_NAMES = [
+    "Alice", "Bob", "Cara", "Dan", "Erin", "Frank", "Grace", "Hector", "Ivy", "James",
+    "Kara", "Liam", "Mona", "Nate", "Olga", "Paul", "Quinn", "Rosa", "Sam", "Tara",
+    "Uma", "Victor", "Wendy", "Xavier", "Yara", "Zane",
+]
+LAST_NAMES = [
+    "Smith", "Brown", "Davis", "Garcia", "Hernandez", "Johnson", "Lee", "Martin", "Nguyen", "Ortiz",
+    "Patel", "Rodriguez", "Taylor", "Thompson", "White", "Wilson", "Young", "Zhang",
+]
+COMPANY_WORDS = ["Blue", "Maple", "Summit", "River", "Iron", "Cedar", "North", "Bright", "Stone", "Harbor"]
+COMPANY_SUFFIXES = ["Consulting", "Builders", "Logistics", "Studios", "Solutions", "Works", "Industries"]
+DEPARTMENTS = ["Engineering", "Operations", "Safety", "HR", "Sales", "Maintenance"]
+COURSE_TOPICS = [
+    "Aerial Lift Safety", "Asbestos Abatement", "Chainsaw Operation", "Confined Space Entry",
+    "Fall Protection", "First Aid", "Forklift Operation", "Hazmat Handling", "Lockout Tagout",
+    "Scaffold Safety", "Welding Safety", "Working at Heights",
+]
+
+SCALES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    certificates: int
+    employees: int
+    courses: int
+    companies: int
+
+    @classmethod
+    def for_certificates(cls, certificates: int) -> "DatasetSize":
+        employees = max(1, certificates // 4)
+        return cls(
+            certificates=certificates,
+            employees=employees,
+            courses=min(500, max(12, certificates // 1000)),
+            companies=max(1, employees // 50),
+        )
+
+
+def company_name(company_id: int) -> str:
+    word = COMPANY_WORDS[company_id % len(COMPANY_WORDS)]
+    suffix = COMPANY_SUFFIXES[(company_id // len(COMPANY_WORDS)) % len(COMPANY_SUFFIXES)]
+    return f"{word} {suffix} {company_id}"
+
+
+def generate(out_dir: Path, size: DatasetSize, seed: int = 0) -> None:
+    """Write the four CSV files for the given size into out_dir."""
+    rng = random.Random(seed)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    with (out_dir / "companies.csv").open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["company_id", "company_name", "company_email"])
+        for company_id in range(1, size.companies + 1):
+            writer.writerow([company_id, company_name(company_id), f"contact@company{company_id}.example.com"])
+
+    validity_years = {}
+    with (out_dir / "courses.csv").open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["course_id", "course_name", "certificate_name"])
+        for n in range(1, size.courses + 1):
+            topic = COURSE_TOPICS[n % len(COURSE_TOPICS)]
+            course_id = f"c-{n:04d}"
+            validity_years[course_id] = rng.choice((1, 2, 3, 5))
+            writer.writerow([course_id, f"{topic} {n}", f"{topic} {n} Certification"])
+    course_ids = list(validity_years)
+
+    with (out_dir / "employees.csv").open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["employee_id", "first_name", "last_name", "company_name", "department", "email"])
+        for employee_id in range(1, size.employees + 1):
+            first = rng.choice(FIRST_NAMES)
+            last = rng.choice(LAST_NAMES)
+            company_id = rng.randint(1, size.companies)
+            writer.writerow([
+                employee_id, first, last, company_name(company_id), rng.choice(DEPARTMENTS),
+                f"{first.lower()}.{last.lower()}{employee_id}@company{company_id}.example.com",
+            ])
+
+    epoch = date(2018, 1, 1)
+    span_days = (date(2025, 12, 31) - epoch).days
+    with (out_dir / "employee_certs.csv").open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["employee_id", "course_id", "certificate_name", "issue_date", "expiry_date"])
+        for _ in range(size.certificates):
+            course_id = rng.choice(course_ids)
+            topic = COURSE_TOPICS[int(course_id[2:]) % len(COURSE_TOPICS)]
+            issue = epoch + timedelta(days=rng.randrange(span_days))
+            expiry = issue + timedelta(days=365 * validity_years[course_id])
+            writer.writerow([
+                rng.randint(1, size.employees), course_id, f"{topic} {int(course_id[2:])} Certification",
+                issue.isoformat(), expiry.isoformat(),
+            ])
+
+
+def main(
+    out_dir: Path = typer.Argument(..., help="Directory to write the CSV files into"),
+    certificates: int = typer.Option(10_000, help="Number of certificate rows"),
+    seed: int = typer.Option(0, help="Random seed"),
+) -> None:
+    size = DatasetSize.for_certificates(certificates)
+    generate(out_dir, size, seed)
+    typer.echo(f"Wrote {size} to {out_dir}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
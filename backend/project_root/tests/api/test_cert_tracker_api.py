@@ -0,0 +1,198 @@
+import json
+import pytest
+from pathlib import Path
+from textwrap import dedent
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.data_models.course import Course
+from app.api.cert_tracker_api import router
+from app.api.response_cache import ResponseCache
+from app.api.cert_tracker_cache import get_response_cache, get_service
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_processor.cert_tracker_service import CertTrackerService
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> CertTrackerService:
+    certs = tmp_path / "employee_certs.csv"
+    certs.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+        2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+        1,c-222,Chainsaw Operation Certification,2022-11-01,2025-11-01
+        3,c-111,Asbestos Abatement Techniques Certification,2022-10-19,2025-10-19
+    """))
+    courses = tmp_path / "courses.csv"
+    courses.write_text(dedent("""\
+        course_id,course_name,certificate_name
+        c-111,Asbestos Abatement Techniques,Asbestos Abatement Techniques Certification
+        c-222,Chainsaw Operation,Chainsaw Operation Certification
+    """))
+    employees = tmp_path / "employees.csv"
+    employees.write_text(dedent("""\
+        employee_id,first_name,last_name,company_name,department,email
+        1,John,Doe,OpenAI,Engineering,john.doe@example.com
+        2,Jane,Smith,Google,Marketing,jane.smith@example.com
+        3,Cara,Davis,Google,HR,cara.davis@example.com
+    """))
+    return CertTrackerService(
+        EmployeeCertificateHandler(certs),
+        CourseHandler(courses, Course),
+        EmployeeHandler(employees),
+    )
+
+
+@pytest.fixture
+def client(service: CertTrackerService) -> TestClient:
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_service] = lambda: service
+    cache = ResponseCache()
+    app.dependency_overrides[get_response_cache] = lambda: cache
+    return TestClient(app)
+
+
+RANGE = {"start": "2025-01-01", "end": "2025-12-31"}
+
+
+def test_list_expiring_full_array(client):
+    response = client.get("/api/certificates/expiring", params=RANGE)
+
+    assert response.status_code == 200
+    assert [c["employee_id"] for c in response.json()] == [2, 3, 1, 1]
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_list_expiring_rejects_inverted_range(client):
+    response = client.get("/api/certificates/expiring", params={"start": "2025-12-31", "end": "2025-01-01"})
+
+    assert response.status_code == 400
+
+
+def test_list_expiring_paginates_with_cursor(client):
+    seen = []
+    params = dict(RANGE, limit=3)
+    while True:
+        response = client.get("/api/certificates/expiring", params=params)
+        assert response.status_code == 200
+        seen.extend((c["employee_id"], c["course_id"]) for c in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params["cursor"] = cursor
+
+    assert seen == [(2, "c-222"), (3, "c-111"), (1, "c-222"), (1, "c-111")]
+
+
+def test_list_expiring_invalid_cursor(client):
+    response = client.get("/api/certificates/expiring", params=dict(RANGE, cursor="not-a-cursor"))
+
+    assert response.status_code == 400
+
+
+def test_list_expiring_ndjson_stream(client):
+    response = client.get(
+        "/api/certificates/expiring",
+        params=dict(RANGE, limit=2),
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["employee_id"] for r in rows] == [2, 3]
+    assert "X-Next-Cursor" in response.headers
+
+
+def test_etag_and_conditional_get(client, service, mocker):
+    first = client.get("/api/certificates/expiring", params=RANGE)
+    etag = first.headers["ETag"]
+    assert service.version in etag
+    assert "Last-Modified" in first.headers
+
+    spy = mocker.spy(service, "get_expiring_certificates")
+    second = client.get("/api/certificates/expiring", params=RANGE, headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert spy.call_count == 0
+
+
+def test_etag_differs_per_query_and_version(client, service):
+    etag = client.get("/api/certificates/expiring", params=RANGE).headers["ETag"]
+    other = client.get("/api/certificates/expiring", params=dict(RANGE, limit=1)).headers["ETag"]
+    assert etag != other
+
+    service.version = "new-version"
+    response = client.get("/api/certificates/expiring", params=RANGE, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_serialized_body_is_cached(client, service, mocker):
+    first = client.get("/api/certificates/expiring", params=RANGE)
+    spy = mocker.spy(service, "get_expiring_certificates")
+    second = client.get("/api/certificates/expiring", params=RANGE)
+
+    assert second.content == first.content
+    assert spy.call_count == 0
+
+
+def test_summarize_expiring(client):
+    response = client.get("/api/certificates/expiring/summary", params=dict(RANGE, group_by=["company", "month"]))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 4
+    assert body["by_company"] == {"Google": 2, "OpenAI": 2}
+    assert body["by_month"] == {"2025-10": 2, "2025-11": 1, "2025-12": 1}
+    assert "by_course_id" not in body
+
+    cached = client.get(
+        "/api/certificates/expiring/summary",
+        params=dict(RANGE, group_by=["month", "company"]),
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert cached.status_code == 304
+
+
+def test_summarize_expiring_rejects_unknown_grouping(client):
+    response = client.get("/api/certificates/expiring/summary", params={"group_by": "department"})
+
+    assert response.status_code == 422
+
+
+def test_list_company_expiring(client):
+    response = client.get("/api/companies/Google/certificates/expiring", params=dict(RANGE, limit=1))
+
+    assert response.status_code == 200
+    assert [c["employee_id"] for c in response.json()] == [2]
+    next_page = client.get(
+        "/api/companies/Google/certificates/expiring",
+        params=dict(RANGE, limit=1, cursor=response.headers["X-Next-Cursor"]),
+    )
+    assert [c["employee_id"] for c in next_page.json()] == [3]
+    assert "X-Next-Cursor" not in next_page.headers
+
+
+def test_list_company_expiring_unknown_company(client):
+    response = client.get("/api/companies/Globex/certificates/expiring")
+
+    assert response.status_code == 404
+
+
+def test_list_expiring_enriched(client):
+    response = client.get("/api/certificates/expiring/enriched", params=RANGE)
+
+    assert response.status_code == 200
+    first = response.json()[0]
+    assert first["employee_id"] == 2
+    assert (first["email"], first["company_name"], first["course_name"]) == (
+        "jane.smith@example.com", "Google", "Chainsaw Operation",
+    )
+
+    page = client.get("/api/certificates/expiring/enriched", params={**RANGE, "limit": 2})
+    rest = client.get("/api/certificates/expiring/enriched", params={**RANGE, "cursor": page.headers["X-Next-Cursor"]})
+    assert [c["employee_id"] for c in page.json() + rest.json()] == [2, 3, 1, 1]
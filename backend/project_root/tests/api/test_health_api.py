@@ -0,0 +1,54 @@
+import time
+from pathlib import Path
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.health_api import router
+from app.api.cert_tracker_cache import get_registry
+from tests.data_processor.test_dataset_registry import build_registry
+
+
+def make_client(tmp_path: Path):
+    registry = build_registry(tmp_path)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_registry] = lambda: registry
+    return TestClient(app), registry
+
+
+def test_health(tmp_path: Path):
+    client, _ = make_client(tmp_path)
+
+    assert client.get("/health").json() == {"status": "ok"}
+
+
+def test_ready_before_and_after_warm_up(tmp_path: Path):
+    client, registry = make_client(tmp_path)
+    assert client.get("/ready").status_code == 503
+
+    registry.warm_up()
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json()["steps"]["service"]["state"] == "ready"
+
+
+def test_ready_reports_failed_warm_up_until_it_succeeds(tmp_path: Path):
+    client, registry = make_client(tmp_path)
+    courses = tmp_path / "courses.csv"
+    saved = courses.read_text()
+    courses.unlink()
+
+    registry.start_warm_up(retry_interval=0.05)
+    deadline = time.monotonic() + 5
+    while registry.load_status["courses"].state != "failed" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert "FileNotFoundError" in response.json()["steps"]["courses"]["error"]
+
+    courses.write_text(saved)
+    while not registry.ready and time.monotonic() < deadline:
+        time.sleep(0.01)
+    registry.stop()
+    assert client.get("/ready").status_code == 200
@@ -0,0 +1,49 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.lookup_api import router
+from app.api.cert_tracker_cache import get_course_repo, get_employee_repo
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_accessor.sqlite.importer import import_csvs
+from app.data_accessor.sqlite.course_handler import CourseHandler as SqliteCourseHandler
+from app.data_accessor.sqlite.employee_handler import EmployeeHandler as SqliteEmployeeHandler
+from app.data_models.course import Course
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from tests.data_accessor.sqlite.test_sqlite_handlers import write_datasets
+
+
+def make_client(employee_repo, course_repo) -> TestClient:
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_employee_repo] = lambda: employee_repo
+    app.dependency_overrides[get_course_repo] = lambda: course_repo
+    return TestClient(app)
+
+
+def test_batch_lookup_csv_and_sqlite_agree(tmp_path):
+    write_datasets(tmp_path)
+    database = SqliteDatabase(tmp_path / "cert_tracker.db")
+    import_csvs(tmp_path, database)
+    body = {"employee_ids": [2, 9, 1, 2], "course_ids": ["c-222", "c-000"]}
+
+    csv = make_client(EmployeeHandler(tmp_path / "employees.csv"), CourseHandler(tmp_path / "courses.csv", Course))
+    sqlite = make_client(SqliteEmployeeHandler(database), SqliteCourseHandler(database))
+    response = csv.post("/api/lookup", json=body)
+
+    assert response.status_code == 200
+    result = response.json()
+    assert [e["first_name"] for e in result["employees"]] == ["Jane", "John"]
+    assert [c["course_name"] for c in result["courses"]] == ["Chainsaw Operation"]
+    assert result["missing_employee_ids"] == [9]
+    assert result["missing_course_ids"] == ["c-000"]
+    assert sqlite.post("/api/lookup", json=body).json() == result
+    database.close()
+
+
+def test_batch_lookup_limits_ids(tmp_path):
+    write_datasets(tmp_path)
+    client = make_client(EmployeeHandler(tmp_path / "employees.csv"), CourseHandler(tmp_path / "courses.csv", Course))
+
+    assert client.post("/api/lookup", json={}).json()["employees"] == []
+    assert client.post("/api/lookup", json={"employee_ids": list(range(1001))}).status_code == 422
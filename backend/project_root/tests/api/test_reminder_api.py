@@ -0,0 +1,35 @@
+from pathlib import Path
+from datetime import date, timedelta
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.reminder_api import router
+from app.api.cert_tracker_cache import get_reminder_scheduler
+from app.data_processor.reminder_scheduler import ReminderScheduler
+
+
+def test_preview_then_tick(service, tmp_path: Path):
+    scheduler = ReminderScheduler(lambda: service, tmp_path / "cursor.json")
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_reminder_scheduler] = lambda: scheduler
+    client = TestClient(app)
+
+    preview = client.get("/api/reminders/due", params={"today": "2025-07-21"}).json()
+    assert [(r["threshold_days"], r["certificate"]["employee_id"]) for r in preview] == [(90, 2)]
+
+    assert client.post("/api/reminders/tick", params={"today": "2025-07-21"}).json() == preview
+    assert client.post("/api/reminders/tick", params={"today": "2025-07-21"}).json() == []
+
+
+def test_tick_rejects_future_day(service, tmp_path: Path):
+    scheduler = ReminderScheduler(lambda: service, tmp_path / "cursor.json")
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_reminder_scheduler] = lambda: scheduler
+    client = TestClient(app)
+
+    tomorrow = date.today() + timedelta(days=1)
+    assert client.post("/api/reminders/tick", params={"today": tomorrow.isoformat()}).status_code == 400
+    assert client.get("/api/reminders/due", params={"today": tomorrow.isoformat()}).status_code == 200
+    assert scheduler.last_run() is None
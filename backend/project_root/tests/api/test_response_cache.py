@@ -0,0 +1,21 @@
+from app.api.response_cache import CachedResponse, ResponseCache
+
+
+def test_lru_eviction_and_versioning():
+    cache = ResponseCache(maxsize=2)
+    cache.put("a", "v1", CachedResponse(b"A"))
+    cache.put("b", "v1", CachedResponse(b"B"))
+    assert cache.get("a", "v1") == CachedResponse(b"A")
+
+    cache.put("c", "v1", CachedResponse(b"C"))
+
+    assert cache.get("b", "v1") is None
+    assert cache.get("a", "v2") is None
+    assert len(cache) == 2
+
+
+def test_large_bodies_are_not_cached():
+    cache = ResponseCache(maxsize=4, max_entry_bytes=3)
+    cache.put("a", "v1", CachedResponse(b"too big"))
+
+    assert cache.get("a", "v1") is None
@@ -0,0 +1,24 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.search_api import router
+from app.api.cert_tracker_cache import get_service
+
+
+def test_search_across_kinds(service):
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_service] = lambda: service
+    client = TestClient(app)
+
+    results = client.get("/api/search", params={"q": "chain"}).json()
+    assert [(r["kind"], r["name"], r["ids"]) for r in results] == [
+        ("course", "Chainsaw Operation", ["c-222"]),
+        ("certificate", "Chainsaw Operation Certification", ["c-222"]),
+    ]
+
+    results = client.get("/api/search", params={"q": "jane", "kind": ["employee", "company"]}).json()
+    assert [(r["kind"], r["name"], r["match"], r["ids"]) for r in results] == [("employee", "Jane Smith", "prefix", [2])]
+    assert client.get("/api/search", params={"q": "goog"}).json()[0]["kind"] == "company"
+    assert client.get("/api/search", params={"q": ""}).status_code == 422
+    assert client.get("/api/search", params={"q": "a", "limit": 51}).status_code == 422
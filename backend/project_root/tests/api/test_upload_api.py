@@ -0,0 +1,86 @@
+import pytest
+
+from pathlib import Path
+from datetime import date
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.upload_api import router
+from app.api.cert_tracker_cache import get_registry, get_upload_validator
+from app.data_accessor.chunk_validation import ChunkValidator
+from app.data_models.employee_certificate import EmployeeCertificate
+from tests.data_processor.test_dataset_registry import build_registry
+
+UPLOAD = (
+    "employee_id,course_id,certificate_name,issue_date,expiry_date\n"
+    "2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19\n"
+    "x,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19\n"
+    "3,c-222,Chainsaw Operation Certification,2021-10-19,2026-01-01\n"
+)
+
+
+def make_client(tmp_path: Path):
+    registry = build_registry(tmp_path)
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_registry] = lambda: registry
+    app.dependency_overrides[get_upload_validator] = lambda: ChunkValidator(EmployeeCertificate, max_workers=1)
+    return TestClient(app), registry
+
+
+def test_upload_merges_valid_rows_and_reports_errors(tmp_path: Path):
+    client, registry = make_client(tmp_path)
+    version = registry.service().version
+
+    response = client.post("/api/certificates/upload", files={"file": ("certs.csv", UPLOAD, "text/csv")})
+
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["rows"], report["accepted"], report["rejected"]) == (3, 2, 1)
+    assert report["errors"][0]["line"] == 3
+    assert report["errors_truncated"] is False
+    assert report["version"] != version
+    certs = registry.service().get_expiring_certificates(date(2025, 1, 1), date(2026, 12, 31))
+    assert [c.employee_id for c in certs] == [2, 1, 3]
+    assert (tmp_path / "employee_certs.csv").read_text().count("\n") == 4
+
+
+def test_upload_rejects_missing_columns(tmp_path: Path):
+    client, _ = make_client(tmp_path)
+
+    response = client.post("/api/certificates/upload", files={"file": ("certs.csv", "employee_id,course_id\n1,c-1\n", "text/csv")})
+
+    assert response.status_code == 400
+    assert "certificate_name" in response.json()["detail"]
+
+
+def test_reupload_skips_certificates_already_on_file(tmp_path: Path):
+    client, registry = make_client(tmp_path)
+    client.post("/api/certificates/upload", files={"file": ("certs.csv", UPLOAD, "text/csv")})
+    version = registry.service().version
+
+    response = client.post("/api/certificates/upload", files={"file": ("certs.csv", UPLOAD, "text/csv")})
+
+    report = response.json()
+    assert (report["accepted"], report["duplicates"]) == (2, 2)
+    assert report["version"] == version
+    assert (tmp_path / "employee_certs.csv").read_text().count("\n") == 4
+
+
+def test_failed_upload_applies_nothing(tmp_path: Path, mocker):
+    client, registry = make_client(tmp_path)
+    mocker.patch("app.api.upload_api.UPLOAD_CHUNK_ROWS", 1)
+    validate = ChunkValidator(EmployeeCertificate, max_workers=1).validate
+
+    def fail_after_first_chunk(chunks):
+        results = validate(chunks)
+        yield next(results)
+        raise OSError("connection reset")
+
+    mocker.patch.object(ChunkValidator, "validate", side_effect=fail_after_first_chunk)
+
+    with pytest.raises(OSError):
+        client.post("/api/certificates/upload", files={"file": ("certs.csv", UPLOAD, "text/csv")})
+
+    assert (tmp_path / "employee_certs.csv").read_text().count("\n") == 2
+    assert len(registry.service().get_expiring_certificates(None, None)) == 1
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from app.data_models.course import Course
+from app.data_models.company import Company
+from app.data_accessor.csv_handler import CsvHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+from benchmarks.synthetic_data import DatasetSize, generate
+
+
+def test_generated_data_is_valid_and_deterministic(tmp_path: Path):
+    size = DatasetSize.for_certificates(200)
+    generate(tmp_path / "a", size, seed=7)
+    generate(tmp_path / "b", size, seed=7)
+
+    for name in ("companies.csv", "courses.csv", "employees.csv", "employee_certs.csv"):
+        assert (tmp_path / "a" / name).read_bytes() == (tmp_path / "b" / name).read_bytes()
+
+    certs = EmployeeCertificateHandler(tmp_path / "a" / "employee_certs.csv")
+    employees = EmployeeHandler(tmp_path / "a" / "employees.csv")
+    assert len(certs.load_all()) == 200
+    assert len(employees.load_all()) == size.employees
+    assert len(CsvHandler(tmp_path / "a" / "courses.csv", Course).load_all()) == size.courses
+    assert len(CsvHandler(tmp_path / "a" / "companies.csv", Company).load_all()) == size.companies
+    assert certs.errors == [] and employees.errors == []
+    assert all(c.expiry_date > c.issue_date for c in certs.load_all())
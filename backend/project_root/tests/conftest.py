@@ -0,0 +1,37 @@
+import pytest
+from pathlib import Path
+from textwrap import dedent
+
+from app.data_models.course import Course
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_processor.cert_tracker_service import CertTrackerService
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> CertTrackerService:
+    certs = tmp_path / "employee_certs.csv"
+    certs.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+        2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+        1,c-222,Chainsaw Operation Certification,2022-11-01,2025-11-01
+    """))
+    courses = tmp_path / "courses.csv"
+    courses.write_text(dedent("""\
+        course_id,course_name,certificate_name
+        c-111,Asbestos Abatement Techniques,Asbestos Abatement Techniques Certification
+        c-222,Chainsaw Operation,Chainsaw Operation Certification
+    """))
+    employees = tmp_path / "employees.csv"
+    employees.write_text(dedent("""\
+        employee_id,first_name,last_name,company_name,department,email
+        1,John,Doe,OpenAI,Engineering,john.doe@example.com
+        2,Jane,Smith,Google,Marketing,jane.smith@example.com
+    """))
+    return CertTrackerService(
+        EmployeeCertificateHandler(certs),
+        CourseHandler(courses, Course),
+        EmployeeHandler(employees),
+    )
@@ -0,0 +1,103 @@
+from datetime import date
+
+from app.data_accessor.indexes.expiry_index import ExpiryIndex
+from app.data_accessor.certificate_record import CertificateRecord
+from app.data_models.employee_certificate import EmployeeCertificate
+
+
+def make_cert(employee_id: int, expiry: date) -> EmployeeCertificate:
+    return EmployeeCertificate(
+        employee_id=employee_id,
+        course_id=f"c-{employee_id}",
+        certificate_name=f"Cert {employee_id}",
+        issue_date=date(2020, 1, 1),
+        expiry_date=expiry,
+    )
+
+
+def build_index() -> ExpiryIndex[EmployeeCertificate]:
+    return ExpiryIndex([
+        make_cert(1, date(2025, 12, 16)),
+        make_cert(2, date(2025, 10, 19)),
+        make_cert(3, date(2025, 11, 1)),
+        make_cert(4, date(2025, 10, 19)),
+    ])
+
+
+def test_range_is_inclusive_and_sorted():
+    index = build_index()
+    result = index.range(date(2025, 10, 19), date(2025, 11, 1))
+
+    assert [c.employee_id for c in result] == [2, 4, 3]
+
+
+def test_range_open_ended():
+    index = build_index()
+
+    assert [c.employee_id for c in index.range(start=date(2025, 11, 1))] == [3, 1]
+    assert [c.employee_id for c in index.range(end=date(2025, 10, 31))] == [2, 4]
+    assert len(index.range()) == 4
+
+
+def test_range_empty_and_inverted():
+    index = build_index()
+
+    assert index.range(date(2026, 1, 1), date(2026, 12, 31)) == []
+    assert index.range(date(2025, 12, 1), date(2025, 10, 1)) == []
+    assert index.count(date(2025, 12, 1), date(2025, 10, 1)) == 0
+
+
+def test_next_expiring():
+    index = build_index()
+
+    assert [c.employee_id for c in index.next_expiring(date(2025, 10, 20), 2)] == [3, 1]
+    assert index.next_expiring(date(2026, 1, 1), 5) == []
+
+
+def test_iter_range_and_bounds():
+    index = build_index()
+
+    assert [c.employee_id for c in index.iter_range(date(2025, 11, 1), None)] == [3, 1]
+    assert index.first_expiry() == date(2025, 10, 19)
+    assert index.last_expiry() == date(2025, 12, 16)
+    assert ExpiryIndex([]).first_expiry() is None
+
+
+def test_tiebreak_and_keyset_pages():
+    index = ExpiryIndex(build_index().range(), tiebreak=lambda c: (-c.employee_id,))
+
+    first, cursor = index.page(None, None, 2)
+    assert [c.employee_id for c in first] == [4, 2]
+    assert cursor == (date(2025, 10, 19), -2)
+
+    second, cursor = index.page(None, None, 2, after=cursor)
+    assert [c.employee_id for c in second] == [3, 1]
+    assert cursor is None
+
+
+def test_keyset_pages_keep_duplicate_records():
+    cert = make_cert(1, date(2025, 10, 19))
+    records = [CertificateRecord.of(cert, row_id) for row_id in range(3)]
+    index = ExpiryIndex(records, tiebreak=lambda c: (c.employee_id, c.course_id, c.row_id))
+
+    seen, cursor = index.page(None, None, 1)
+    while cursor is not None:
+        page, cursor = index.page(None, None, 1, after=cursor)
+        seen += page
+    assert [c.row_id for c in seen] == [0, 1, 2]
+
+
+def test_iter_range_after_cursor_respects_start():
+    index = build_index()
+    result = index.iter_range(date(2025, 11, 1), None, after=(date(2025, 10, 19),))
+
+    assert [c.employee_id for c in result] == [3, 1]
+
+
+def test_merged_keeps_order_and_original():
+    index = build_index()
+    merged = index.merged([make_cert(5, date(2025, 10, 19)), make_cert(6, date(2025, 1, 1))])
+
+    assert [c.employee_id for c in merged.range()] == [6, 2, 4, 5, 3, 1]
+    assert merged.count(date(2025, 10, 19), date(2025, 10, 19)) == 3
+    assert len(index) == 4
@@ -0,0 +1,22 @@
+from app.data_accessor.indexes.name_index import NameIndex, normalize_name
+
+
+def test_normalize_name():
+    assert normalize_name("  ALICE \t Smith ") == "alice smith"
+
+
+def test_lookup_by_parts_and_full_name():
+    index = NameIndex([("Alice", "Smith", 1), ("Bob", "Brown", 2)])
+
+    assert index.first("alice", "smith") == 1
+    assert index.first_by_full_name("BOB BROWN") == 2
+    assert index.first("Cara", "Davis") is None
+
+
+def test_duplicate_names_keep_load_order():
+    index = NameIndex([("Alice", "Smith", 1), ("Bob", "Brown", 2), ("alice", "SMITH", 3)])
+
+    assert index.first("Alice", "Smith") == 1
+    assert index.all("Alice", "Smith") == [1, 3]
+    assert index.duplicates() == {"alice smith": [1, 3]}
+    assert len(index) == 2
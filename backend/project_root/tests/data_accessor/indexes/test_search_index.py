@@ -0,0 +1,56 @@
+from app.data_accessor.indexes.search_index import SearchIndex
+
+
+def build() -> SearchIndex[int]:
+    return SearchIndex([
+        ("Alice Smith", 1),
+        ("Alicia Keys", 2),
+        ("Bob  Smithers", 3),
+        ("alice SMITH", 4),
+        ("Ali", 5),
+        ("Carol Jones", 6),
+    ])
+
+
+def test_names_are_normalized_and_deduplicated():
+    index = build()
+
+    assert len(index) == 5
+    assert index.search("ALICE smith") == index.search("alice   smith")
+    top = index.search("alice smith")[0]
+    assert (top.name, top.values, top.match, top.score) == ("Alice Smith", [1, 4], "exact", 3.0)
+
+
+def test_prefix_ranks_before_word_prefix():
+    index = build()
+
+    assert [(m.name, m.match) for m in index.search("ali", limit=3)] == [
+        ("Ali", "exact"), ("Alice Smith", "prefix"), ("Alicia Keys", "prefix"),
+    ]
+    assert [(m.name, m.match) for m in index.search("smi")] == [
+        ("Alice Smith", "word_prefix"), ("Bob Smithers", "word_prefix"),
+    ]
+
+
+def test_fuzzy_fills_remaining_slots():
+    index = build()
+    results = index.search("carol jnoes")
+
+    assert [(m.name, m.match) for m in results] == [("Carol Jones", "fuzzy")]
+    assert 0 < results[0].score < 1
+
+
+def test_limit_and_empty_queries():
+    index = build()
+
+    assert len(index.search("a", limit=2)) == 2
+    assert index.search("   ") == []
+    assert index.search("ali", limit=0) == []
+    assert SearchIndex([]).search("ali") == []
+
+
+def test_fuzzy_postings_budget_reads_rarest_first():
+    names = [(f"Common Name {i:04d}", i) for i in range(2000)] + [("Zyxw Rare", -1)]
+    index = SearchIndex(names, max_fuzzy_postings=10)
+
+    assert index.search("zyxv rare")[0].values == [-1]
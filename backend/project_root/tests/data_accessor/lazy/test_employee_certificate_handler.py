@@ -0,0 +1,111 @@
+import os
+import pytest
+from pathlib import Path
+from textwrap import dedent
+from datetime import date, datetime
+
+from app.data_accessor.lazy.mapped_csv import MappedCsv
+from app.data_accessor.reloadable_dataset import ReloadableDataset
+from app.data_accessor.lazy.employee_certificate_handler import EmployeeCertificateHandler
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler as CsvEmployeeCertificateHandler
+from app.data_models.employee_certificate import EmployeeCertificate
+
+@pytest.fixture
+def csv_file(tmp_path: Path) -> Path:
+    path = tmp_path / "employee_certs.csv"
+    path.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+        2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+
+        x,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-20
+        1,c-222,"Chainsaw Operation Certification, Level 2",2022-11-01,2025-11-01
+    """))
+    return path
+
+
+@pytest.fixture(params=[("expiry_date", "employee_id", "course_id"), None], ids=["keys", "no_keys"])
+def repo(request, csv_file) -> EmployeeCertificateHandler:
+    return EmployeeCertificateHandler(csv_file, key_columns=request.param)
+
+
+def test_mapped_csv_indexes_lines_without_decoding(csv_file):
+    mapped = MappedCsv(csv_file, EmployeeCertificate, block_bytes=16)
+
+    assert len(mapped) == 5
+    assert mapped.line(2) == ""
+    assert mapped.line(4).startswith("1,c-222,")
+    assert [c.employee_id for c in mapped.rows([4, 0])] == [1, 1]
+    assert [e.line for e in (mapped.rows([3]), mapped.errors)[1]] == [5]
+    mapped.close()
+
+
+def test_load_all_matches_csv_handler(repo, csv_file):
+    assert repo.load_all() == CsvEmployeeCertificateHandler(csv_file).load_all()
+    assert len(repo) == 5
+
+
+def test_get_by_id(repo):
+    cert = repo.get_by_id(4)
+
+    assert cert is not None
+    assert cert.certificate_name == "Chainsaw Operation Certification, Level 2"
+    assert repo.get_by_id(2) is None
+    assert repo.get_by_id(3) is None
+    assert repo.get_by_id(5) is None
+
+
+def test_date_range_sorted_by_expiry(repo):
+    certs = repo.get_certificates_exprining_in_time_range(datetime(2025, 10, 1), datetime(2025, 11, 30))
+
+    assert certs is not None
+    assert [c.expiry_date for c in certs] == [date(2025, 10, 19), date(2025, 11, 1)]
+    assert len(repo.get_expired_employee_certificates_by_date_range(None, None)) == 3
+
+
+def test_by_employee_and_course(repo):
+    assert [c.course_id for c in repo.get_employee_certificates_by_employee_id(1)] == ["c-111", "c-222"]
+    assert [c.employee_id for c in repo.get_employee_certificates_by_course_id("c-222")] == [2, 1]
+    assert repo.get_employee_certificates_by_course_id("c-999") == []
+
+
+def test_key_arrays_are_compact(csv_file):
+    repo = EmployeeCertificateHandler(csv_file)
+    bare = EmployeeCertificateHandler(csv_file, key_columns=None)
+
+    assert bare.key_bytes == 5 * 4
+    assert repo.key_bytes == bare.key_bytes + 4 * 12 + 5 * 8 + 5 * 4
+
+
+def test_rejects_unknown_key_columns(csv_file):
+    with pytest.raises(ValueError):
+        EmployeeCertificateHandler(csv_file, key_columns=["certificate_name"])
+
+
+def test_rejects_multiline_fields(tmp_path):
+    path = tmp_path / "employee_certs.csv"
+    path.write_text('employee_id,course_id,certificate_name,issue_date,expiry_date\n1,c-1,"A\nB",2022-01-01,2025-01-01\n')
+
+    with pytest.raises(ValueError):
+        EmployeeCertificateHandler(path)
+
+
+def test_reloadable_dataset_remaps_changed_file(csv_file):
+    dataset = ReloadableDataset(csv_file, lambda: EmployeeCertificateHandler(csv_file))
+    first = dataset.current()
+    with csv_file.open("a") as f:
+        f.write("3,c-111,Asbestos Abatement Techniques Certification,2023-01-01,2026-01-01\n")
+
+    assert dataset.refresh() is True
+    assert dataset.current() is not first
+    assert [c.employee_id for c in dataset.current().get_expired_employee_certificates_by_date_range(date(2026, 1, 1), None)] == [3]
+
+    replacement = csv_file.with_suffix(".new")
+    replacement.write_text(csv_file.read_text().splitlines()[0] + "\n")
+    os.replace(replacement, csv_file)
+
+    assert dataset.refresh() is True
+    assert dataset.current().load_all() == []
+    # The previous handler still reads the file it mapped
+    assert len(first.load_all()) == 3
+
@@ -0,0 +1,78 @@
+import pytest
+from pathlib import Path
+from textwrap import dedent
+from datetime import date, datetime
+
+from app.data_accessor.pandas.employee_certificate_handler import EmployeeCertificateHandler
+from app.data_models.employee_certificate import EmployeeCertificate
+
+@pytest.fixture
+def csv_file(tmp_path: Path) -> Path:
+    path = tmp_path / "employee_certs.csv"
+    path.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+        2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+        1,c-222,Chainsaw Operation Certification,2022-11-01,2025-11-01
+    """))
+    return path
+
+
+def test_load_all_preserves_file_order(csv_file):
+    repo = EmployeeCertificateHandler(csv_file)
+    certs = repo.load_all()
+
+    assert [c.expiry_date for c in certs] == [date(2025, 12, 16), date(2025, 10, 19), date(2025, 11, 1)]
+    assert all(isinstance(c, EmployeeCertificate) for c in certs)
+    assert certs[0].issue_date == date(2022, 12, 16)
+    assert certs[0].course_id == "c-111"
+
+
+def test_get_by_id(csv_file):
+    repo = EmployeeCertificateHandler(csv_file)
+    cert = repo.get_by_id(1)
+
+    assert cert is not None
+    assert cert.employee_id == 2
+    assert repo.get_by_id(3) is None
+
+
+def test_date_range_sorted_by_expiry(csv_file):
+    repo = EmployeeCertificateHandler(csv_file)
+    certs = repo.get_certificates_exprining_in_time_range(datetime(2025, 10, 1), datetime(2025, 11, 30))
+
+    assert certs is not None
+    assert [c.employee_id for c in certs] == [2, 1]
+    assert [c.expiry_date for c in certs] == [date(2025, 10, 19), date(2025, 11, 1)]
+
+
+def test_date_range_open_ended(csv_file):
+    repo = EmployeeCertificateHandler(csv_file)
+
+    assert len(repo.get_expired_employee_certificates_by_date_range(date(2025, 11, 1), None)) == 2
+    assert repo.get_expired_employee_certificates_by_date_range(date(2026, 1, 1), date(2025, 1, 1)) == []
+
+
+def test_filter_by_employee_and_course(csv_file):
+    repo = EmployeeCertificateHandler(csv_file)
+
+    assert [c.course_id for c in repo.get_employee_certificates_by_employee_id(1)] == ["c-111", "c-222"]
+    assert [c.employee_id for c in repo.get_employee_certificates_by_course_id("c-222")] == [2, 1]
+    assert repo.get_employee_certificates_by_course_id("c-999") == []
+
+
+def test_rows_with_missing_values_are_skipped(tmp_path):
+    path = tmp_path / "employee_certs.csv"
+    path.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+        2,,Chainsaw Operation Certification,2021-10-19,2025-10-19
+        ,c-222,Chainsaw Operation Certification,2022-11-01,2025-11-01
+        3,c-222,Chainsaw Operation Certification,2022-11-01,not a date
+        4,c-222,Chainsaw Operation Certification,2022-11-01,2025-11-02
+    """))
+    repo = EmployeeCertificateHandler(path)
+
+    assert [c.employee_id for c in repo.load_all()] == [1, 4]
+    assert [e.line for e in repo.errors] == [3, 4, 5]
+    assert "nan" not in {c.course_id for c in repo.get_expired_employee_certificates_by_date_range(None, None)}
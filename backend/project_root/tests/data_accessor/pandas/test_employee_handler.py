@@ -57,6 +57,24 @@ def test_get_by_id_exists(csv_file):
     assert emp.email == "bob.brown@initech.com"
 
 
+def test_get_by_ids_matches_get_by_id(csv_file):
+    repo = EmployeeHandler(csv_file)
+    employees = repo.get_by_ids([3, 42, 1, 3])
+
+    assert list(employees) == [3, 1]
+    assert employees[3] == repo.get_by_id(3)
+    assert employees[1] == repo.get_by_id(1)
+    assert repo.get_by_ids([]) == {}
+
+
+def test_get_by_ids_duplicate_index_keeps_first(tmp_path: Path, employee_data):
+    duplicate = {**employee_data[0], "first_name": "Alicia"}
+    path = tmp_path / "employees.csv"
+    pd.DataFrame(employee_data + [duplicate]).to_csv(path, index=False)
+
+    assert EmployeeHandler(path).get_by_ids([1])[1].first_name == "Alice"
+
+
 def test_get_by_id_not_exists(csv_file):
     repo = EmployeeHandler(csv_file)
     assert repo.get_by_id(999) is None
@@ -77,3 +95,13 @@ def test_get_company_name_from_employee_name_case_insensitive(csv_file):
 def test_get_company_name_not_exists(csv_file):
     repo = EmployeeHandler(csv_file)
     assert repo.get_company_name_from_employee_name("Nonexistent Person") is None
+
+def test_get_company_name_duplicate_names_returns_first(tmp_path: Path, employee_data):
+    duplicate = dict(employee_data[0], employee_id=4, company_name="Globex")
+    df = pd.DataFrame(employee_data + [duplicate]).set_index("employee_id")
+    path = tmp_path / "employees_dup.csv"
+    df.to_csv(path)
+
+    repo = EmployeeHandler(path)
+    assert repo.get_company_name_from_employee_name("  alice   SMITH ") == "Acme Corp"
+    assert repo.name_index.duplicates() == {"alice smith": [1, 4]}
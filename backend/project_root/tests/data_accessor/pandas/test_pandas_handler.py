@@ -57,3 +57,18 @@ def test_load_all_with_index_col(tmp_path: Path, sample_data):
 
     assert {u.id for u in users} == {1, 2, 3}
     assert all(isinstance(u.signup_date, datetime) for u in users)
+
+def test_iter_batches_streams_chunks(csv_file, sample_data):
+    handler = PandasHandler(csv_file, User, parse_dates=["signup_date"])
+    batches = list(handler.iter_batches(2))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [u.name for batch in batches for u in batch] == [d["name"] for d in sample_data]
+
+def test_iter_all_reports_invalid_rows(tmp_path: Path):
+    path = tmp_path / "users_bad.csv"
+    path.write_text("id,name\n1,Alice\nnope,Bob\n3,Cara\n")
+    handler = PandasHandler(path, User)
+
+    assert [u.id for u in handler.iter_all(chunk_size=2)] == [1, 3]
+    assert [e.line for e in handler.errors] == [3]
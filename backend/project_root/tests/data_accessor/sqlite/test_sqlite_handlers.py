@@ -0,0 +1,153 @@
+import pytest
+import threading
+from pathlib import Path
+from textwrap import dedent
+from datetime import date, datetime
+
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_accessor.sqlite.importer import import_csvs
+from app.data_accessor.sqlite.course_handler import CourseHandler
+from app.data_accessor.sqlite.company_handler import CompanyHandler
+from app.data_accessor.sqlite.employee_handler import EmployeeHandler
+from app.data_accessor.sqlite.employee_certificate_handler import CURSOR_ORDER, EmployeeCertificateHandler
+
+
+def write_datasets(data_dir: Path) -> None:
+    (data_dir / "employee_certs.csv").write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+        2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+        not-a-number,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+        1,c-222,Chainsaw Operation Certification,2022-11-01,2025-11-01
+        3,c-111,Asbestos Abatement Techniques Certification,2022-11-01,2025-11-01
+    """))
+    (data_dir / "courses.csv").write_text(dedent("""\
+        course_id,course_name,certificate_name
+        c-111,Asbestos Abatement Techniques,Asbestos Abatement Techniques Certification
+        c-222,Chainsaw Operation,Chainsaw Operation Certification
+    """))
+    (data_dir / "employees.csv").write_text(dedent("""\
+        employee_id,first_name,last_name,company_name,department,email
+        1,John,Doe,OpenAI,Engineering,john.doe@example.com
+        2,Jane,Smith,Google,Marketing,jane.smith@example.com
+        3,JOHN,doe,Acme,Sales,john.doe2@example.com
+    """))
+    (data_dir / "companies.csv").write_text(dedent("""\
+        company_id,company_name,company_email
+        10,OpenAI,contact@openai.com
+        20,Google,contact@google.com
+    """))
+
+
+@pytest.fixture
+def database(tmp_path: Path):
+    write_datasets(tmp_path)
+    database = SqliteDatabase(tmp_path / "cert_tracker.db")
+    import_csvs(tmp_path, database)
+    yield database
+    database.close()
+
+
+def test_import_counts_rows_and_rejects(tmp_path: Path):
+    write_datasets(tmp_path)
+    database = SqliteDatabase(tmp_path / "cert_tracker.db")
+    result = import_csvs(tmp_path, database, batch_size=2)
+
+    assert result.rows == {"employee_certificates": 4, "courses": 2, "employees": 3, "companies": 2}
+    assert result.errors["employee_certificates"] == 1
+    assert database.meta()["version"] == result.version
+    assert database.execute("PRAGMA journal_mode")[0][0] == "wal"
+
+
+def test_reimport_replaces_contents(tmp_path: Path, database):
+    (tmp_path / "employee_certs.csv").write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+    """))
+    version = database.meta()["version"]
+    import_csvs(tmp_path, database)
+
+    assert len(EmployeeCertificateHandler(database)) == 1
+    assert database.meta()["version"] != version
+
+
+def test_queries_use_indexes(database):
+    def plan(sql, params):
+        return " ".join(str(row[-1]) for row in database.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+    assert "certificates_expiry" in plan(
+        f"SELECT * FROM employee_certificates WHERE expiry_date >= ? ORDER BY {CURSOR_ORDER} LIMIT 3", ("2025-11-01",)
+    )
+    assert "certificates_employee_id" in plan("SELECT * FROM employee_certificates WHERE employee_id = ?", (1,))
+
+
+def test_certificate_queries(database):
+    repo = EmployeeCertificateHandler(database)
+
+    assert [c.employee_id for c in repo.load_all()] == [1, 2, 1, 3]
+    assert repo.get_by_id(1).employee_id == 2
+    assert repo.get_by_id(4) is None
+    in_range = repo.get_certificates_exprining_in_time_range(datetime(2025, 10, 1), datetime(2025, 11, 30))
+    assert [(c.employee_id, c.expiry_date) for c in in_range] == [
+        (2, date(2025, 10, 19)), (1, date(2025, 11, 1)), (3, date(2025, 11, 1)),
+    ]
+    assert [c.course_id for c in repo.get_employee_certificates_by_employee_id(1)] == ["c-111", "c-222"]
+    assert [c.employee_id for c in repo.get_employee_certificates_by_course_id("c-111")] == [1, 3]
+
+
+def test_certificate_pages_follow_cursor(database):
+    repo = EmployeeCertificateHandler(database)
+    first, next_key = repo.page(None, None, 2)
+    second, last_key = repo.page(None, None, 2, next_key)
+
+    assert next_key == (date(2025, 11, 1), 1, "c-222", 2)
+    assert [c.employee_id for c in first + second] == [2, 1, 3, 1]
+    assert last_key is None
+    assert list(repo.iter_range(None, None, batch_size=1)) == first + second
+
+
+def test_certificate_pages_keep_duplicate_rows(database):
+    repo = EmployeeCertificateHandler(database)
+    repo.append(repo.load_all(), {})
+
+    certs, cursor = repo.page(None, None, 1)
+    while cursor is not None:
+        page, cursor = repo.page(None, None, 1, cursor)
+        certs += page
+    assert len(certs) == 8
+    assert certs == list(repo.iter_range(None, None))
+
+
+def test_employee_course_and_company_lookups(database):
+    employees = EmployeeHandler(database)
+    courses = CourseHandler(database)
+    companies = CompanyHandler(database)
+
+    assert employees.get_by_id(2).first_name == "Jane"
+    # Case-insensitive, first row in import order wins
+    assert employees.get_company_name_from_employee_name("john  DOE") == "OpenAI"
+    assert employees.get_employee_email("Jane", "smith") == "jane.smith@example.com"
+    assert employees.has_company("google") and not employees.has_company("Unknown")
+    assert courses.get_by_id("c-222").course_name == "Chainsaw Operation"
+    assert courses.get_by_course_name_from_certificate_name("Chainsaw Operation Certification") == "Chainsaw Operation"
+    assert companies.get_by_id(20).company_name == "Google"
+    assert companies.get_company_from_company_name("openai").company_id == 10
+
+
+def test_batch_lookups(database, monkeypatch):
+    monkeypatch.setattr("app.data_accessor.sqlite.sqlite_handler._IDS_PER_QUERY", 2)
+    employees = EmployeeHandler(database)
+
+    assert {k: e.first_name for k, e in employees.get_by_ids([3, 99, 1, 3, 2]).items()} == {3: "JOHN", 1: "John", 2: "Jane"}
+    assert list(CourseHandler(database).get_by_ids(["c-222", "c-999"])) == ["c-222"]
+    assert CompanyHandler(database).get_by_ids([]) == {}
+
+
+def test_connection_per_thread(database):
+    connections = []
+    thread = threading.Thread(target=lambda: connections.append(database.connection()))
+    thread.start()
+    thread.join()
+
+    assert connections[0] is not database.connection()
+    assert database.connection() is database.connection()
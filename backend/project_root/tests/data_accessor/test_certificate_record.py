@@ -0,0 +1,84 @@
+import pytest
+from pathlib import Path
+from textwrap import dedent
+from datetime import date
+
+from app.data_accessor.csv_handler import CsvHandler
+from app.data_accessor.certificate_record import CertificateRecord
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+
+
+@pytest.fixture
+def certs_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "employee_certs.csv"
+    path.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+        2,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+    """))
+    return path
+
+
+def test_round_trip_to_model():
+    cert = EmployeeCertificate(
+        employee_id=7, course_id="c-1", certificate_name="Cert",
+        issue_date=date(2020, 1, 1), expiry_date=date(2023, 1, 1),
+    )
+    record = CertificateRecord.of(cert, 3)
+
+    assert record.to_model() == cert
+    assert record.row_id == 3
+    assert CertificateRecord.of(record, 3) is record
+    assert CertificateRecord.of(record, 4).row_id == 4
+    assert not hasattr(record, "__dict__")
+
+
+def test_repeated_values_are_shared(certs_csv):
+    first, second = EmployeeCertificateHandler(certs_csv).load_records()
+
+    assert first.course_id is second.course_id
+    assert first.certificate_name is second.certificate_name
+    assert first.expiry_date is second.expiry_date
+
+
+def test_shared_values_are_scoped_to_the_handler(certs_csv):
+    handler = EmployeeCertificateHandler(certs_csv)
+    first = handler.load_records()[0]
+    other = EmployeeCertificateHandler(certs_csv).load_records()[0]
+    handler.clear_cache()
+
+    assert other.expiry_date is not first.expiry_date
+    assert handler._pool == {}
+    assert handler.load_records()[0].expiry_date is not first.expiry_date
+
+
+def test_records_are_built_while_streaming(certs_csv, mocker):
+    load_all = mocker.spy(CsvHandler, "load_all")
+    iter_all = mocker.spy(CsvHandler, "iter_all")
+
+    records = EmployeeCertificateHandler(certs_csv).load_records()
+
+    assert [r.row_id for r in records] == [0, 1]
+    assert load_all.call_count == 0
+    assert iter_all.call_count == 1
+
+
+def test_handler_caches_records_and_returns_models(certs_csv):
+    handler = EmployeeCertificateHandler(certs_csv)
+
+    assert handler.load_records() is handler.load_records()
+    assert all(isinstance(r, CertificateRecord) for r in handler.load_records())
+    certificates = handler.load_all()
+    assert all(isinstance(c, EmployeeCertificate) for c in certificates)
+    assert [c.employee_id for c in handler.get_employee_certificates_by_course_id("c-111")] == [1, 2]
+    assert isinstance(handler.get_employee_certificates_by_employee_id(2)[0], EmployeeCertificate)
+
+
+def test_seed_cache_accepts_models(certs_csv):
+    handler = EmployeeCertificateHandler(certs_csv)
+    model = handler.load_all()[0].model_copy(update={"employee_id": 3})
+    handler.seed_cache(handler.load_records() + [model])
+
+    assert [r.employee_id for r in handler.load_records()] == [1, 2, 3]
+    assert isinstance(handler.load_records()[-1], CertificateRecord)
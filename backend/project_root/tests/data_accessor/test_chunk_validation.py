@@ -0,0 +1,89 @@
+import io
+from textwrap import dedent
+
+from app.data_accessor import chunk_validation
+from app.data_accessor.csv_handler import CsvHandler
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.chunk_validation import ChunkValidator, ParallelLoad, iter_csv_chunks, read_header, split_ranges
+from app.data_accessor.pandas.employee_certificate_handler import EmployeeCertificateHandler as PandasEmployeeCertificateHandler
+
+CSV = dedent("""\
+    employee_id,course_id,certificate_name,issue_date,expiry_date
+    1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+    x,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+    2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+    3,c-222,Chainsaw Operation Certification,2021-10-19,not-a-date
+    4,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+""").encode()
+
+
+def chunks(chunk_rows: int):
+    stream = io.BytesIO(CSV)
+    return iter_csv_chunks(stream, read_header(stream), chunk_rows)
+
+
+def test_chunks_split_on_lines():
+    result = list(chunks(2))
+
+    assert [c.first_line for c in result] == [2, 4, 6]
+    assert result[0].header[0] == "employee_id"
+    assert result[-1].data.count(b"\n") == 1
+
+
+def test_inline_validation_reports_file_line_numbers():
+    results = list(ChunkValidator(EmployeeCertificate, max_workers=1).validate(chunks(2)))
+
+    assert [c.employee_id for r in results for c in r.items] == [1, 2, 4]
+    assert [e.line for r in results for e in r.errors] == [3, 5]
+    assert sum(r.rows for r in results) == 5
+
+
+def test_process_pool_keeps_input_order():
+    validator = ChunkValidator(EmployeeCertificate, max_workers=2, max_in_flight=2)
+    results = list(validator.validate(chunks(1)))
+
+    assert [r.first_line for r in results] == [2, 3, 4, 5, 6]
+    assert [c.employee_id for r in results for c in r.items] == [1, 2, 4]
+    assert [e.line for r in results for e in r.errors] == [3, 5]
+
+
+def test_process_pool_is_shared_between_calls():
+    validator = ChunkValidator(EmployeeCertificate, max_workers=2, max_in_flight=2)
+    list(validator.validate(chunks(2)))
+    pool = chunk_validation._executor(2)
+    results = list(validator.validate(chunks(2)))
+
+    assert chunk_validation._executor(2) is pool
+    assert [c.employee_id for r in results for c in r.items] == [1, 2, 4]
+
+
+def test_split_ranges_cover_data_lines(tmp_path):
+    path = tmp_path / "employee_certs.csv"
+    path.write_bytes(CSV)
+    ranges = split_ranges(path, 3)
+
+    assert ranges[0].start == CSV.index(b"\n") + 1
+    assert ranges[-1].end == len(CSV)
+    assert all(a.end == b.start for a, b in zip(ranges, ranges[1:]))
+    assert b"".join(r.read() for r in ranges) == CSV[ranges[0].start:]
+    assert all(r.read().endswith(b"\n") for r in ranges)
+
+
+def test_validate_file_matches_sequential_load(tmp_path):
+    path = tmp_path / "employee_certs.csv"
+    path.write_bytes(CSV)
+    sequential = CsvHandler(path, EmployeeCertificate)
+    parallel = CsvHandler(path, EmployeeCertificate, parallel=ParallelLoad(workers=2, min_bytes=0))
+
+    assert parallel.load_all() == sequential.load_all()
+    assert [e.line for e in parallel.errors] == [e.line for e in sequential.errors] == [3, 5]
+    assert parallel.last_load_stats.source == "parallel_csv"
+
+
+def test_parallel_pandas_frame_matches(tmp_path):
+    path = tmp_path / "employee_certs.csv"
+    path.write_bytes(CSV.replace(b"x,", b"5,").replace(b"not-a-date", b"2026-01-01"))
+    sequential = PandasEmployeeCertificateHandler(path)
+    parallel = PandasEmployeeCertificateHandler(path, ParallelLoad(workers=2, min_bytes=0))
+
+    assert parallel.load_all() == sequential.load_all()
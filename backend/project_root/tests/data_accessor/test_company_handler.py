@@ -42,6 +42,14 @@ def test_get_by_id_not_exists(company_csv_file):
     handler = CompanyHandler(company_csv_file)
     assert handler.get_by_id(999) is None
 
+def test_get_by_ids(company_csv_file):
+    handler = CompanyHandler(company_csv_file)
+    companies = handler.get_by_ids([2, 999, 1])
+
+    assert list(companies) == [2, 1]
+    assert all(isinstance(c, Company) for c in companies.values())
+    assert companies[1].company_name == "Acme Corp"
+
 def test_get_company_from_company_name_exists(company_csv_file):
     handler = CompanyHandler(company_csv_file)
     company = handler.get_company_from_company_name("Acme Corp")
@@ -35,3 +35,42 @@ def test_csv_handler_load_all(dummy_csv_file):
     assert result[0].name == "Alice"
     assert result[1].id == 2
     assert result[1].name == "Bob"
+
+
+@pytest.fixture
+def mixed_csv_file(tmp_path: Path) -> Path:
+    path = tmp_path / "mixed.csv"
+    path.write_text(dedent("""\
+        id,name
+        1,Alice
+        oops,Bob
+        3,Cara
+        4,Dan
+    """))
+    return path
+
+
+def test_csv_handler_iter_all_skips_invalid_rows(mixed_csv_file):
+    handler = CsvHandler(mixed_csv_file, DummyModel)
+    result = list(handler.iter_all())
+
+    assert [r.id for r in result] == [1, 3, 4]
+    assert len(handler.errors) == 1
+    assert handler.errors[0].line == 3
+    assert handler.errors[0].row == {"id": "oops", "name": "Bob"}
+
+
+def test_csv_handler_iter_batches(mixed_csv_file):
+    handler = CsvHandler(mixed_csv_file, DummyModel)
+    errors = []
+    batches = list(handler.iter_batches(2, on_error=errors.append))
+
+    assert [[r.id for r in batch] for batch in batches] == [[1, 3], [4]]
+    assert [e.line for e in errors] == [3]
+    assert handler.errors == []
+
+
+def test_csv_handler_iter_batches_rejects_bad_size(dummy_csv_file):
+    handler = CsvHandler(dummy_csv_file, DummyModel)
+    with pytest.raises(ValueError):
+        next(handler.iter_batches(0))
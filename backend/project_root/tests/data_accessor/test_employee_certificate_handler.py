@@ -61,4 +61,22 @@ def test_get_employee_certificates_by_course_id(employee_certificate_csv_file):
 
     assert len(certificates) == 1
     assert certificates[0].certificate_name == "Asbestos Abatement Techniques Certification"
-    
\ No newline at end of file
+    
+def test_indexes_built_once(employee_certificate_csv_file):
+    handler = EmployeeCertificateHandler(employee_certificate_csv_file)
+    index = handler.by_employee_id
+    handler.get_employee_certificates_by_employee_id(2)
+
+    assert handler.by_employee_id is index
+    assert handler.by_course_id is handler.by_course_id
+
+def test_clear_cache_invalidates_indexes(employee_certificate_csv_file):
+    handler = EmployeeCertificateHandler(employee_certificate_csv_file)
+    assert len(handler.get_employee_certificates_by_course_id('c-222')) == 1
+
+    with employee_certificate_csv_file.open('a') as f:
+        f.write("3,c-222,Chainsaw Operation Certification,2023-01-01,2026-01-01\n")
+    handler.clear_cache()
+
+    assert len(handler.get_employee_certificates_by_course_id('c-222')) == 2
+    assert len(handler.get_employee_certificates_by_employee_id(3)) == 1
@@ -40,6 +40,15 @@ def test_get_by_id(employee_csv_file):
     assert employee.email == "jane.smith@example.com"
 
 
+def test_get_by_ids(employee_csv_file):
+    handler = EmployeeHandler(employee_csv_file)
+    employees = handler.get_by_ids([2, 7, 1, 2])
+
+    assert list(employees) == [2, 1]
+    assert employees[2].first_name == "Jane"
+    assert handler.get_by_ids([]) == {}
+
+
 def test_get_employee_company_name(employee_csv_file):
     handler = EmployeeHandler(employee_csv_file)
     company_name = handler.get_employee_company_name("John", "Doe")
@@ -64,3 +73,10 @@ def test_cache_behavior(employee_csv_file, mocker):
     handler.load_all()  # should use cache on second call
 
     assert spy.call_count == 1
+
+
+def test_name_lookup_case_insensitive(employee_csv_file):
+    handler = EmployeeHandler(employee_csv_file)
+
+    assert handler.get_employee_company_name("jane", "SMITH") == "Google"
+    assert handler.get_employee_email("Nobody", "Here") is None
@@ -0,0 +1,98 @@
+import os
+import pytest
+from pathlib import Path
+from textwrap import dedent
+from datetime import date
+
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.company_handler import CompanyHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+from app.data_accessor.legacy_importer import ValidityPeriods, import_legacy_csv
+
+@pytest.fixture
+def legacy_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "legacy.csv"
+    path.write_text(dedent("""\
+        Business Name,Contact Name,Course,Course Date
+        Blue Maple Bakery,James Hernandez,Chainsaw Operation,2022-12-16
+        Blue Oak Ventures,Mark Moore,"Trenching, Excavation & Ground Disturbance",2024-02-29
+        blue maple  bakery,JAMES Hernandez,chainsaw operation,2023-01-10
+        Blue Oak Ventures,Ann Lee,Chainsaw Operation,not a date
+        Blue Oak Ventures,,Chainsaw Operation,2023-01-10
+    """))
+    return path
+
+
+def test_import_normalizes_into_datasets(legacy_csv, tmp_path):
+    out = tmp_path / "out"
+    result = import_legacy_csv(legacy_csv, out, ValidityPeriods(36, {"TRENCHING, Excavation & Ground Disturbance": 12}))
+
+    assert result.rows == {"companies": 2, "employees": 2, "courses": 2, "employee_certificates": 3}
+    assert [e.line for e in result.errors] == [5, 6]
+    companies = CompanyHandler(out / "companies.csv").load_all()
+    assert [(c.company_id, c.company_name) for c in companies] == [(1, "Blue Maple Bakery"), (2, "Blue Oak Ventures")]
+    employees = EmployeeHandler(out / "employees.csv").load_all()
+    assert [(e.employee_id, e.first_name, e.last_name, e.company_name) for e in employees] == [
+        (1, "James", "Hernandez", "Blue Maple Bakery"),
+        (2, "Mark", "Moore", "Blue Oak Ventures"),
+    ]
+    assert employees[0].email == "james.hernandez@blue-maple-bakery.example.com"
+    courses = CourseHandler(out / "courses.csv").load_all()
+    assert [(c.course_id, c.certificate_name) for c in courses] == [
+        ("c-1", "Chainsaw Operation Certification"),
+        ("c-2", "Trenching, Excavation & Ground Disturbance Certification"),
+    ]
+    certs = EmployeeCertificateHandler(out / "employee_certs.csv").load_all()
+    assert [(c.employee_id, c.course_id, c.issue_date, c.expiry_date) for c in certs] == [
+        (1, "c-1", date(2022, 12, 16), date(2025, 12, 16)),
+        (2, "c-2", date(2024, 2, 29), date(2025, 2, 28)),
+        (1, "c-1", date(2023, 1, 10), date(2026, 1, 10)),
+    ]
+    assert not list(out.glob("*.tmp-*"))
+
+
+def test_reimport_keeps_existing_ids(legacy_csv, tmp_path):
+    out = tmp_path / "out"
+    import_legacy_csv(legacy_csv, out)
+    grown = tmp_path / "grown.csv"
+    grown.write_text(dedent("""\
+        Business Name,Contact Name,Course,Course Date
+        New Co,Ann Lee,Infection Control,2024-01-01
+        Blue Oak Ventures,Mark Moore,Chainsaw Operation,2024-01-01
+    """))
+    import_legacy_csv(grown, out)
+
+    employees = {e.first_name: e.employee_id for e in EmployeeHandler(out / "employees.csv").load_all()}
+    assert employees == {"James": 1, "Mark": 2, "Ann": 3}
+    assert [c.course_id for c in CourseHandler(out / "courses.csv").load_all()] == ["c-1", "c-2", "c-3"]
+    assert [(c.employee_id, c.course_id) for c in EmployeeCertificateHandler(out / "employee_certs.csv").load_all()] == [
+        (3, "c-3"), (2, "c-1"),
+    ]
+
+
+def test_missing_columns_leave_outputs_untouched(tmp_path):
+    source = tmp_path / "legacy.csv"
+    source.write_text("Business Name,Contact Name\nAcme,Ann Lee\n")
+
+    with pytest.raises(ValueError):
+        import_legacy_csv(source, tmp_path / "out")
+    assert not list((tmp_path / "out").iterdir())
+
+
+def test_imports_bundled_export(tmp_path):
+    source = Path(__file__).parents[2] / "data" / "business_names_with_contacts_course_with_dates.csv"
+    result = import_legacy_csv(source, tmp_path)
+
+    assert result.errors == []
+    assert result.rows["employee_certificates"] == 100
+
+
+def test_certificates_are_replaced_after_entities(legacy_csv, tmp_path: Path, mocker):
+    replace = mocker.spy(os, "replace")
+
+    import_legacy_csv(legacy_csv, tmp_path / "out")
+
+    assert [Path(call.args[1]).name for call in replace.call_args_list] == [
+        "companies.csv", "employees.csv", "courses.csv", "employee_certs.csv",
+    ]
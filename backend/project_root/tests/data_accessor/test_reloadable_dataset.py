@@ -0,0 +1,92 @@
+import os
+import pytest
+from pathlib import Path
+from textwrap import dedent
+
+from app.data_accessor.csv_handler import CsvHandler
+from app.data_accessor.reloadable_dataset import ReloadableDataset
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+
+NEW_ROW = "3,c-111,Asbestos Abatement Techniques Certification,2023-01-01,2026-01-01\n"
+
+
+@pytest.fixture
+def certs_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "employee_certs.csv"
+    path.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+        2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+    """))
+    return path
+
+
+@pytest.fixture
+def dataset(certs_csv: Path) -> ReloadableDataset[EmployeeCertificateHandler]:
+    return ReloadableDataset(certs_csv, lambda: EmployeeCertificateHandler(certs_csv))
+
+
+def test_unchanged_file_keeps_handler(dataset):
+    handler = dataset.current()
+
+    assert dataset.refresh() is False
+    assert dataset.current() is handler
+    assert dataset.version == 1
+
+
+def test_append_parses_only_new_rows(dataset, certs_csv, mocker):
+    old = dataset.current()
+    assert len(old.load_all()) == 2
+    with certs_csv.open("a") as f:
+        f.write(NEW_ROW)
+
+    full_parse = mocker.spy(CsvHandler, "iter_all")
+    assert dataset.refresh() is True
+    new = dataset.current()
+
+    assert full_parse.call_count == 0
+    assert new is not old
+    assert [c.employee_id for c in new.load_all()] == [1, 2, 3]
+    assert len(new.get_employee_certificates_by_employee_id(3)) == 1
+    # The previous handler is left untouched for in-flight readers
+    assert len(old.load_all()) == 2
+
+
+def test_partial_line_waits_for_writer(dataset, certs_csv):
+    dataset.current()
+    with certs_csv.open("a") as f:
+        f.write(NEW_ROW[:10])
+
+    assert dataset.refresh() is False
+    with certs_csv.open("a") as f:
+        f.write(NEW_ROW[10:])
+
+    assert dataset.refresh() is True
+    assert [c.employee_id for c in dataset.current().load_all()] == [1, 2, 3]
+
+
+def test_rewrite_triggers_full_reload(dataset, certs_csv, mocker):
+    dataset.current()
+    certs_csv.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        9,c-999,Forklift Certification,2024-01-01,2027-01-01
+    """))
+    stat = certs_csv.stat()
+    os.utime(certs_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    full_parse = mocker.spy(CsvHandler, "iter_all")
+    assert dataset.refresh() is True
+
+    assert full_parse.call_count == 1
+    assert [c.employee_id for c in dataset.current().load_all()] == [9]
+
+
+def test_append_writes_rows_without_reparsing(dataset, certs_csv, mocker):
+    new_cert = dataset.current().load_all()[0].model_copy(update={"employee_id": 3})
+    read_rows = mocker.spy(CsvHandler, "_read_rows")
+    handler = dataset.append([new_cert])
+
+    assert [c.employee_id for c in handler.load_all()] == [1, 2, 3]
+    assert certs_csv.read_text().endswith("3,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16\n")
+    assert read_rows.call_count == 0
+    assert dataset.refresh() is False
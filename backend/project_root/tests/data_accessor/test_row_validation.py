@@ -0,0 +1,47 @@
+from pydantic import BaseModel
+
+from app.data_accessor.row_validation import LoadTimer, validate_batch, validate_rows
+
+
+class DummyModel(BaseModel):
+    id: int
+    name: str
+
+
+ROWS = [
+    (2, {"id": "1", "name": "Alice"}),
+    (3, {"id": "oops", "name": "Bob"}),
+    (4, {"id": "3"}),
+    (5, {"id": "4", "name": "Dan"}),
+]
+
+
+def test_validate_batch_reports_each_bad_row():
+    errors = []
+    result = validate_batch(DummyModel, ROWS, errors.append)
+
+    assert [m.id for m in result] == [1, 4]
+    assert [e.line for e in errors] == [3, 4]
+    assert errors[0].message.startswith("id:")
+    assert errors[1].message.startswith("name:")
+
+
+def test_validate_batch_trusted_skips_validation():
+    result = validate_batch(DummyModel, ROWS[:1], lambda e: None, trusted=True)
+
+    assert result[0].id == "1"
+
+
+def test_validate_rows_batches_preserve_order():
+    errors = []
+    result = list(validate_rows(DummyModel, ROWS, errors.append, batch_size=2))
+
+    assert [m.name for m in result] == ["Alice", "Dan"]
+    assert len(errors) == 2
+
+
+def test_load_timer_rows_per_second():
+    stats = LoadTimer("csv").stop(rows=10, errors=1)
+
+    assert stats.rows == 10
+    assert stats.rows_per_second > 0
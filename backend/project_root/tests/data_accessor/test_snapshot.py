@@ -0,0 +1,94 @@
+import os
+import pytest
+from pathlib import Path
+from textwrap import dedent
+from datetime import date
+
+from app.data_accessor.csv_handler import CsvHandler
+from app.data_accessor.snapshot import SnapshotCache
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+
+
+@pytest.fixture
+def certs_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "employee_certs.csv"
+    path.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+        2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19
+        x,c-333,Broken Row,2021-10-19,2025-10-19
+    """))
+    return path
+
+
+@pytest.fixture
+def snapshots(tmp_path: Path) -> SnapshotCache:
+    return SnapshotCache(tmp_path / "snapshots")
+
+
+def test_second_load_uses_snapshot(certs_csv, snapshots, mocker):
+    first = EmployeeCertificateHandler(certs_csv, snapshots).load_all()
+    assert snapshots.snapshot_path(certs_csv, EmployeeCertificateHandler(certs_csv).model).exists()
+
+    spy = mocker.spy(CsvHandler, "iter_all")
+    handler = EmployeeCertificateHandler(certs_csv, snapshots)
+    second = handler.load_all()
+
+    assert spy.call_count == 0
+    assert second == first
+    assert second[1].expiry_date == date(2025, 10, 19)
+    # Row errors from the original parse are replayed
+    assert [e.line for e in handler.errors] == [4]
+
+
+def test_touch_with_same_content_keeps_snapshot(certs_csv, snapshots, mocker):
+    EmployeeCertificateHandler(certs_csv, snapshots).load_all()
+    stat = certs_csv.stat()
+    os.utime(certs_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    spy = mocker.spy(CsvHandler, "iter_all")
+    EmployeeCertificateHandler(certs_csv, snapshots).load_all()
+
+    assert spy.call_count == 0
+
+
+def test_failed_snapshot_refresh_does_not_break_load(certs_csv, snapshots, mocker):
+    first = EmployeeCertificateHandler(certs_csv, snapshots).load_all()
+    stat = certs_csv.stat()
+    os.utime(certs_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    mocker.patch.object(SnapshotCache, "_write", side_effect=OSError("read-only file system"))
+
+    assert EmployeeCertificateHandler(certs_csv, snapshots).load_all() == first
+
+
+def test_changed_source_falls_back_to_csv(certs_csv, snapshots):
+    EmployeeCertificateHandler(certs_csv, snapshots).load_all()
+    with certs_csv.open("a") as f:
+        f.write("3,c-111,Asbestos Abatement Techniques Certification,2023-01-01,2026-01-01\n")
+
+    certificates = EmployeeCertificateHandler(certs_csv, snapshots).load_all()
+
+    assert [c.employee_id for c in certificates] == [1, 2, 3]
+
+
+def test_corrupt_snapshot_is_ignored(certs_csv, snapshots):
+    handler = EmployeeCertificateHandler(certs_csv, snapshots)
+    path = snapshots.snapshot_path(certs_csv, handler.model)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a pickle")
+
+    assert len(handler.load_all()) == 2
+
+
+def test_trusted_snapshot_skips_validation(certs_csv, tmp_path, mocker):
+    EmployeeCertificateHandler(certs_csv, SnapshotCache(tmp_path / "snapshots")).load_all()
+
+    construct = mocker.spy(EmployeeCertificateHandler(certs_csv).model, "model_construct")
+    handler = EmployeeCertificateHandler(certs_csv, SnapshotCache(tmp_path / "snapshots", trusted=True))
+    certificates = handler.load_records()
+
+    assert construct.call_count == 2
+    assert certificates[0].expiry_date == date(2025, 12, 16)
+    assert handler.last_load_stats is not None
+    assert handler.last_load_stats.source == "snapshot"
+    assert handler.last_load_stats.trusted is True
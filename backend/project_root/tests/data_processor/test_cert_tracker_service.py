@@ -0,0 +1,62 @@
+from datetime import date
+
+
+def test_get_expiring_certificates_sorted(service):
+    result = service.get_expiring_certificates(date(2025, 10, 1), date(2025, 11, 30))
+
+    assert [(c.employee_id, c.expiry_date) for c in result] == [
+        (2, date(2025, 10, 19)),
+        (1, date(2025, 11, 1)),
+    ]
+
+
+def test_get_expiring_certificates_open_ended(service):
+    assert len(service.get_expiring_certificates(date(2025, 11, 1), None)) == 2
+    assert len(service.get_expiring_certificates(None, None)) == 3
+
+
+def test_get_next_expiring_certificates(service):
+    result = service.get_next_expiring_certificates(1, after=date(2025, 10, 20))
+
+    assert len(result) == 1
+    assert result[0].expiry_date == date(2025, 11, 1)
+
+
+def test_get_expiry_summary(service):
+    summary = service.get_expiry_summary(date(2025, 10, 1), date(2025, 12, 31))
+
+    assert summary.total == 3
+    assert summary.by_course_id == {"c-111": 1, "c-222": 2}
+    assert summary.by_company == {"Google": 1, "OpenAI": 2}
+    assert summary.by_month == {"2025-10": 1, "2025-11": 1, "2025-12": 1}
+
+
+def test_get_expiry_summary_selected_groupings(service):
+    summary = service.get_expiry_summary(date(2025, 11, 1), None, group_by=["month"])
+
+    assert summary.total == 2
+    assert summary.by_month == {"2025-11": 1, "2025-12": 1}
+    assert summary.by_course_id is None
+
+
+def test_enriched_certificates_join_employee_and_course(service):
+    certs, next_key = service.page_enriched_expiring_certificates(None, None)
+
+    assert next_key is None
+    assert [(c.employee_id, c.first_name, c.company_name, c.course_name) for c in certs] == [
+        (2, "Jane", "Google", "Chainsaw Operation"),
+        (1, "John", "OpenAI", "Chainsaw Operation"),
+        (1, "John", "OpenAI", "Asbestos Abatement Techniques"),
+    ]
+    assert [c.expiry_date for c in certs] == [c.expiry_date for c in service.get_expiring_certificates(None, None)]
+
+
+def test_pages_keep_duplicate_certificates(service):
+    duplicated = service.with_certificates(service.get_expiring_certificates(None, None))
+
+    certs, cursor = duplicated.page_expiring_certificates(None, None, 1)
+    while cursor is not None:
+        page, cursor = duplicated.page_expiring_certificates(None, None, 1, cursor)
+        certs += page
+    assert len(certs) == 6
+    assert certs == sorted(certs, key=lambda c: (c.expiry_date, c.employee_id, c.course_id))
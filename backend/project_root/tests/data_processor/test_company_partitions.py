@@ -0,0 +1,54 @@
+from datetime import date
+
+from app.data_models.employee import Employee
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.certificate_record import CertificateRecord
+from app.data_processor.company_partitions import CompanyPartitions
+from app.data_accessor.indexes.multi_value_index import MultiValueIndex
+
+
+def employee(employee_id: int, company: str) -> Employee:
+    return Employee(
+        employee_id=employee_id, first_name="F", last_name="L", company_name=company,
+        department="Ops", email=f"e{employee_id}@example.com",
+    )
+
+
+def cert(employee_id: int, expiry: date, row_id: int = 0) -> CertificateRecord:
+    return CertificateRecord.of(EmployeeCertificate(
+        employee_id=employee_id, course_id="c-1", certificate_name="Cert",
+        issue_date=date(2020, 1, 1), expiry_date=expiry,
+    ), row_id)
+
+
+def build(max_indexed_rows: int) -> CompanyPartitions:
+    employees = [employee(1, "Acme"), employee(2, "Acme"), employee(3, "Initech"), employee(4, "Hooli")]
+    certs = [
+        cert(1, date(2025, 3, 1), 0), cert(2, date(2025, 1, 1), 1), cert(3, date(2025, 2, 1), 2),
+        cert(3, date(2025, 4, 1), 3), cert(4, date(2025, 5, 1), 4),
+    ]
+    return CompanyPartitions(employees, MultiValueIndex(certs, lambda c: c.employee_id), max_indexed_rows)
+
+
+def test_partition_contains_only_company_rows():
+    partitions = build(max_indexed_rows=100)
+    acme = partitions.get("acme")
+
+    assert [c.employee_id for c in acme.range()] == [2, 1]
+    assert "ACME" in partitions
+    assert "Globex" not in partitions
+    assert len(partitions.get("Globex")) == 0
+
+
+def test_partitions_are_cached_and_evicted_lru():
+    partitions = build(max_indexed_rows=3)
+    acme = partitions.get("Acme")
+    assert partitions.get("Acme") is acme
+
+    partitions.get("Initech")
+    assert partitions.resident_companies() == ["initech"]
+    assert partitions.indexed_rows == 2
+
+    partitions.get("Hooli")
+    assert partitions.resident_companies() == ["initech", "hooli"]
+    assert partitions.indexed_rows == 3
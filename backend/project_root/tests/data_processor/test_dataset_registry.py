@@ -0,0 +1,149 @@
+import pytest
+from pathlib import Path
+from textwrap import dedent
+from datetime import date
+from typing import Iterator, List
+
+from app.data_models.course import Course
+from app.data_models.employee_certificate import EmployeeCertificate
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_accessor.reloadable_dataset import ReloadableDataset
+from app.data_processor.dataset_registry import DatasetRegistry
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+
+
+def build_registry(tmp_path: Path) -> DatasetRegistry:
+    certs = tmp_path / "employee_certs.csv"
+    certs.write_text(dedent("""\
+        employee_id,course_id,certificate_name,issue_date,expiry_date
+        1,c-111,Asbestos Abatement Techniques Certification,2022-12-16,2025-12-16
+    """))
+    courses = tmp_path / "courses.csv"
+    courses.write_text("course_id,course_name,certificate_name\n")
+    employees = tmp_path / "employees.csv"
+    employees.write_text("employee_id,first_name,last_name,company_name,department,email\n")
+    return DatasetRegistry(
+        ReloadableDataset(certs, lambda: EmployeeCertificateHandler(certs)),
+        ReloadableDataset(courses, lambda: CourseHandler(courses, Course)),
+        ReloadableDataset(employees, lambda: EmployeeHandler(employees)),
+    )
+
+
+def test_refresh_swaps_service_on_change(tmp_path: Path):
+    registry = build_registry(tmp_path)
+    service = registry.service()
+    assert registry.refresh() is False
+    assert registry.service() is service
+
+    with (tmp_path / "employee_certs.csv").open("a") as f:
+        f.write("2,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19\n")
+
+    assert registry.refresh() is True
+    new_service = registry.service()
+    assert new_service is not service
+    assert len(new_service.get_expiring_certificates(date(2025, 1, 1), date(2025, 12, 31))) == 2
+    assert len(service.get_expiring_certificates(date(2025, 1, 1), date(2025, 12, 31))) == 1
+
+
+def test_warm_up_reports_status(tmp_path: Path):
+    registry = build_registry(tmp_path)
+    assert registry.status()["ready"] is False
+    assert registry.status()["steps"]["courses"]["state"] == "pending"
+
+    registry.warm_up()
+    status = registry.status()
+
+    assert status["ready"] is True
+    assert status["version"] == registry.service().version
+    for step in ("employee_certs", "courses", "employees", "service"):
+        assert status["steps"][step]["state"] == "ready"
+        assert status["steps"][step]["seconds"] >= 0
+
+
+def test_warm_up_failure_is_reported(tmp_path: Path):
+    registry = build_registry(tmp_path)
+    (tmp_path / "courses.csv").unlink()
+
+    try:
+        registry.warm_up()
+    except FileNotFoundError:
+        pass
+
+    status = registry.status()
+    assert status["ready"] is False
+    assert status["steps"]["courses"]["state"] == "failed"
+    assert "FileNotFoundError" in status["steps"]["courses"]["error"]
+
+
+def test_append_certificates_merges_into_live_service(tmp_path: Path):
+    registry = build_registry(tmp_path)
+    service = registry.service()
+    cert = service.employee_certs[0].to_model().model_copy(update={"employee_id": 2, "expiry_date": date(2025, 10, 1)})
+
+    registry.append_certificates([cert])
+    merged = registry.service()
+
+    assert merged.version != service.version
+    assert [c.employee_id for c in merged.get_expiring_certificates(None, None)] == [2, 1]
+    summary = merged.get_expiry_summary(None, None)
+    assert summary.by_month == {"2025-10": 1, "2025-12": 1}
+    assert summary.by_company == {"unknown": 2}
+    # The appended row is on disk, so a full reload agrees with the merged service
+    reloaded = EmployeeCertificateHandler(tmp_path / "employee_certs.csv").load_all()
+    assert sorted(reloaded, key=lambda c: c.expiry_date) == merged.get_expiring_certificates(None, None)
+    assert len(service.get_expiring_certificates(None, None)) == 1
+    assert registry.refresh() is False
+
+
+def test_listeners_see_appended_certificates(tmp_path: Path):
+    registry = build_registry(tmp_path)
+    service = registry.service()
+    added: List[List[EmployeeCertificate]] = []
+    registry.on_certificates_added(lambda certs: added.append(list(certs)))
+    cert = service.employee_certs[0].to_model().model_copy(update={"employee_id": 2})
+
+    registry.append_certificates([cert])
+    with (tmp_path / "employee_certs.csv").open("a") as f:
+        f.write("3,c-222,Chainsaw Operation Certification,2021-10-19,2025-10-19\n")
+    registry.refresh()
+
+    assert [[c.employee_id for c in batch] for batch in added] == [[2], [3]]
+
+
+def test_batches_are_staged_one_at_a_time_and_applied_once(tmp_path: Path):
+    registry = build_registry(tmp_path)
+    service = registry.service()
+    certs_csv = tmp_path / "employee_certs.csv"
+    original = certs_csv.read_text()
+    template = service.employee_certs[0].to_model()
+    staged_lines = []
+
+    def batches() -> Iterator[List[EmployeeCertificate]]:
+        for employee_id in range(2, 6):
+            # The previous batch is on disk in the staging file, not in memory
+            staged_lines.append(len(list(tmp_path.glob("employee_certs.staged-*"))[0].read_text().splitlines()))
+            assert certs_csv.read_text() == original
+            yield [template.model_copy(update={"employee_id": employee_id})] * 2
+
+    assert registry.append_certificate_batches(batches()) == 4
+    assert staged_lines == [1, 2, 3, 4]
+    assert not list(tmp_path.glob("employee_certs.staged-*"))
+    assert [c.employee_id for c in registry.service().employee_certs] == [1, 2, 3, 4, 5]
+
+
+def test_failed_batch_applies_nothing(tmp_path: Path):
+    registry = build_registry(tmp_path)
+    service = registry.service()
+    original = (tmp_path / "employee_certs.csv").read_text()
+
+    def batches() -> Iterator[List[EmployeeCertificate]]:
+        yield [service.employee_certs[0].to_model().model_copy(update={"employee_id": 2})]
+        raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        registry.append_certificate_batches(batches())
+
+    assert (tmp_path / "employee_certs.csv").read_text() == original
+    assert registry.service() is service
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["courses.csv", "employee_certs.csv", "employees.csv"]
@@ -0,0 +1,38 @@
+from datetime import date
+
+from app.data_processor.expiry_aggregates import ExpiryHistogram
+
+
+def build() -> ExpiryHistogram:
+    return ExpiryHistogram([
+        ("a", date(2025, 1, 10)),
+        ("a", date(2025, 1, 10)),
+        ("a", date(2025, 3, 1)),
+        ("b", date(2025, 2, 15)),
+        ("b", date(2026, 1, 1)),
+    ])
+
+
+def test_counts_in_range():
+    histogram = build()
+
+    assert histogram.counts(date(2025, 1, 1), date(2025, 2, 28)) == {"a": 2, "b": 1}
+    assert histogram.counts(date(2025, 1, 11), date(2025, 3, 1)) == {"a": 1, "b": 1}
+
+
+def test_counts_open_ended_and_empty():
+    histogram = build()
+
+    assert histogram.counts(None, None) == {"a": 3, "b": 2}
+    assert histogram.counts(date(2025, 12, 1), None) == {"b": 1}
+    assert histogram.counts(date(2030, 1, 1), date(2030, 12, 31)) == {}
+    assert histogram.groups() == ["a", "b"]
+
+
+def test_extended_matches_full_build():
+    histogram = build()
+    extended = histogram.extended([("a", date(2025, 1, 10)), ("c", date(2025, 5, 1))])
+
+    assert extended.counts(None, None) == {"a": 4, "b": 2, "c": 1}
+    assert extended.counts(date(2025, 1, 1), date(2025, 1, 31)) == {"a": 3}
+    assert histogram.counts(None, None) == {"a": 3, "b": 2}
@@ -0,0 +1,77 @@
+import pytest
+from pathlib import Path
+from datetime import date
+
+from app.data_processor.reminder_scheduler import ReminderScheduler
+
+
+def crossings(reminders):
+    return [(r.threshold_days, r.certificate.employee_id, r.certificate.expiry_date) for r in reminders]
+
+
+def test_first_tick_emits_todays_crossings(service, tmp_path: Path):
+    scheduler = ReminderScheduler(lambda: service, tmp_path / "cursor.json")
+
+    assert crossings(scheduler.tick(date(2025, 7, 21))) == [(90, 2, date(2025, 10, 19))]
+    assert scheduler.tick(date(2025, 7, 21)) == []
+    assert scheduler.last_run() == date(2025, 7, 21)
+
+
+def test_cursor_survives_restart_and_catches_up(service, tmp_path: Path):
+    cursor = tmp_path / "cursor.json"
+    ReminderScheduler(lambda: service, cursor).tick(date(2025, 7, 21))
+    restarted = ReminderScheduler(lambda: service, cursor)
+
+    assert restarted.tick(date(2025, 7, 21)) == []
+    reminders = restarted.tick(date(2025, 9, 20))
+    assert crossings(reminders) == [
+        (90, 1, date(2025, 11, 1)),
+        (90, 1, date(2025, 12, 16)),
+        (60, 2, date(2025, 10, 19)),
+        (60, 1, date(2025, 11, 1)),
+        (30, 2, date(2025, 10, 19)),
+    ]
+    assert reminders[0].due == date(2025, 8, 3)
+
+
+def test_due_does_not_advance_cursor(service, tmp_path: Path):
+    scheduler = ReminderScheduler(lambda: service, tmp_path / "cursor.json", thresholds=[0])
+
+    assert crossings(scheduler.due(date(2025, 10, 19))) == [(0, 2, date(2025, 10, 19))]
+    assert scheduler.last_run() is None
+    with pytest.raises(ValueError):
+        ReminderScheduler(lambda: service, tmp_path / "cursor.json", thresholds=[-1])
+
+
+def test_certificate_added_after_its_crossing_is_queued(service, tmp_path: Path):
+    scheduler = ReminderScheduler(lambda: service, tmp_path / "cursor.json")
+    scheduler.tick(date(2025, 7, 20))
+    scheduler.tick(date(2025, 7, 21))
+    late = service.employee_certs[0].to_model().model_copy(update={"employee_id": 3, "expiry_date": date(2025, 10, 18)})
+    # Crossed 90 days before the first run: not owed
+    early = late.model_copy(update={"employee_id": 4, "expiry_date": date(2025, 10, 15)})
+
+    assert scheduler.enqueue([late, early]) == 1
+    assert crossings(scheduler.due(date(2025, 7, 21))) == [(90, 3, date(2025, 10, 18))]
+    assert crossings(scheduler.tick(date(2025, 7, 22))) == [(90, 3, date(2025, 10, 18))]
+    assert scheduler.tick(date(2025, 7, 23)) == []
+
+
+def test_tick_queries_only_the_crossed_window(service, tmp_path: Path, mocker):
+    scheduler = ReminderScheduler(lambda: service, tmp_path / "cursor.json", thresholds=[30])
+    scheduler.tick(date(2025, 9, 1))
+    spy = mocker.spy(service, "iter_expiring_certificates")
+
+    scheduler.tick(date(2025, 9, 3))
+
+    spy.assert_called_once_with(date(2025, 10, 2), date(2025, 10, 3))
+
+
+def test_unreadable_cursor_is_replaced(service, tmp_path: Path):
+    cursor = tmp_path / "cursor.json"
+    cursor.write_text("{not json")
+    scheduler = ReminderScheduler(lambda: service, cursor)
+
+    assert scheduler.last_run() is None
+    assert crossings(scheduler.tick(date(2025, 7, 21))) == [(90, 2, date(2025, 10, 19))]
+    assert scheduler.last_run() == date(2025, 7, 21)
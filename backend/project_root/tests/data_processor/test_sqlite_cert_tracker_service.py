@@ -0,0 +1,92 @@
+import pytest
+from pathlib import Path
+from datetime import date
+
+from app.data_models.course import Course
+from app.data_accessor.course_handler import CourseHandler
+from app.data_accessor.employee_handler import EmployeeHandler
+from app.data_accessor.sqlite.database import SqliteDatabase
+from app.data_accessor.sqlite.importer import import_csvs
+from app.data_processor.sqlite_registry import SqliteRegistry
+from app.data_processor.cert_tracker_service import CertTrackerService
+from app.data_processor.sqlite_cert_tracker_service import SqliteCertTrackerService
+from app.data_accessor.employee_certificate_handler import EmployeeCertificateHandler
+from tests.data_accessor.sqlite.test_sqlite_handlers import write_datasets
+
+
+@pytest.fixture
+def services(tmp_path: Path):
+    write_datasets(tmp_path)
+    database = SqliteDatabase(tmp_path / "cert_tracker.db")
+    import_csvs(tmp_path, database)
+    in_memory = CertTrackerService(
+        EmployeeCertificateHandler(tmp_path / "employee_certs.csv"),
+        CourseHandler(tmp_path / "courses.csv", Course),
+        EmployeeHandler(tmp_path / "employees.csv"),
+    )
+    yield in_memory, SqliteCertTrackerService(database)
+    database.close()
+
+
+def test_matches_in_memory_service(services):
+    in_memory, sqlite = services
+    start, end = date(2025, 10, 1), date(2025, 11, 30)
+
+    assert sqlite.get_expiring_certificates(start, end) == in_memory.get_expiring_certificates(start, end)
+    assert sqlite.page_expiring_certificates(None, None, 2) == in_memory.page_expiring_certificates(None, None, 2)
+    assert sqlite.get_expiry_summary(None, None) == in_memory.get_expiry_summary(None, None)
+    assert sqlite.get_next_expiring_certificates(2, date(2025, 10, 20)) == in_memory.get_next_expiring_certificates(2, date(2025, 10, 20))
+    assert sqlite.page_company_expiring_certificates("openai", None, None) == in_memory.page_company_expiring_certificates("openai", None, None)
+    assert sqlite.page_enriched_expiring_certificates(None, None, 3) == in_memory.page_enriched_expiring_certificates(None, None, 3)
+    assert sqlite.page_enriched_expiring_certificates(start, None) == in_memory.page_enriched_expiring_certificates(start, None)
+    assert sqlite.has_company("Acme") and not sqlite.has_company("Initech")
+    assert sqlite.search_names("jo") == in_memory.search_names("jo")
+    assert sqlite.search_names("chainsw") == in_memory.search_names("chainsw")
+
+
+def test_registry_swaps_service_after_reimport(tmp_path: Path):
+    write_datasets(tmp_path)
+    database = SqliteDatabase(tmp_path / "cert_tracker.db")
+    import_csvs(tmp_path, database)
+    registry = SqliteRegistry(database)
+    registry.warm_up()
+    service = registry.service()
+
+    assert registry.refresh() is False
+    import_csvs(tmp_path, database)
+    assert registry.refresh() is True
+    assert registry.service().version != service.version
+    registry.stop()
+
+
+def test_registry_appends_certificates(tmp_path: Path):
+    write_datasets(tmp_path)
+    database = SqliteDatabase(tmp_path / "cert_tracker.db")
+    import_csvs(tmp_path, database)
+    registry = SqliteRegistry(database)
+    service = registry.service()
+    cert = service.get_expiring_certificates(None, None)[0].model_copy(update={"employee_id": 9})
+
+    registry.append_certificates([cert])
+
+    assert registry.service().version != service.version
+    assert registry.service().employee_certs.get_by_id(4) == cert
+    registry.stop()
+
+def test_registry_skips_certificates_already_on_file(tmp_path: Path):
+    write_datasets(tmp_path)
+    database = SqliteDatabase(tmp_path / "cert_tracker.db")
+    import_csvs(tmp_path, database)
+    registry = SqliteRegistry(database)
+    service = registry.service()
+    existing = service.get_expiring_certificates(None, None)[0]
+    new = existing.model_copy(update={"employee_id": 9})
+    before = service.employee_certs.count(None, None)
+
+    assert registry.append_certificates([existing, new, new]) == 1
+    assert registry.service().employee_certs.count(None, None) == before + 1
+    assert registry.append_certificates([new]) == 0
+    assert registry.append_certificate_batches([[existing], [new.model_copy(update={"employee_id": 10})], [new]]) == 1
+    assert registry.service().employee_certs.count(None, None) == before + 2
+    assert database.execute("SELECT count(*) FROM sqlite_temp_master")[0][0] == 0
+    registry.stop()
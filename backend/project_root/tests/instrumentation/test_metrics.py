@@ -0,0 +1,65 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.metrics_api import router
+from app.instrumentation.middleware import MetricsMiddleware
+from app.instrumentation.metrics import (
+    HTTP_REQUEST_SECONDS, Counter, Gauge, Histogram, MetricsRegistry, QUERY_SECONDS, timed_query,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("demo_seconds", "Demo.", ("kind",), buckets=(0.1, 1.0)))
+    histogram.observe(0.05, kind="a")
+    histogram.observe(0.5, kind="a")
+    histogram.observe(5, kind="a")
+
+    text = registry.render()
+
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{kind="a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{kind="a",le="1"} 2' in text
+    assert 'demo_seconds_bucket{kind="a",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{kind="a"} 3' in text
+
+
+def test_counter_and_gauge():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("demo_total", "Demo.", ("name",)))
+    gauge = registry.register(Gauge("demo_rows", "Demo."))
+    counter.inc(name='a"b')
+    counter.inc(2, name='a"b')
+    gauge.set(42)
+
+    text = registry.render()
+
+    assert 'demo_total{name="a\\"b"} 3' in text
+    assert "demo_rows 42" in text
+
+
+def test_middleware_adds_server_timing_and_records_latency():
+    @timed_query
+    def lookup() -> int:
+        return 1
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(router)
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int) -> dict:
+        return {"value": lookup()}
+
+    client = TestClient(app)
+    before = HTTP_REQUEST_SECONDS.count(method="GET", route="/items/{item_id}", status="200")
+    response = client.get("/items/7")
+
+    assert response.headers["Server-Timing"].startswith("lookup;dur=")
+    assert "total;dur=" in response.headers["Server-Timing"]
+    assert HTTP_REQUEST_SECONDS.count(method="GET", route="/items/{item_id}", status="200") == before + 1
+    assert QUERY_SECONDS.count(method="lookup") >= 1
+
+    metrics = client.get("/metrics")
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert "cert_tracker_http_request_seconds_bucket" in metrics.text